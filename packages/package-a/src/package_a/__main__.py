@@ -1,20 +1,49 @@
 """Main entry point for package-a executable."""
 
 import sys
-from pathlib import Path
+from typing import List, Optional
 
-try:
-    from colorama import Fore, Style, init
-except ImportError as e:
-    print(f"ERROR: Required dependency 'colorama' not found: {e}", file=sys.stderr)
-    print("Please install with: pip install colorama>=0.4.6", file=sys.stderr)
-    sys.exit(1)
+# Everything else is imported inside the functions that need it, so the
+# frozen binary only unpacks and imports what a given invocation uses.
 
-from package_a.logger import setup_logger
 
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Main function for package-a CLI.
+
+    Args:
+        argv: Command line arguments (default: sys.argv[1:])
+
+    Options:
+        --startup-profile: Print an ``-X importtime``-style breakdown of the
+            imports performed by this run to stderr
+    """
+    args = sys.argv[1:] if argv is None else argv
+
+    profiler = None
+    if "--startup-profile" in args:
+        from package_a.profiling import ImportProfiler
+
+        profiler = ImportProfiler()
+        profiler.install()
+
+    try:
+        _run_demo()
+    finally:
+        if profiler is not None:
+            profiler.uninstall()
+            profiler.report(sys.stderr)
+
+
+def _run_demo() -> None:
+    """Display the banner and exercise the logger."""
+    try:
+        from colorama import Fore, Style, init
+    except ImportError as e:
+        print(f"ERROR: Required dependency 'colorama' not found: {e}", file=sys.stderr)
+        print("Please install with: pip install colorama>=0.4.6", file=sys.stderr)
+        sys.exit(1)
 
-def main():
-    """Main function for package-a CLI."""
     # Initialize colorama
     init(autoreset=True)
 
@@ -26,6 +55,9 @@ def main():
     # Test logger functionality
     try:
         import logging
+        from pathlib import Path
+
+        from package_a.logger import setup_logger
 
         logger = setup_logger("demo", level=logging.INFO)
 
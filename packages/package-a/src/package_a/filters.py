@@ -0,0 +1,185 @@
+"""Log record filters for package-a."""
+
+import heapq
+import logging
+import random
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+# Rate limit key: (logger name, level, message template)
+_Key = Tuple[str, int, Any]
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Token-bucket rate limit per (logger, level, message template).
+
+    Each distinct key may log ``burst`` records at once and then ``rate``
+    records per second. Suppressed records are counted, and the next record
+    let through for that key carries the count: `` [suppressed N duplicates]``
+    is appended to its message and ``record.suppressed`` is set.
+
+    If no such record comes, because the flood stopped or the key was
+    evicted, the count is reported in a summary record of its own, logged
+    through the key's logger once a token would have been available (on the
+    next record of any key), on eviction, or when ``flush()`` is called.
+
+    The check is O(log n) in the keys with suppressed records, O(1) for the
+    rest. At most ``max_keys`` buckets are kept; the least recently used key
+    is evicted when the limit is reached.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 10,
+        max_keys: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__()
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.rate = rate
+        self.burst = burst
+        self.max_keys = max_keys
+        self._clock = clock
+        # key -> [tokens, last refill time, suppressed count, summary due time]
+        self._buckets: "OrderedDict[_Key, List[Any]]" = OrderedDict()
+        # (summary due time, sequence, key) for keys with suppressed records
+        self._due: List[Tuple[float, int, _Key]] = []
+        self._sequence = 0
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Return True if the record is within its key's rate limit."""
+        if record.__dict__.get("rate_limit_summary"):
+            return True
+        template = record.msg if isinstance(record.msg, str) else str(record.msg)
+        key = (record.name, record.levelno, template)
+        now = self._clock()
+        summaries: List[Tuple[_Key, int]] = []
+
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                self._buckets[key] = [self.burst - 1, now, 0, 0.0]
+                if len(self._buckets) > self.max_keys:
+                    evicted, old = self._buckets.popitem(last=False)
+                    if old[2]:
+                        summaries.append((evicted, old[2]))
+                allowed, suppressed = True, 0
+            else:
+                self._buckets.move_to_end(key)
+                tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+                bucket[1] = now
+                if tokens < 1:
+                    bucket[0] = tokens
+                    if not bucket[2]:
+                        # Tokens keep refilling while records are suppressed,
+                        # so the first suppression fixes when one is available
+                        bucket[3] = now + (1 - tokens) / self.rate
+                        self._sequence += 1
+                        heapq.heappush(self._due, (bucket[3], self._sequence, key))
+                    bucket[2] += 1
+                    allowed, suppressed = False, 0
+                else:
+                    bucket[0] = tokens - 1
+                    allowed, suppressed = True, bucket[2]
+                    bucket[2] = 0
+            # After this key, so a count carried by this record is not repeated
+            if self._due and self._due[0][0] <= now:
+                self._collect_due(now, summaries)
+
+        # Logged outside the lock; summaries pass straight through filter()
+        for summary_key, count in summaries:
+            self._log_summary(summary_key, count)
+        if suppressed:
+            record.msg = f"{template} [suppressed {suppressed} duplicates]"
+            setattr(record, "suppressed", suppressed)
+        return allowed
+
+    def flush(self) -> None:
+        """Log a summary for every key that has suppressed records."""
+        summaries: List[Tuple[_Key, int]] = []
+        with self._lock:
+            self._collect_due(float("inf"), summaries)
+        for key, count in summaries:
+            self._log_summary(key, count)
+
+    def _collect_due(self, now: float, summaries: List[Tuple[_Key, int]]) -> None:
+        while self._due and self._due[0][0] <= now:
+            due, _, key = heapq.heappop(self._due)
+            bucket = self._buckets.get(key)
+            # Skip keys already reported, evicted or suppressed again since
+            if bucket is not None and bucket[2] and bucket[3] == due:
+                summaries.append((key, bucket[2]))
+                bucket[2] = 0
+
+    def _log_summary(self, key: _Key, count: int) -> None:
+        name, level, template = key
+        logger = logging.getLogger(name)
+        record = logger.makeRecord(
+            name,
+            level,
+            "(rate limit)",
+            0,
+            "%s [suppressed %d duplicates]",
+            (template, count),
+            None,
+            extra={"suppressed": count, "rate_limit_summary": True},
+        )
+        logger.handle(record)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep only a fraction of the records at selected levels.
+
+    ``rates`` maps a level to the fraction of its records to keep; levels
+    not listed are always kept. Records carrying the ``key_attr`` attribute
+    (e.g. ``extra={"trace_id": ...}``) are sampled deterministically by a
+    hash of that value, so a trace is kept or dropped as a whole and a
+    trace kept at a lower rate is also kept at every higher rate. Other
+    records are sampled at random.
+
+    The decision only reads ``levelno`` and the key attribute, so the
+    message is never %-interpolated for dropped records.
+    """
+
+    def __init__(
+        self,
+        rates: Mapping[int, float],
+        key_attr: Optional[str] = "trace_id",
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        super().__init__()
+        for level, rate in rates.items():
+            if not 0 <= rate <= 1:
+                raise ValueError(f"Sample rate for level {level} must be between 0 and 1")
+        self.rates = dict(rates)
+        self.key_attr = key_attr
+        self._rng = rng
+        # Rates scaled to the 32-bit hash range
+        self._thresholds: Dict[int, int] = {
+            level: int(rate * 0x100000000) for level, rate in rates.items()
+        }
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Return True if the record is sampled in."""
+        threshold = self._thresholds.get(record.levelno)
+        if threshold is None or threshold >= 0x100000000:
+            return True
+        if threshold == 0:
+            return False
+
+        if self.key_attr is not None:
+            key = record.__dict__.get(self.key_attr)
+            if key is not None:
+                return zlib.crc32(str(key).encode()) < threshold
+
+        return self._rng() * 0x100000000 < threshold
@@ -0,0 +1,138 @@
+"""Log record formatters for package-a."""
+
+import logging
+import time
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+TIME_FORMATS = ("local", "iso", "epoch_ns")
+
+# Attributes every LogRecord carries; anything else was passed via ``extra=``
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None)))
+_RESERVED_ATTRS = _RECORD_ATTRS | {"message", "asctime"}
+_RECORD_ATTR_COUNT = len(_RECORD_ATTRS)
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that renders each second's timestamp prefix only once.
+
+    ``time.strftime`` runs only when a record falls in a new second; records
+    within the same second reuse the cached prefix and only append their
+    millisecond suffix.
+
+    Time formats:
+        local: Local time as ``2024-01-31 12:00:00,123`` (same as logging.Formatter)
+        iso: ISO-8601 UTC time as ``2024-01-31T12:00:00.123Z``
+        epoch_ns: Integer nanoseconds since the Unix epoch
+    """
+
+    def __init__(
+        self,
+        fmt: Optional[str] = None,
+        datefmt: Optional[str] = None,
+        time_format: str = "local",
+    ) -> None:
+        if time_format not in TIME_FORMATS:
+            raise ValueError(f"Unknown time format {time_format!r}, expected one of {TIME_FORMATS}")
+        super().__init__(fmt, datefmt)
+        self.time_format = time_format
+        self._cached_second: Tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """Return the record's timestamp, reusing the cached per-second prefix."""
+        if self.time_format == "epoch_ns":
+            return str(getattr(record, "created_ns", None) or int(record.created * 1e9))
+
+        second = int(record.created)
+        cached_second, prefix = self._cached_second
+        if second != cached_second:
+            if self.time_format == "iso":
+                prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            else:
+                prefix = time.strftime(datefmt or self.default_time_format, self.converter(second))
+            self._cached_second = (second, prefix)
+
+        if self.time_format == "iso":
+            return f"{prefix}.{int(record.msecs):03d}Z"
+        if datefmt:
+            return prefix
+        return f"{prefix},{int(record.msecs):03d}"
+
+
+class JsonFormatter(CachedTimeFormatter):
+    """
+    Format records as single-line JSON objects (NDJSON).
+
+    Keys are always emitted in the same order: ``time``, ``level``,
+    ``logger``, ``message``, then ``exc_info``/``stack_info`` when present,
+    the formatter's static fields and finally any ``extra=`` fields. The
+    encoded level and logger fragments and the static fields are rendered
+    once and reused, so a record is serialised by joining a few strings
+    rather than building and dumping a dict. Timestamps default to ISO-8601
+    UTC.
+    """
+
+    def __init__(
+        self,
+        static_fields: Optional[Mapping[str, Any]] = None,
+        datefmt: Optional[str] = None,
+        time_format: str = "iso",
+    ) -> None:
+        # json is imported here, once, so text-only logging does not load it
+        import json
+        from json.encoder import encode_basestring_ascii
+
+        super().__init__(datefmt=datefmt, time_format=time_format)
+        self._quote = encode_basestring_ascii
+        self._dumps = json.JSONEncoder(default=str).encode
+        self.static_fields = dict(static_fields or {})
+        self._static = "".join(
+            f",{encode_basestring_ascii(key)}:{self._encode_value(value)}"
+            for key, value in self.static_fields.items()
+        )
+        self._level_cache: Dict[str, str] = {}
+        self._name_cache: Dict[str, str] = {}
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Serialise a record to a JSON object string."""
+        quote = self._quote
+        level = self._level_cache.get(record.levelname)
+        if level is None:
+            level = self._level_cache[record.levelname] = f',"level":{quote(record.levelname)}'
+        name = self._name_cache.get(record.name)
+        if name is None:
+            name = self._name_cache[record.name] = f',"logger":{quote(record.name)}'
+
+        parts = [
+            '{"time":',
+            quote(self.formatTime(record, self.datefmt)),
+            level,
+            name,
+            ',"message":',
+            quote(record.getMessage()),
+        ]
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            parts.append(',"exc_info":')
+            parts.append(quote(record.exc_text))
+        if record.stack_info:
+            parts.append(',"stack_info":')
+            parts.append(quote(self.formatStack(record.stack_info)))
+
+        parts.append(self._static)
+
+        attrs = record.__dict__
+        if len(attrs) > _RECORD_ATTR_COUNT:
+            for key, value in attrs.items():
+                if key not in _RESERVED_ATTRS:
+                    parts.append(f",{quote(key)}:{self._encode_value(value)}")
+
+        parts.append("}")
+        return "".join(parts)
+
+    def _encode_value(self, value: Any) -> str:
+        if isinstance(value, str):
+            return self._quote(value)
+        return self._dumps(value)
@@ -0,0 +1,395 @@
+"""Logging handlers for package-a."""
+
+import logging
+import os
+import queue
+import re
+import sys
+import threading
+import time
+import traceback
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+OVERFLOW_POLICIES = ("block", "drop_oldest", "drop_newest")
+
+# The stubs only promise put_nowait() on a QueueHandler's queue; ours is a queue.Queue
+_RecordQueue = queue.Queue[Any]
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    Queue handler that applies a back-pressure policy when its queue is full.
+
+    Policies:
+        block: Wait until the listener frees a slot (no records lost)
+        drop_oldest: Discard the oldest queued record to make room
+        drop_newest: Discard the record being logged
+
+    The number of discarded records is available as ``dropped``.
+    """
+
+    queue: _RecordQueue
+
+    def __init__(self, log_queue: _RecordQueue, overflow: str = "block") -> None:
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Unknown overflow policy {overflow!r}, expected one of {OVERFLOW_POLICIES}"
+            )
+        super().__init__(log_queue)
+        self.overflow = overflow
+        self.dropped = 0
+        self._drop_lock = threading.Lock()
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Put a record on the queue, honouring the overflow policy."""
+        if self.overflow == "block":
+            self.queue.put(record)
+            return
+
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+
+        with self._drop_lock:
+            if self.overflow == "drop_newest":
+                self.dropped += 1
+                return
+
+            while True:
+                try:
+                    oldest = self.queue.get_nowait()
+                except queue.Empty:
+                    pass
+                else:
+                    if oldest is AsyncListener._sentinel:
+                        # The listener is stopping: keep its stop signal, drop this record
+                        self.queue.put(oldest)
+                        self.dropped += 1
+                        return
+                    self.dropped += 1
+                try:
+                    self.queue.put_nowait(record)
+                    return
+                except queue.Full:
+                    continue
+
+
+class AsyncListener(QueueListener):
+    """Queue listener that can be stopped safely on a bounded queue."""
+
+    queue: _RecordQueue
+    _sentinel = None
+
+    def enqueue_sentinel(self) -> None:
+        """Block until the stop sentinel fits, so a full queue is still drained."""
+        self.queue.put(self._sentinel)
+
+    def stop(self) -> None:
+        """Drain outstanding records and stop the listener thread (idempotent)."""
+        if self._thread is None:
+            return
+        super().stop()
+        # Records from writers that were mid-put when the sentinel went in;
+        # taking them also unblocks such a writer on a full queue
+        while True:
+            try:
+                record = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if record is not self._sentinel:
+                self.handle(record)
+        for handler in self.handlers:
+            handler.flush()
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    File handler that coalesces records into large writes.
+
+    Formatted records are collected in memory and written with a single
+    ``write`` call once ``buffer_size`` characters are pending, a record at
+    ``flush_level`` or above arrives, or ``flush_interval`` seconds pass.
+    A ``buffer_size`` of 0 writes every record straight through.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        mode: str = "a",
+        encoding: Optional[str] = None,
+        buffer_size: int = 64 * 1024,
+        flush_interval: float = 1.0,
+        flush_level: int = logging.ERROR,
+    ) -> None:
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        self._pending: List[str] = []
+        self._pending_size = 0
+        super().__init__(filename, mode, encoding)
+
+        self._stop_flushing = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        if buffer_size > 0 and flush_interval > 0:
+            self._flusher = threading.Thread(
+                target=self._flush_periodically, name=f"log-flush-{filename}", daemon=True
+            )
+            self._flusher.start()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Buffer a record, writing the buffer out when a threshold is reached."""
+        try:
+            msg = self.format(record) + self.terminator
+            self._pending.append(msg)
+            self._pending_size += len(msg)
+            if self._pending_size >= self.buffer_size or record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Write all buffered records and flush the underlying stream."""
+        self.acquire()
+        try:
+            if self._pending:
+                if self.stream is None:
+                    self.stream = self._open()
+                self.stream.write("".join(self._pending))
+                self._pending.clear()
+                self._pending_size = 0
+            super().flush()
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        """Stop the background flusher, then flush and close the file."""
+        self._stop_flushing.set()
+        if self._flusher is not None and self._flusher is not threading.current_thread():
+            # The flusher never waits on the lock once stopped, so this join
+            # returns even when the caller holds the lock (logging.shutdown does)
+            self._flusher.join(timeout=5.0)
+        super().close()
+
+    def _flush_periodically(self) -> None:
+        while not self._stop_flushing.wait(self.flush_interval):
+            while not self.lock.acquire(timeout=0.1):  # type: ignore[union-attr]
+                if self._stop_flushing.is_set():
+                    return
+            try:
+                self.flush()
+            finally:
+                self.lock.release()  # type: ignore[union-attr]
+
+
+def _compress_gzip(source: str, target: str) -> None:
+    import gzip
+    import shutil
+
+    with open(source, "rb") as src, gzip.open(target, "wb", compresslevel=6) as dst:
+        shutil.copyfileobj(src, dst, 1024 * 1024)
+
+
+def _compress_zstd(source: str, target: str) -> None:
+    import zstandard
+
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        zstandard.ZstdCompressor().copy_stream(src, dst)
+
+
+# compression name -> (file suffix, compressor)
+_COMPRESSORS: Dict[str, Tuple[str, Callable[[str, str], None]]] = {
+    "gzip": (".gz", _compress_gzip),
+    "zstd": (".zst", _compress_zstd),
+}
+
+
+class CompressingRotatingFileHandler(BufferedFileHandler):
+    """
+    Buffered file handler that rotates by size and/or wall-clock interval.
+
+    Rotated segments are renamed to ``<filename>.<YYYYmmdd-HHMMSS>-<seq>``
+    and, when ``compress`` is set, compressed on a background thread so the
+    logging thread only pays for the rename. ``seq`` increases with every
+    rotation and carries on from the segments already on disk, so it
+    orders segments even when several share a timestamp or the clock
+    steps back. Only the newest ``backup_count`` segments are kept (0
+    keeps all of them).
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        mode: str = "a",
+        encoding: Optional[str] = None,
+        max_bytes: int = 0,
+        rotate_interval: float = 0,
+        backup_count: int = 0,
+        compress: Optional[str] = None,
+        buffer_size: int = 0,
+        flush_interval: float = 1.0,
+        flush_level: int = logging.ERROR,
+    ) -> None:
+        if compress is not None and compress not in _COMPRESSORS:
+            raise ValueError(
+                f"Unknown compression {compress!r}, expected one of {tuple(_COMPRESSORS)}"
+            )
+        if compress == "zstd":
+            try:
+                import zstandard  # noqa: F401
+            except ImportError as e:
+                raise ImportError(
+                    "zstd compression requires 'zstandard'. "
+                    "Please install with: pip install 'package-a[zstd]'"
+                ) from e
+
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.backup_count = backup_count
+        self.compress = compress
+        super().__init__(filename, mode, encoding, buffer_size, flush_interval, flush_level)
+
+        # max_bytes limits the file in bytes, so records are measured encoded
+        self._byte_encoding = self.stream.encoding if self.stream is not None else "utf-8"
+        self._size = os.path.getsize(self.baseFilename)
+        self._sequence = max(self._segments(), default=(-1, ""))[0] + 1
+        self._rollover_at = self._next_rollover(time.time())
+        self._jobs: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Rotate the file if needed, then buffer the record."""
+        try:
+            msg = self.format(record) + self.terminator
+            size = len(msg) if msg.isascii() else len(msg.encode(self._byte_encoding, "replace"))
+            if self._should_rollover(record, size):
+                self.do_rollover(record.created)
+            self._pending.append(msg)
+            self._pending_size += len(msg)
+            self._size += size
+            if self._pending_size >= self.buffer_size or record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def _should_rollover(self, record: logging.LogRecord, size: int) -> bool:
+        if record.created >= self._rollover_at:
+            return True
+        # An empty file is never rotated, so an oversized record cannot loop
+        return self.max_bytes > 0 and self._size > 0 and self._size + size > self.max_bytes
+
+    def do_rollover(self, now: Optional[float] = None) -> None:
+        """Close the current file, rename it and queue it for compression."""
+        if now is None:
+            now = time.time()
+        self.acquire()
+        try:
+            self.flush()
+            if self.stream is not None:
+                self.stream.close()
+                self.stream = None
+
+            if os.path.exists(self.baseFilename) and os.path.getsize(self.baseFilename) > 0:
+                segment = self._segment_name(now)
+                os.rename(self.baseFilename, segment)
+                self._submit(segment)
+
+            self.stream = self._open()
+            self._size = 0
+            self._rollover_at = self._next_rollover(now)
+        finally:
+            self.release()
+
+    def wait_for_compression(self) -> None:
+        """Block until every queued segment has been compressed and pruned."""
+        self._jobs.join()
+
+    def close(self) -> None:
+        """Flush and close the file, then finish outstanding compression."""
+        super().close()
+        if self._worker is not None:
+            self._jobs.put(None)
+            self._worker.join()
+            self._worker = None
+
+    def _next_rollover(self, now: float) -> float:
+        if self.rotate_interval <= 0:
+            return float("inf")
+        return (now // self.rotate_interval + 1) * self.rotate_interval
+
+    def _segment_name(self, now: float) -> str:
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(now))
+        segment = f"{self.baseFilename}.{stamp}-{self._sequence:06d}"
+        self._sequence += 1
+        return segment
+
+    def _segments(self) -> List[Tuple[int, str]]:
+        """Rotated segments on disk as (sequence, file name), oldest first."""
+        directory, base = os.path.split(self.baseFilename)
+        pattern = re.compile(re.escape(base) + r"\.\d{8}-\d{6}-(\d+)(?:\.gz|\.zst)?")
+        segments = []
+        for name in os.listdir(directory):
+            match = pattern.fullmatch(name)
+            if match is not None:
+                segments.append((int(match.group(1)), name))
+        return sorted(segments)
+
+    def _submit(self, segment: str) -> None:
+        if self._worker is None:
+            self._worker = threading.Thread(
+                target=self._process_jobs, name=f"log-compress-{self.baseFilename}", daemon=True
+            )
+            self._worker.start()
+        self._jobs.put(segment)
+
+    def _process_jobs(self) -> None:
+        while True:
+            segment = self._jobs.get()
+            try:
+                if segment is None:
+                    return
+                if self.compress is not None:
+                    self._compress(segment)
+                try:
+                    self._prune()
+                except Exception:
+                    self._report_error(f"Pruning segments of {self.baseFilename}")
+            finally:
+                self._jobs.task_done()
+
+    def _compress(self, segment: str) -> None:
+        suffix, compressor = _COMPRESSORS[self.compress]  # type: ignore[index]
+        target = segment + suffix
+        try:
+            compressor(segment, target)
+        except Exception:
+            # Keep the uncompressed segment and drop the partial output
+            self._report_error(f"Compressing {segment}")
+            try:
+                os.remove(target)
+            except OSError:
+                pass
+            return
+        try:
+            os.remove(segment)
+        except OSError:
+            self._report_error(f"Removing {segment}")
+
+    def _report_error(self, action: str) -> None:
+        """Report a background failure the way handleError() reports emit errors."""
+        if logging.raiseExceptions and sys.stderr:
+            sys.stderr.write(f"--- Logging error ---\n{action} failed:\n")
+            traceback.print_exc(file=sys.stderr)
+
+    def _prune(self) -> None:
+        if self.backup_count <= 0:
+            return
+        directory = os.path.dirname(self.baseFilename)
+        for _, name in self._segments()[: -self.backup_count]:
+            os.remove(os.path.join(directory, name))
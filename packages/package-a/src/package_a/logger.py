@@ -1,42 +1,350 @@
 """Logging utilities for package-a."""
 
+import atexit
 import logging
-from typing import Optional
+import os
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+# Handlers, formatters and filters are imported where they are used, so a
+# plain setup_logger call does not pay for features it does not enable
+if TYPE_CHECKING:
+    from package_a.handlers import AsyncListener
+
+# Configuration of every logger set up through setup_logger, by logger name
+_registry: Dict[str, "_LoggerEntry"] = {}
+# File handlers shared by all loggers writing the same file with the same options
+_shared_files: Dict[Tuple[Any, ...], "_SharedHandler"] = {}
+_registry_lock = threading.RLock()
+
+
+class _LoggerEntry(NamedTuple):
+    key: Tuple[Any, ...]
+    handlers: List[logging.Handler]
+    filters: List[logging.Filter]
+    file_key: Optional[Tuple[Any, ...]]
+    listener: Optional["AsyncListener"]
+
+
+class _SharedHandler:
+    __slots__ = ("handler", "refcount")
+
+    def __init__(self, handler: logging.FileHandler) -> None:
+        self.handler = handler
+        self.refcount = 0
 
 
 def setup_logger(
     name: str,
     level: int = logging.INFO,
     log_file: Optional[str] = None,
+    async_mode: bool = False,
+    queue_size: int = 10000,
+    overflow: str = "block",
+    buffer_size: int = 0,
+    flush_interval: float = 1.0,
+    flush_level: int = logging.ERROR,
+    max_bytes: int = 0,
+    rotate_interval: float = 0,
+    backup_count: int = 0,
+    compress: Optional[str] = None,
+    log_format: str = "text",
+    static_fields: Optional[Mapping[str, Any]] = None,
+    time_format: Optional[str] = None,
+    log_queue: Optional[Any] = None,
+    rate_limit: float = 0,
+    rate_burst: int = 10,
+    sample_rates: Optional[Mapping[int, float]] = None,
+    sample_key: Optional[str] = "trace_id",
 ) -> logging.Logger:
     """
     Set up a logger with optional file output.
 
+    Calling it again with the same arguments returns the logger untouched,
+    and loggers writing to the same file with the same options share a
+    single file handler.
+
     Args:
         name: Logger name
         level: Logging level (default: logging.INFO)
         log_file: Optional file path to log to
+        async_mode: Hand records to a background thread instead of writing
+            them on the calling thread (default: False)
+        queue_size: Maximum number of records buffered in async mode (default: 10000)
+        overflow: What to do when the async queue is full: "block",
+            "drop_oldest" or "drop_newest" (default: "block")
+        buffer_size: Buffer up to this many characters of file output before
+            writing; 0 writes every record immediately (default: 0)
+        flush_interval: Seconds between background flushes of a buffered
+            log file (default: 1.0)
+        flush_level: Records at this level or above flush a buffered log
+            file immediately (default: logging.ERROR)
+        max_bytes: Rotate the log file once it would exceed this size;
+            0 disables size-based rotation (default: 0)
+        rotate_interval: Rotate the log file every this many seconds,
+            aligned to the wall clock; 0 disables it (default: 0)
+        backup_count: Number of rotated segments to keep; 0 keeps all (default: 0)
+        compress: Compress rotated segments in the background with
+            "gzip" or "zstd"; zstd needs the package-a[zstd] extra (default: None)
+        log_format: "text" for the classic line format or "json" for one
+            JSON object per line (default: "text")
+        static_fields: Constant fields added to every JSON record (default: None)
+        time_format: Timestamp style, "local", "iso" (UTC) or "epoch_ns";
+            defaults to "local" for text and "iso" for JSON
+        log_queue: Send records to this queue instead of writing them locally,
+            typically ``LogAggregator.queue`` in a worker process (default: None)
+        rate_limit: Records per second allowed for each distinct
+            (logger, level, message template); 0 disables limiting (default: 0)
+        rate_burst: Records allowed in a burst before rate limiting starts
+            (default: 10)
+        sample_rates: Fraction of records to keep per level, e.g.
+            ``{logging.DEBUG: 0.01}``; unlisted levels are kept (default: None)
+        sample_key: Record attribute (set via ``extra=``) used to sample
+            deterministically by trace; records without it are sampled at
+            random (default: "trace_id")
 
     Returns:
         Configured logger instance
     """
+    formatter_key = (
+        log_format,
+        repr(list(static_fields.items())) if static_fields else None,
+        time_format,
+    )
+    file_key: Optional[Tuple[Any, ...]] = None
+    if log_file:
+        file_key = (
+            os.path.abspath(log_file),
+            buffer_size,
+            flush_interval,
+            flush_level,
+            max_bytes,
+            rotate_interval,
+            backup_count,
+            compress,
+            formatter_key,
+        )
+    key = (
+        file_key,
+        formatter_key,
+        async_mode,
+        queue_size,
+        overflow,
+        id(log_queue),
+        rate_limit,
+        rate_burst,
+        repr(sorted(sample_rates.items())) if sample_rates else None,
+        sample_key,
+    )
+
     logger = logging.getLogger(name)
-    logger.setLevel(level)
+    with _registry_lock:
+        previous = _registry.get(name)
+        if previous is not None and previous.key == key and _installed(logger, previous):
+            if logger.level != level:
+                logger.setLevel(level)
+            return logger
 
-    # Clear any existing handlers
-    logger.handlers = []
+        # Sampling runs first so dropped records do not consume rate-limit tokens
+        filters: List[logging.Filter] = []
+        if sample_rates or rate_limit > 0:
+            from package_a.filters import RateLimitFilter, SamplingFilter
 
-    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+            if sample_rates:
+                filters.append(SamplingFilter(sample_rates, key_attr=sample_key))
+            if rate_limit > 0:
+                filters.append(RateLimitFilter(rate_limit, burst=rate_burst))
 
-    # Console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+        handlers: List[logging.Handler] = []
+        queue_handler: Optional[logging.Handler] = None
+        async_queue: Optional[Any] = None
+        if log_queue is not None:
+            from logging.handlers import QueueHandler
 
-    # File handler (optional)
-    if log_file:
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+            # Formatting and file output happen in the aggregator process
+            file_key = None
+            queue_handler = QueueHandler(log_queue)
+        else:
+            formatter = _create_formatter(log_format, static_fields, time_format)
+
+            if async_mode:
+                import queue
+
+                from package_a.handlers import BoundedQueueHandler
+
+                async_queue = queue.Queue(maxsize=queue_size)
+                queue_handler = BoundedQueueHandler(async_queue, overflow=overflow)
+
+            # File handler (optional), shared with other loggers using the same file
+            if file_key is not None:
+                shared = _shared_files.get(file_key)
+                if shared is None:
+                    shared = _SharedHandler(
+                        _create_file_handler(
+                            file_key[0],
+                            buffer_size,
+                            flush_interval,
+                            flush_level,
+                            max_bytes,
+                            rotate_interval,
+                            backup_count,
+                            compress,
+                        )
+                    )
+                    shared.handler.setFormatter(formatter)
+                    _shared_files[file_key] = shared
+                shared.refcount += 1
+
+            # Console handler
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(formatter)
+            handlers.append(console_handler)
+            if file_key is not None:
+                handlers.append(_shared_files[file_key].handler)
+
+        # Detach the previous handlers before releasing them, so no record is
+        # queued for a listener that is stopping
+        if previous is not None:
+            _flush_filters(previous)
+        logger.handlers = []
+        if previous is not None:
+            _release(logger, previous)
+        logger.setLevel(level)
+        for log_filter in filters:
+            logger.addFilter(log_filter)
+
+        listener: Optional["AsyncListener"] = None
+        if async_queue is not None:
+            from package_a.handlers import AsyncListener
+
+            listener = AsyncListener(async_queue, *handlers, respect_handler_level=True)
+            listener.start()
+        if queue_handler is not None:
+            logger.addHandler(queue_handler)
+        else:
+            for handler in handlers:
+                logger.addHandler(handler)
+
+        _registry[name] = _LoggerEntry(key, list(logger.handlers), filters, file_key, listener)
 
     return logger
+
+
+def _create_formatter(
+    log_format: str,
+    static_fields: Optional[Mapping[str, Any]],
+    time_format: Optional[str],
+) -> logging.Formatter:
+    """Create the text or JSON formatter used by a logger's handlers."""
+    from package_a.formatters import CachedTimeFormatter, JsonFormatter
+
+    if log_format == "json":
+        return JsonFormatter(static_fields, time_format=time_format or "iso")
+    if log_format == "text":
+        return CachedTimeFormatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            time_format=time_format or "local",
+        )
+    raise ValueError(f"Unknown log format {log_format!r}, expected 'text' or 'json'")
+
+
+def _create_file_handler(
+    log_file: str,
+    buffer_size: int,
+    flush_interval: float,
+    flush_level: int,
+    max_bytes: int,
+    rotate_interval: float,
+    backup_count: int,
+    compress: Optional[str],
+) -> logging.FileHandler:
+    """Create the file handler matching the requested buffering and rotation."""
+    if max_bytes > 0 or rotate_interval > 0:
+        from package_a.handlers import CompressingRotatingFileHandler
+
+        return CompressingRotatingFileHandler(
+            log_file,
+            max_bytes=max_bytes,
+            rotate_interval=rotate_interval,
+            backup_count=backup_count,
+            compress=compress,
+            buffer_size=buffer_size,
+            flush_interval=flush_interval,
+            flush_level=flush_level,
+        )
+    if buffer_size > 0:
+        from package_a.handlers import BufferedFileHandler
+
+        return BufferedFileHandler(
+            log_file,
+            buffer_size=buffer_size,
+            flush_interval=flush_interval,
+            flush_level=flush_level,
+        )
+    return logging.FileHandler(log_file)
+
+
+def _installed(logger: logging.Logger, entry: _LoggerEntry) -> bool:
+    """Check that nobody replaced the handlers setup_logger attached."""
+    return len(logger.handlers) == len(entry.handlers) and all(
+        a is b for a, b in zip(logger.handlers, entry.handlers)
+    )
+
+
+def _flush_filters(entry: _LoggerEntry) -> None:
+    """Log pending rate-limit summaries while the handlers are still attached."""
+    for log_filter in entry.filters:
+        flush = getattr(log_filter, "flush", None)
+        if flush is not None:
+            flush()
+
+
+def _release(logger: logging.Logger, entry: _LoggerEntry) -> None:
+    """Undo a previous configuration: filters, listener and file handler reference."""
+    for log_filter in entry.filters:
+        logger.removeFilter(log_filter)
+    if entry.listener is not None:
+        entry.listener.stop()
+    if entry.file_key is not None:
+        shared = _shared_files.get(entry.file_key)
+        if shared is not None:
+            shared.refcount -= 1
+            if shared.refcount <= 0:
+                del _shared_files[entry.file_key]
+                shared.handler.close()
+
+
+def release_logger(name: str) -> None:
+    """
+    Detach a logger's handlers and close its file if no other logger uses it.
+
+    Args:
+        name: Logger name previously passed to setup_logger
+    """
+    with _registry_lock:
+        entry = _registry.pop(name, None)
+        if entry is None:
+            return
+        logger = logging.getLogger(name)
+        _flush_filters(entry)
+        for handler in entry.handlers:
+            logger.removeHandler(handler)
+        _release(logger, entry)
+
+
+def shutdown_loggers() -> None:
+    """
+    Flush and release every async or rate-limited logger.
+
+    Registered with ``atexit`` so queued records and rate-limit summaries
+    are written before the interpreter exits; safe to call more than once.
+    """
+    with _registry_lock:
+        names = [
+            name for name, entry in _registry.items() if entry.listener is not None or entry.filters
+        ]
+    for name in names:
+        release_logger(name)
+
+
+atexit.register(shutdown_loggers)
@@ -0,0 +1,150 @@
+"""Multiprocess log aggregation for package-a."""
+
+import logging
+import multiprocessing
+from typing import Any, Dict, Mapping, Optional
+
+from package_a.logger import _create_file_handler, _create_formatter
+
+
+def _run_writer(log_queue: Any, log_file: str, options: Dict[str, Any]) -> None:
+    """Write records from the queue to the log file until the stop sentinel arrives."""
+    formatter = _create_formatter(
+        options["log_format"], options["static_fields"], options["time_format"]
+    )
+    handler = _create_file_handler(
+        log_file,
+        options["buffer_size"],
+        options["flush_interval"],
+        options["flush_level"],
+        options["max_bytes"],
+        options["rotate_interval"],
+        options["backup_count"],
+        options["compress"],
+    )
+    handler.setFormatter(formatter)
+    level = options["level"]
+
+    try:
+        while True:
+            record = log_queue.get()
+            if record is None:
+                break
+            if record.levelno >= level:
+                handler.handle(record)
+    finally:
+        handler.close()
+
+
+class LogAggregator:
+    """
+    Single writer process that owns a log file for a pool of worker processes.
+
+    Workers send records over ``queue`` (see ``setup_logger(log_queue=...)``)
+    and the aggregator writes them one at a time, so lines from different
+    processes never interleave and no file locking is needed.
+
+    Example:
+        with LogAggregator("app.log") as aggregator:
+            init = functools.partial(setup_logger, "worker", log_queue=aggregator.queue)
+            with ProcessPoolExecutor(initializer=init) as pool:
+                ...
+    """
+
+    def __init__(
+        self,
+        log_file: str,
+        level: int = logging.DEBUG,
+        queue_size: int = 0,
+        log_format: str = "text",
+        static_fields: Optional[Mapping[str, Any]] = None,
+        time_format: Optional[str] = None,
+        buffer_size: int = 64 * 1024,
+        flush_interval: float = 1.0,
+        flush_level: int = logging.ERROR,
+        max_bytes: int = 0,
+        rotate_interval: float = 0,
+        backup_count: int = 0,
+        compress: Optional[str] = None,
+        mp_context: Optional[Any] = None,
+    ) -> None:
+        """
+        Create an aggregator; call start() to launch the writer process.
+
+        Args:
+            log_file: File the writer process appends to
+            level: Minimum level written (default: logging.DEBUG)
+            queue_size: Maximum records in flight; 0 means unbounded (default: 0)
+            log_format: "text" or "json" (default: "text")
+            static_fields: Constant fields added to every JSON record (default: None)
+            time_format: Timestamp style, see setup_logger (default: None)
+            buffer_size: Characters buffered before writing (default: 65536)
+            flush_interval: Seconds between background flushes (default: 1.0)
+            flush_level: Records at this level or above are flushed immediately
+                (default: logging.ERROR)
+            max_bytes: Size-based rotation threshold, see setup_logger (default: 0)
+            rotate_interval: Time-based rotation interval, see setup_logger (default: 0)
+            backup_count: Rotated segments to keep (default: 0)
+            compress: Compression for rotated segments (default: None)
+            mp_context: multiprocessing context to use (default: the default context)
+        """
+        # Fail in the parent rather than in the writer process
+        _create_formatter(log_format, static_fields, time_format)
+
+        self.log_file = log_file
+        self._context = mp_context or multiprocessing.get_context()
+        self.queue = self._context.Queue(queue_size)
+        self._options: Dict[str, Any] = {
+            "level": level,
+            "log_format": log_format,
+            "static_fields": dict(static_fields) if static_fields else None,
+            "time_format": time_format,
+            "buffer_size": buffer_size,
+            "flush_interval": flush_interval,
+            "flush_level": flush_level,
+            "max_bytes": max_bytes,
+            "rotate_interval": rotate_interval,
+            "backup_count": backup_count,
+            "compress": compress,
+        }
+        self._process: Optional[Any] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the writer process is alive."""
+        return self._process is not None and self._process.is_alive()
+
+    def start(self) -> "LogAggregator":
+        """Launch the writer process (no-op if already running)."""
+        if self._process is None:
+            self._process = self._context.Process(
+                target=_run_writer,
+                args=(self.queue, self.log_file, self._options),
+                name="package-a-log-writer",
+                daemon=True,
+            )
+            self._process.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = 10.0) -> None:
+        """
+        Write all queued records and stop the writer process.
+
+        Args:
+            timeout: Seconds to wait for the writer to drain before it is
+                terminated (default: 10.0)
+        """
+        if self._process is None:
+            return
+        self.queue.put(None)
+        self._process.join(timeout)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+        self._process = None
+
+    def __enter__(self) -> "LogAggregator":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
@@ -0,0 +1,108 @@
+"""Import-time profiling for the package-a CLI."""
+
+import sys
+import time
+from importlib.abc import MetaPathFinder
+from importlib.machinery import ModuleSpec
+from types import ModuleType
+from typing import Any, List, Optional, Sequence, TextIO, Tuple
+
+
+class _TimedLoader:
+    """Loader proxy that times ``exec_module`` for the profiler."""
+
+    def __init__(self, loader: Any, profiler: "ImportProfiler", name: str) -> None:
+        self._loader = loader
+        self._profiler = profiler
+        self._name = name
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._loader, attr)
+
+    def create_module(self, spec: ModuleSpec) -> Optional[ModuleType]:
+        return self._loader.create_module(spec)  # type: ignore[no-any-return]
+
+    def exec_module(self, module: ModuleType) -> None:
+        self._profiler._enter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit(self._name)
+
+
+class ImportProfiler(MetaPathFinder):
+    """
+    Record how long each module takes to import, like ``python -X importtime``.
+
+    Works in frozen (PyInstaller) binaries where interpreter flags cannot be
+    passed. Only imports that happen between install() and uninstall() are
+    measured; ``self`` excludes time spent importing nested modules.
+    """
+
+    def __init__(self) -> None:
+        # (module name, self us, cumulative us, nesting depth) in completion order
+        self.records: List[Tuple[str, int, int, int]] = []
+        self._stack: List[List[float]] = []
+        self._started = 0.0
+
+    def install(self) -> None:
+        """Start measuring imports."""
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+            self._started = time.perf_counter()
+
+    def uninstall(self) -> None:
+        """Stop measuring imports."""
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Optional[Sequence[str]],
+        target: Optional[ModuleType] = None,
+    ) -> Optional[ModuleSpec]:
+        """Find the module with the remaining finders and wrap its loader."""
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self, fullname)  # type: ignore[assignment]
+        return spec
+
+    def _enter(self) -> None:
+        # [start time, time spent in nested imports]
+        self._stack.append([time.perf_counter(), 0.0])
+
+    def _exit(self, name: str) -> None:
+        start, nested = self._stack.pop()
+        cumulative = time.perf_counter() - start
+        if self._stack:
+            self._stack[-1][1] += cumulative
+        self.records.append(
+            (name, int((cumulative - nested) * 1e6), int(cumulative * 1e6), len(self._stack))
+        )
+
+    def report(self, stream: TextIO = sys.stderr) -> None:
+        """
+        Write an ``-X importtime``-style breakdown followed by a summary.
+
+        Args:
+            stream: Where to write the report (default: sys.stderr)
+        """
+        stream.write("import time: self [us] | cumulative | imported package\n")
+        for name, self_us, cumulative_us, depth in self.records:
+            indent = "  " * depth
+            stream.write(f"import time: {self_us:>9} | {cumulative_us:>10} | {indent}{name}\n")
+        total_imports = sum(cumulative for _, _, cumulative, depth in self.records if depth == 0)
+        elapsed = int((time.perf_counter() - self._started) * 1e6)
+        stream.write(
+            f"startup profile: {len(self.records)} modules imported in {total_imports} us, "
+            f"{elapsed} us total\n"
+        )
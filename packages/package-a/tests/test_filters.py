@@ -0,0 +1,243 @@
+"""Tests for log record filters."""
+
+import logging
+from typing import List
+
+import pytest
+
+from package_a.filters import RateLimitFilter, SamplingFilter
+
+
+class FakeClock:
+    """Manually advanced clock for deterministic rate limiting."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _record(msg: str, *args: object, level: int = logging.ERROR) -> logging.LogRecord:
+    return logging.LogRecord("app", level, __file__, 1, msg, args, None)
+
+
+class TestRateLimitFilter:
+    """Test suite for RateLimitFilter."""
+
+    def test_burst_then_suppress(self) -> None:
+        """Test that records beyond the burst are suppressed."""
+        rate_filter = RateLimitFilter(rate=1, burst=3, clock=FakeClock())
+        results = [rate_filter.filter(_record("db down: %s", i)) for i in range(5)]
+        assert results == [True, True, True, False, False]
+
+    def test_key_uses_template_not_arguments(self) -> None:
+        """Test that different arguments share one bucket but templates do not."""
+        rate_filter = RateLimitFilter(rate=1, burst=1, clock=FakeClock())
+        assert rate_filter.filter(_record("user %s failed", "a"))
+        assert not rate_filter.filter(_record("user %s failed", "b"))
+        assert rate_filter.filter(_record("other message"))
+        assert rate_filter.filter(_record("user %s failed", "c", level=logging.WARNING))
+
+    def test_refill_reports_suppressed_count(self) -> None:
+        """Test that the next admitted record carries the suppressed count."""
+        clock = FakeClock()
+        rate_filter = RateLimitFilter(rate=1, burst=1, clock=clock)
+        rate_filter.filter(_record("boom %d", 1))
+        for i in range(4):
+            assert not rate_filter.filter(_record("boom %d", i))
+
+        clock.now = 1.0
+        record = _record("boom %d", 9)
+        assert rate_filter.filter(record)
+        assert record.getMessage() == "boom 9 [suppressed 4 duplicates]"
+        assert getattr(record, "suppressed") == 4
+
+    def test_flood_then_silence_reports_summary(self) -> None:
+        """Test that a flood that stops is summarized on the next record of any key."""
+        received: List[logging.LogRecord] = []
+
+        class ListHandler(logging.Handler):
+            def emit(self, record: logging.LogRecord) -> None:
+                received.append(record)
+
+        clock = FakeClock()
+        logger = logging.getLogger("test_rate_limit_silence")
+        handler = ListHandler()
+        rate_filter = RateLimitFilter(rate=1, burst=1, clock=clock)
+        logger.addHandler(handler)
+        logger.addFilter(rate_filter)
+        try:
+            for i in range(5):
+                logger.error("flood %d", i)
+            clock.now = 0.5
+            logger.error("other")
+            assert len(received) == 2
+            clock.now = 1.0
+            logger.error("other again")
+        finally:
+            logger.removeHandler(handler)
+            logger.removeFilter(rate_filter)
+
+        messages = [record.getMessage() for record in received]
+        assert messages == [
+            "flood 0",
+            "other",
+            "flood %d [suppressed 4 duplicates]",
+            "other again",
+        ]
+        assert getattr(received[2], "suppressed") == 4
+        assert received[2].levelno == logging.ERROR
+
+    def test_flush_reports_pending_summaries(self) -> None:
+        """Test that flush() summarizes suppressed records exactly once."""
+        received: List[str] = []
+
+        class ListHandler(logging.Handler):
+            def emit(self, record: logging.LogRecord) -> None:
+                received.append(record.getMessage())
+
+        logger = logging.getLogger("test_rate_limit_flush")
+        handler = ListHandler()
+        rate_filter = RateLimitFilter(rate=1, burst=1, clock=FakeClock())
+        logger.addHandler(handler)
+        logger.addFilter(rate_filter)
+        try:
+            for _ in range(3):
+                logger.warning("disk full")
+            rate_filter.flush()
+            rate_filter.flush()
+        finally:
+            logger.removeHandler(handler)
+            logger.removeFilter(rate_filter)
+
+        assert received == ["disk full", "disk full [suppressed 2 duplicates]"]
+
+    def test_eviction_reports_summary(self) -> None:
+        """Test that evicting a key with suppressed records summarizes them."""
+        received: List[str] = []
+
+        class ListHandler(logging.Handler):
+            def emit(self, record: logging.LogRecord) -> None:
+                received.append(record.getMessage())
+
+        logger = logging.getLogger("test_rate_limit_evict")
+        handler = ListHandler()
+        rate_filter = RateLimitFilter(rate=1, burst=1, max_keys=1, clock=FakeClock())
+        logger.addHandler(handler)
+        logger.addFilter(rate_filter)
+        try:
+            logger.error("a")
+            logger.error("a")
+            logger.error("b")
+        finally:
+            logger.removeHandler(handler)
+            logger.removeFilter(rate_filter)
+
+        assert received == ["a", "a [suppressed 1 duplicates]", "b"]
+
+    def test_bounded_keys(self) -> None:
+        """Test that the least recently used key is evicted."""
+        rate_filter = RateLimitFilter(rate=1, burst=1, max_keys=2, clock=FakeClock())
+        for msg in ("a", "b", "c"):
+            rate_filter.filter(_record(msg))
+        assert len(rate_filter._buckets) == 2
+        # "a" was evicted, so it starts with a fresh bucket
+        assert rate_filter.filter(_record("a"))
+
+    def test_invalid_rate(self) -> None:
+        """Test that a non-positive rate is rejected."""
+        with pytest.raises(ValueError, match="rate must be positive"):
+            RateLimitFilter(rate=0)
+
+    def test_attached_to_logger(self) -> None:
+        """Test that suppressed records never reach handlers."""
+        received: List[str] = []
+
+        class ListHandler(logging.Handler):
+            def emit(self, record: logging.LogRecord) -> None:
+                received.append(record.getMessage())
+
+        logger = logging.getLogger("test_rate_limit_logger")
+        handler = ListHandler()
+        rate_filter = RateLimitFilter(rate=1, burst=2, clock=FakeClock())
+        logger.addHandler(handler)
+        logger.addFilter(rate_filter)
+        try:
+            for i in range(10):
+                logger.error("retry %d", i)
+        finally:
+            logger.removeHandler(handler)
+            logger.removeFilter(rate_filter)
+
+        assert received == ["retry 0", "retry 1"]
+
+
+class TestSamplingFilter:
+    """Test suite for SamplingFilter."""
+
+    def test_unlisted_levels_always_kept(self) -> None:
+        """Test that levels without a rate pass through."""
+        sampling = SamplingFilter({logging.DEBUG: 0.0})
+        assert sampling.filter(_record("kept", level=logging.ERROR))
+        assert not sampling.filter(_record("dropped", level=logging.DEBUG))
+
+    def test_random_sampling(self) -> None:
+        """Test that records without a trace id use the random source."""
+        values = iter([0.05, 0.5])
+        sampling = SamplingFilter({logging.INFO: 0.1}, rng=lambda: next(values))
+        assert sampling.filter(_record("a", level=logging.INFO))
+        assert not sampling.filter(_record("b", level=logging.INFO))
+
+    def test_deterministic_by_trace_id(self) -> None:
+        """Test that a trace is sampled the same way every time."""
+        sampling = SamplingFilter({logging.DEBUG: 0.5})
+        decisions = {}
+        for trace in range(200):
+            record = _record("step", level=logging.DEBUG)
+            record.trace_id = f"trace-{trace}"
+            decisions[trace] = sampling.filter(record)
+
+        for trace, kept in decisions.items():
+            record = _record("other step", level=logging.DEBUG)
+            record.trace_id = f"trace-{trace}"
+            assert sampling.filter(record) == kept
+        assert 50 < sum(decisions.values()) < 150
+
+    def test_lower_rate_is_subset(self) -> None:
+        """Test that traces kept at a low rate are kept at a higher one."""
+        low = SamplingFilter({logging.DEBUG: 0.1})
+        high = SamplingFilter({logging.DEBUG: 0.6})
+        for trace in range(500):
+            record = _record("x", level=logging.DEBUG)
+            record.trace_id = trace
+            if low.filter(record):
+                assert high.filter(record)
+
+    def test_message_not_interpolated_when_dropped(self) -> None:
+        """Test that dropped records never format their arguments."""
+
+        class Exploding:
+            def __str__(self) -> str:
+                raise AssertionError("formatted")
+
+        class FormattingHandler(logging.Handler):
+            def emit(self, record: logging.LogRecord) -> None:
+                record.getMessage()
+
+        logger = logging.getLogger("test_sampling_lazy")
+        logger.setLevel(logging.DEBUG)
+        handler = FormattingHandler()
+        sampling = SamplingFilter({logging.DEBUG: 0.0})
+        logger.addHandler(handler)
+        logger.addFilter(sampling)
+        try:
+            logger.debug("value %s", Exploding())
+        finally:
+            logger.removeFilter(sampling)
+            logger.removeHandler(handler)
+
+    def test_invalid_rate(self) -> None:
+        """Test that rates outside [0, 1] are rejected."""
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            SamplingFilter({logging.DEBUG: 1.5})
@@ -0,0 +1,126 @@
+"""Tests for log record formatters."""
+
+import json
+import logging
+import sys
+
+import pytest
+
+from package_a.formatters import CachedTimeFormatter, JsonFormatter
+
+
+def _record(msg: str, *args: object, **extra: object) -> logging.LogRecord:
+    record = logging.LogRecord("app.module", logging.WARNING, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+class TestCachedTimeFormatter:
+    """Test suite for CachedTimeFormatter."""
+
+    def test_local_matches_standard_formatter(self) -> None:
+        """Test that local time output is identical to logging.Formatter."""
+        fmt = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        cached = CachedTimeFormatter(fmt)
+        standard = logging.Formatter(fmt)
+
+        record = _record("hello")
+        for offset in (0.0, 0.25, 0.999, 1.5, 3600.0):
+            record.created = 1700000000.0 + offset
+            record.msecs = (record.created - int(record.created)) * 1000
+            assert cached.format(record) == standard.format(record)
+
+    def test_custom_datefmt(self) -> None:
+        """Test that a custom datefmt is honoured without milliseconds."""
+        record = _record("hello")
+        formatter = CachedTimeFormatter("%(asctime)s", datefmt="%Y")
+        assert formatter.format(record) == logging.Formatter("%(asctime)s", "%Y").format(record)
+
+    def test_prefix_cached_within_second(self) -> None:
+        """Test that records in the same second reuse the cached prefix."""
+        formatter = CachedTimeFormatter(time_format="iso")
+        first = _record("a")
+        first.created, first.msecs = 1700000000.1, 100.0
+        second = _record("b")
+        second.created, second.msecs = 1700000000.9, 900.0
+
+        assert formatter.formatTime(first) == "2023-11-14T22:13:20.100Z"
+        prefix = formatter._cached_second[1]
+        assert formatter.formatTime(second) == "2023-11-14T22:13:20.900Z"
+        assert formatter._cached_second[1] is prefix
+
+    def test_epoch_ns(self) -> None:
+        """Test nanosecond epoch output."""
+        record = _record("a")
+        record.created = 1700000000.5
+        assert CachedTimeFormatter(time_format="epoch_ns").formatTime(record) == (
+            "1700000000500000000"
+        )
+
+    def test_invalid_time_format(self) -> None:
+        """Test that an unknown time format is rejected."""
+        with pytest.raises(ValueError, match="Unknown time format"):
+            CachedTimeFormatter(time_format="julian")
+
+
+class TestJsonFormatter:
+    """Test suite for JsonFormatter."""
+
+    def test_format_is_valid_json(self) -> None:
+        """Test that output parses as JSON with the core fields."""
+        data = json.loads(JsonFormatter().format(_record("hello %s", "world")))
+        assert data["level"] == "WARNING"
+        assert data["logger"] == "app.module"
+        assert data["message"] == "hello world"
+        assert data["time"].endswith("Z")
+
+    def test_fixed_key_order(self) -> None:
+        """Test that keys are emitted in a fixed order."""
+        formatter = JsonFormatter(static_fields={"service": "api"})
+        data = json.loads(formatter.format(_record("msg", request_id="abc")))
+        assert list(data) == ["time", "level", "logger", "message", "service", "request_id"]
+
+    def test_extra_fields(self) -> None:
+        """Test that extra= fields are serialised, including non-JSON types."""
+        formatter = JsonFormatter()
+        data = json.loads(formatter.format(_record("msg", user_id=42, path=object())))
+        assert data["user_id"] == 42
+        assert data["path"].startswith("<object object")
+
+    def test_single_line_output(self) -> None:
+        """Test that newlines in messages are escaped."""
+        output = JsonFormatter().format(_record("line one\nline two"))
+        assert "\n" not in output
+        assert json.loads(output)["message"] == "line one\nline two"
+
+    def test_exception_info(self) -> None:
+        """Test that exception tracebacks are included."""
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            record = _record("failed")
+            record.exc_info = sys.exc_info()
+
+        data = json.loads(JsonFormatter().format(record))
+        assert "RuntimeError: boom" in data["exc_info"]
+
+    def test_through_logger(self) -> None:
+        """Test formatting a record created through a real logger call."""
+        logger = logging.getLogger("test_json_formatter")
+        records = []
+
+        class ListHandler(logging.Handler):
+            def emit(self, record: logging.LogRecord) -> None:
+                records.append(self.format(record))
+
+        handler = ListHandler()
+        handler.setFormatter(JsonFormatter())
+        logger.addHandler(handler)
+        try:
+            logger.warning("count=%d", 3, extra={"shard": "eu-1"})
+        finally:
+            logger.removeHandler(handler)
+
+        data = json.loads(records[0])
+        assert data["message"] == "count=3"
+        assert data["shard"] == "eu-1"
@@ -0,0 +1,274 @@
+"""Tests for logging handlers."""
+
+import gzip
+import logging
+import queue
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from package_a import handlers
+from package_a.handlers import (
+    AsyncListener,
+    BoundedQueueHandler,
+    BufferedFileHandler,
+    CompressingRotatingFileHandler,
+)
+
+
+def _record(msg: str) -> logging.LogRecord:
+    return logging.LogRecord("test", logging.INFO, __file__, 1, msg, None, None)
+
+
+class TestBoundedQueueHandler:
+    """Test suite for BoundedQueueHandler."""
+
+    def test_invalid_overflow_policy(self) -> None:
+        """Test that an unknown overflow policy is rejected."""
+        with pytest.raises(ValueError, match="Unknown overflow policy"):
+            BoundedQueueHandler(queue.Queue(), overflow="explode")
+
+    def test_drop_newest_discards_incoming_record(self) -> None:
+        """Test that drop_newest keeps the queued records."""
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=2)
+        handler = BoundedQueueHandler(log_queue, overflow="drop_newest")
+
+        for msg in ("one", "two", "three"):
+            handler.handle(_record(msg))
+
+        assert handler.dropped == 1
+        assert [log_queue.get_nowait().msg for _ in range(2)] == ["one", "two"]
+
+    def test_drop_oldest_discards_queued_record(self) -> None:
+        """Test that drop_oldest makes room for the newest record."""
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=2)
+        handler = BoundedQueueHandler(log_queue, overflow="drop_oldest")
+
+        for msg in ("one", "two", "three"):
+            handler.handle(_record(msg))
+
+        assert handler.dropped == 1
+        assert [log_queue.get_nowait().msg for _ in range(2)] == ["two", "three"]
+
+    def test_drop_oldest_keeps_stop_sentinel(self) -> None:
+        """Test that a full queue never loses the listener's stop signal."""
+        log_queue: "queue.Queue[object]" = queue.Queue(maxsize=2)
+        handler = BoundedQueueHandler(log_queue, overflow="drop_oldest")
+        log_queue.put_nowait(AsyncListener._sentinel)
+        log_queue.put_nowait(_record("one"))
+
+        handler.handle(_record("two"))
+
+        assert handler.dropped == 1
+        assert [log_queue.get_nowait() for _ in range(2)][1] is AsyncListener._sentinel
+
+
+class TestAsyncListener:
+    """Test suite for AsyncListener."""
+
+    def test_stop_drains_full_queue(self) -> None:
+        """Test that stopping delivers every queued record, even when the queue is full."""
+        received = []
+
+        class ListHandler(logging.Handler):
+            def emit(self, record: logging.LogRecord) -> None:
+                received.append(record.getMessage())
+
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=3)
+        for msg in ("a", "b", "c"):
+            log_queue.put_nowait(_record(msg))
+
+        listener = AsyncListener(log_queue, ListHandler())
+        listener.start()
+        listener.stop()
+        listener.stop()
+
+        assert received == ["a", "b", "c"]
+
+
+class TestBufferedFileHandler:
+    """Test suite for BufferedFileHandler."""
+
+    def test_records_buffered_until_threshold(self, tmp_path: Path) -> None:
+        """Test that records are held back until the buffer size is reached."""
+        log_file = tmp_path / "buffered.log"
+        handler = BufferedFileHandler(str(log_file), buffer_size=1024, flush_interval=0)
+        try:
+            handler.handle(_record("first"))
+            assert log_file.read_text() == ""
+
+            handler.handle(_record("x" * 1024))
+            assert log_file.read_text() == "first\n" + "x" * 1024 + "\n"
+        finally:
+            handler.close()
+
+    def test_flush_on_error(self, tmp_path: Path) -> None:
+        """Test that an error record flushes the buffer immediately."""
+        log_file = tmp_path / "buffered.log"
+        handler = BufferedFileHandler(str(log_file), buffer_size=1024, flush_interval=0)
+        try:
+            handler.handle(_record("info"))
+            error = _record("boom")
+            error.levelno = logging.ERROR
+            handler.handle(error)
+            assert log_file.read_text() == "info\nboom\n"
+        finally:
+            handler.close()
+
+    def test_periodic_flush(self, tmp_path: Path) -> None:
+        """Test that the background thread flushes idle buffers."""
+        log_file = tmp_path / "buffered.log"
+        handler = BufferedFileHandler(str(log_file), buffer_size=1024, flush_interval=0.01)
+        try:
+            handler.handle(_record("idle"))
+            deadline = time.monotonic() + 2
+            while log_file.read_text() == "" and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert log_file.read_text() == "idle\n"
+        finally:
+            handler.close()
+
+    def test_close_under_lock_does_not_deadlock(self, tmp_path: Path) -> None:
+        """Test the logging.shutdown() sequence: acquire, flush, close, release."""
+        log_file = tmp_path / "buffered.log"
+        handler = BufferedFileHandler(str(log_file), buffer_size=1024, flush_interval=0.001)
+        handler.handle(_record("last"))
+
+        def shutdown() -> None:
+            handler.acquire()
+            try:
+                # Give the flusher time to block on the lock we hold
+                time.sleep(0.05)
+                handler.flush()
+                handler.close()
+            finally:
+                handler.release()
+
+        closing = threading.Thread(target=shutdown, daemon=True)
+        closing.start()
+        closing.join(timeout=10)
+        assert not closing.is_alive()
+        assert log_file.read_text() == "last\n"
+
+    def test_close_writes_pending_records(self, tmp_path: Path) -> None:
+        """Test that closing the handler writes buffered records."""
+        log_file = tmp_path / "buffered.log"
+        handler = BufferedFileHandler(str(log_file), buffer_size=1024, flush_interval=0)
+        handler.handle(_record("pending"))
+        handler.close()
+        assert log_file.read_text() == "pending\n"
+
+
+class TestCompressingRotatingFileHandler:
+    """Test suite for CompressingRotatingFileHandler."""
+
+    def test_rotates_by_size(self, tmp_path: Path) -> None:
+        """Test that the file is rotated before it would exceed max_bytes."""
+        log_file = tmp_path / "app.log"
+        handler = CompressingRotatingFileHandler(str(log_file), max_bytes=20)
+        for msg in ("a" * 9, "b" * 9, "c" * 9):
+            handler.handle(_record(msg))
+        handler.close()
+
+        segments = sorted(p.name for p in tmp_path.iterdir() if p.name != "app.log")
+        assert len(segments) == 1
+        assert (tmp_path / segments[0]).read_text() == "a" * 9 + "\n" + "b" * 9 + "\n"
+        assert log_file.read_text() == "c" * 9 + "\n"
+
+    def test_max_bytes_counts_encoded_bytes(self, tmp_path: Path) -> None:
+        """Test that non-ASCII records are measured in bytes, not characters."""
+        log_file = tmp_path / "app.log"
+        handler = CompressingRotatingFileHandler(str(log_file), encoding="utf-8", max_bytes=100)
+        for _ in range(20):
+            handler.handle(_record("日志" * 5))
+        handler.close()
+
+        for path in tmp_path.iterdir():
+            assert path.stat().st_size <= 100
+
+    def test_rotates_by_interval(self, tmp_path: Path) -> None:
+        """Test that a record past the interval boundary triggers rotation."""
+        log_file = tmp_path / "app.log"
+        handler = CompressingRotatingFileHandler(str(log_file), rotate_interval=60)
+        handler.handle(_record("before"))
+        late = _record("after")
+        late.created += 120
+        handler.handle(late)
+        handler.close()
+
+        assert log_file.read_text() == "after\n"
+        assert len(list(tmp_path.iterdir())) == 2
+
+    def test_gzip_compression_in_background(self, tmp_path: Path) -> None:
+        """Test that rotated segments are gzip-compressed off the logging thread."""
+        log_file = tmp_path / "app.log"
+        handler = CompressingRotatingFileHandler(str(log_file), max_bytes=10, compress="gzip")
+        handler.handle(_record("first line"))
+        handler.handle(_record("second line"))
+        handler.wait_for_compression()
+
+        compressed = [p for p in tmp_path.iterdir() if p.suffix == ".gz"]
+        assert len(compressed) == 1
+        assert gzip.decompress(compressed[0].read_bytes()) == b"first line\n"
+        handler.close()
+
+    def test_backup_count_prunes_old_segments(self, tmp_path: Path) -> None:
+        """Test that the newest backup_count segments are kept, even within one second."""
+        log_file = tmp_path / "app.log"
+        handler = CompressingRotatingFileHandler(
+            str(log_file), max_bytes=5, backup_count=2, compress="gzip"
+        )
+        for i in range(8):
+            record = _record(f"line{i}")
+            record.created = 1_700_000_000.0
+            handler.handle(record)
+            handler.wait_for_compression()
+        handler.close()
+
+        segments = sorted(p.name for p in tmp_path.iterdir() if p.name != "app.log")
+        assert [gzip.decompress((tmp_path / name).read_bytes()) for name in segments] == [
+            b"line5\n",
+            b"line6\n",
+        ]
+        assert log_file.read_text() == "line7\n"
+
+    def test_sequence_continues_after_reopen(self, tmp_path: Path) -> None:
+        """Test that a reopened handler never reuses a segment number."""
+        log_file = tmp_path / "app.log"
+        for run in range(2):
+            handler = CompressingRotatingFileHandler(str(log_file), max_bytes=5)
+            handler.handle(_record(f"run{run}a"))
+            handler.handle(_record(f"run{run}b"))
+            handler.close()
+
+        segments = sorted(p.name for p in tmp_path.iterdir() if p.name != "app.log")
+        assert [name.rsplit("-", 1)[1] for name in segments] == ["000000", "000001", "000002"]
+
+    def test_compression_failure_keeps_segment(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that a failed compression is reported and leaves no partial output."""
+
+        def broken(source: str, target: str) -> None:
+            Path(target).write_bytes(b"partial")
+            raise OSError("disk full")
+
+        monkeypatch.setitem(handlers._COMPRESSORS, "gzip", (".gz", broken))
+        log_file = tmp_path / "app.log"
+        handler = CompressingRotatingFileHandler(str(log_file), max_bytes=5, compress="gzip")
+        handler.handle(_record("line0"))
+        handler.handle(_record("line1"))
+        handler.close()
+
+        segments = [p.name for p in tmp_path.iterdir() if p.name != "app.log"]
+        assert len(segments) == 1
+        assert not segments[0].endswith(".gz")
+        assert (tmp_path / segments[0]).read_text() == "line0\n"
+        assert "disk full" in capsys.readouterr().err
+
+    def test_invalid_compression(self, tmp_path: Path) -> None:
+        """Test that an unknown compression method is rejected."""
+        with pytest.raises(ValueError, match="Unknown compression"):
+            CompressingRotatingFileHandler(str(tmp_path / "app.log"), compress="rar")
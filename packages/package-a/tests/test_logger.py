@@ -1,10 +1,21 @@
 """Tests for logging utilities."""
 
+import json
 import logging
+import queue
 import tempfile
+import threading
 from pathlib import Path
 
-from package_a.logger import setup_logger
+import pytest
+
+from package_a.filters import RateLimitFilter, SamplingFilter
+from package_a.handlers import (
+    BoundedQueueHandler,
+    BufferedFileHandler,
+    CompressingRotatingFileHandler,
+)
+from package_a.logger import release_logger, setup_logger, shutdown_loggers
 
 
 class TestSetupLogger:
@@ -50,3 +61,208 @@ class TestSetupLogger:
             logger = setup_logger("test_logger_both", log_file=str(log_file))
             # Should have console handler + file handler
             assert len(logger.handlers) == 2
+
+    def test_setup_logger_async_mode(self) -> None:
+        """Test that async mode delivers records through a queue handler."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = Path(tmpdir) / "test.log"
+
+            logger = setup_logger("test_logger_async", log_file=str(log_file), async_mode=True)
+            assert len(logger.handlers) == 1
+            assert isinstance(logger.handlers[0], BoundedQueueHandler)
+
+            logger.info("Async message")
+            shutdown_loggers()
+
+            assert "Async message" in log_file.read_text()
+
+    def test_setup_logger_async_invalid_overflow(self) -> None:
+        """Test that an invalid overflow policy is rejected."""
+        with pytest.raises(ValueError):
+            setup_logger("test_logger_async_invalid", async_mode=True, overflow="explode")
+
+    def test_setup_logger_buffered_file(self) -> None:
+        """Test that buffer_size selects a buffered file handler."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = Path(tmpdir) / "test.log"
+
+            logger = setup_logger("test_logger_buffered", log_file=str(log_file), buffer_size=4096)
+            file_handler = logger.handlers[1]
+            assert isinstance(file_handler, BufferedFileHandler)
+
+            logger.info("Buffered message")
+            file_handler.flush()
+            assert "Buffered message" in log_file.read_text()
+            release_logger("test_logger_buffered")
+
+    def test_setup_logger_rotation(self) -> None:
+        """Test that rotation options select a rotating file handler."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = Path(tmpdir) / "test.log"
+
+            logger = setup_logger("test_logger_rotating", log_file=str(log_file), max_bytes=1024)
+            file_handler = logger.handlers[1]
+            assert isinstance(file_handler, CompressingRotatingFileHandler)
+            assert file_handler.max_bytes == 1024
+            release_logger("test_logger_rotating")
+
+    def test_setup_logger_json_format(self) -> None:
+        """Test that log_format="json" writes NDJSON lines."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = Path(tmpdir) / "test.log"
+
+            logger = setup_logger(
+                "test_logger_json",
+                log_file=str(log_file),
+                log_format="json",
+                static_fields={"service": "demo"},
+            )
+            logger.info("Structured message", extra={"user": "alice"})
+
+            data = json.loads(log_file.read_text().splitlines()[0])
+            assert data["message"] == "Structured message"
+            assert data["service"] == "demo"
+            assert data["user"] == "alice"
+
+    def test_setup_logger_invalid_format(self) -> None:
+        """Test that an unknown log format is rejected."""
+        with pytest.raises(ValueError, match="Unknown log format"):
+            setup_logger("test_logger_bad_format", log_format="xml")
+
+
+class TestLoggerRegistry:
+    """Test suite for setup_logger handler reuse."""
+
+    def test_repeated_call_keeps_handlers(self) -> None:
+        """Test that a repeated call with the same arguments is a no-op."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = str(Path(tmpdir) / "test.log")
+
+            logger = setup_logger("test_registry_repeat", log_file=log_file)
+            handlers = list(logger.handlers)
+            assert setup_logger("test_registry_repeat", log_file=log_file) is logger
+            assert logger.handlers == handlers
+            release_logger("test_registry_repeat")
+
+    def test_level_change_keeps_handlers(self) -> None:
+        """Test that changing only the level does not rebuild handlers."""
+        logger = setup_logger("test_registry_level")
+        handlers = list(logger.handlers)
+        setup_logger("test_registry_level", level=logging.DEBUG)
+        assert logger.level == logging.DEBUG
+        assert logger.handlers == handlers
+        release_logger("test_registry_level")
+
+    def test_shared_file_handler(self) -> None:
+        """Test that loggers writing the same file share one handler."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = str(Path(tmpdir) / "shared.log")
+
+            first = setup_logger("test_registry_shared_a", log_file=log_file)
+            second = setup_logger("test_registry_shared_b", log_file=log_file)
+            assert first.handlers[1] is second.handlers[1]
+
+            first.info("from a")
+            second.info("from b")
+            content = Path(log_file).read_text()
+            assert "from a" in content and "from b" in content
+
+            release_logger("test_registry_shared_a")
+            assert second.handlers[1].stream is not None
+            release_logger("test_registry_shared_b")
+            assert second.handlers == []
+
+    def test_reconfigure_closes_unused_file(self) -> None:
+        """Test that switching files closes the previous file handler."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = setup_logger("test_registry_switch", log_file=str(Path(tmpdir) / "a.log"))
+            old_handler = logger.handlers[1]
+            assert isinstance(old_handler, logging.FileHandler)
+
+            setup_logger("test_registry_switch", log_file=str(Path(tmpdir) / "b.log"))
+            assert old_handler.stream is None
+            assert logger.handlers[1] is not old_handler
+            release_logger("test_registry_switch")
+
+    def test_reconfigure_async_while_logging(self) -> None:
+        """Test that reconfiguring an async logger under load neither hangs nor strands writers."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = str(Path(tmpdir) / "load.log")
+            logger = setup_logger("test_registry_load", log_file=log_file, async_mode=True)
+            stop = threading.Event()
+
+            def write() -> None:
+                while not stop.is_set():
+                    logger.debug("load")
+
+            def reconfigure() -> None:
+                for i in range(20):
+                    setup_logger(
+                        "test_registry_load",
+                        level=logging.DEBUG,
+                        log_file=log_file,
+                        async_mode=True,
+                        queue_size=2 + i % 2,
+                    )
+
+            writers = [threading.Thread(target=write, daemon=True) for _ in range(4)]
+            for writer in writers:
+                writer.start()
+            reconfiguring = threading.Thread(target=reconfigure, daemon=True)
+            reconfiguring.start()
+            reconfiguring.join(timeout=30)
+            stop.set()
+            for writer in writers:
+                writer.join(timeout=10)
+            release_logger("test_registry_load")
+
+            assert not reconfiguring.is_alive()
+            assert not any(writer.is_alive() for writer in writers)
+
+    def test_replaced_handlers_are_rebuilt(self) -> None:
+        """Test that handlers removed by other code are reinstalled."""
+        logger = setup_logger("test_registry_cleared")
+        logger.handlers = []
+        setup_logger("test_registry_cleared")
+        assert len(logger.handlers) == 1
+        release_logger("test_registry_cleared")
+
+    def test_log_queue_sends_records(self) -> None:
+        """Test that log_queue replaces local handlers with a queue handler."""
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue()
+        logger = setup_logger("test_registry_queue", log_queue=log_queue)
+        assert len(logger.handlers) == 1
+
+        logger.info("queued %s", "record")
+        assert log_queue.get_nowait().getMessage() == "queued record"
+        release_logger("test_registry_queue")
+
+    def test_rate_limit_filter_installed_and_replaced(self) -> None:
+        """Test that rate_limit adds a logger filter that is removed on reconfigure."""
+        logger = setup_logger("test_registry_rate", rate_limit=5)
+        assert any(isinstance(f, RateLimitFilter) for f in logger.filters)
+
+        setup_logger("test_registry_rate")
+        assert not logger.filters
+        release_logger("test_registry_rate")
+
+    def test_release_reports_suppressed_records(self) -> None:
+        """Test that releasing a rate-limited logger logs its pending summaries."""
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue()
+        logger = setup_logger(
+            "test_registry_rate_release", log_queue=log_queue, rate_limit=1, rate_burst=1
+        )
+        for _ in range(3):
+            logger.error("flood")
+        release_logger("test_registry_rate_release")
+
+        messages = [log_queue.get_nowait().getMessage() for _ in range(log_queue.qsize())]
+        assert messages == ["flood", "flood [suppressed 2 duplicates]"]
+
+    def test_sampling_filter_runs_before_rate_limit(self) -> None:
+        """Test that sample_rates installs a sampling filter ahead of rate limiting."""
+        logger = setup_logger(
+            "test_registry_sampling", sample_rates={logging.DEBUG: 0.1}, rate_limit=5
+        )
+        assert [type(f) for f in logger.filters] == [SamplingFilter, RateLimitFilter]
+        release_logger("test_registry_sampling")
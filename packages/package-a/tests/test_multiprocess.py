@@ -0,0 +1,73 @@
+"""Tests for multiprocess log aggregation."""
+
+import logging
+import multiprocessing
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from package_a.logger import release_logger, setup_logger
+from package_a.multiprocess import LogAggregator
+
+fork_only = pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="requires fork start method"
+)
+
+
+def _log_from_worker(log_queue: Any, worker: int, count: int) -> None:
+    logger = setup_logger(f"test_mp_worker_{worker}", log_queue=log_queue)
+    for i in range(count):
+        logger.info("worker %d line %d %s", worker, i, "x" * 200)
+
+
+class TestLogAggregator:
+    """Test suite for LogAggregator."""
+
+    @fork_only
+    def test_workers_write_complete_lines(self, tmp_path: Path) -> None:
+        """Test that records from several processes arrive as whole lines."""
+        log_file = tmp_path / "agg.log"
+        context = multiprocessing.get_context("fork")
+
+        with LogAggregator(str(log_file), mp_context=context) as aggregator:
+            workers = [
+                context.Process(target=_log_from_worker, args=(aggregator.queue, n, 50))
+                for n in range(4)
+            ]
+            for process in workers:
+                process.start()
+            for process in workers:
+                process.join()
+
+        lines = log_file.read_text().splitlines()
+        assert len(lines) == 200
+        assert all(line.endswith("x" * 200) for line in lines)
+        for n in range(4):
+            assert sum(f"worker {n} line" in line for line in lines) == 50
+
+    @fork_only
+    def test_level_filter(self, tmp_path: Path) -> None:
+        """Test that the aggregator drops records below its level."""
+        log_file = tmp_path / "agg.log"
+        context = multiprocessing.get_context("fork")
+
+        with LogAggregator(str(log_file), level=logging.WARNING, mp_context=context) as aggregator:
+            logger = setup_logger("test_mp_level", level=logging.DEBUG, log_queue=aggregator.queue)
+            logger.info("dropped")
+            logger.warning("kept")
+            release_logger("test_mp_level")
+
+        assert log_file.read_text().count("\n") == 1
+        assert "kept" in log_file.read_text()
+
+    def test_stop_without_start(self, tmp_path: Path) -> None:
+        """Test that stopping an aggregator that never started is a no-op."""
+        aggregator = LogAggregator(str(tmp_path / "agg.log"))
+        aggregator.stop()
+        assert not aggregator.running
+
+    def test_invalid_format_fails_in_parent(self, tmp_path: Path) -> None:
+        """Test that configuration errors surface before a process is started."""
+        with pytest.raises(ValueError, match="Unknown log format"):
+            LogAggregator(str(tmp_path / "agg.log"), log_format="xml")
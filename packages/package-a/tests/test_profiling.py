@@ -0,0 +1,71 @@
+"""Tests for import-time profiling."""
+
+import io
+import sys
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from package_a.profiling import ImportProfiler
+
+
+@pytest.fixture
+def fake_modules(tmp_path: Path) -> Iterator[Path]:
+    """Create importable modules where one imports the other."""
+    (tmp_path / "profiled_outer.py").write_text("import profiled_inner\n")
+    (tmp_path / "profiled_inner.py").write_text("VALUE = 1\n")
+    sys.path.insert(0, str(tmp_path))
+    try:
+        yield tmp_path
+    finally:
+        sys.path.remove(str(tmp_path))
+        for name in ("profiled_outer", "profiled_inner"):
+            sys.modules.pop(name, None)
+
+
+class TestImportProfiler:
+    """Test suite for ImportProfiler."""
+
+    def test_records_nested_imports(self, fake_modules: Path) -> None:
+        """Test that nested imports are recorded with depth and timings."""
+        profiler = ImportProfiler()
+        profiler.install()
+        try:
+            import profiled_outer  # noqa: F401
+        finally:
+            profiler.uninstall()
+
+        records = {name: rest for name, *rest in profiler.records}
+        assert [name for name, *_ in profiler.records] == ["profiled_inner", "profiled_outer"]
+        assert records["profiled_inner"][2] == 1
+        assert records["profiled_outer"][2] == 0
+        assert records["profiled_outer"][1] >= records["profiled_inner"][1]
+        assert sys.modules["profiled_inner"].VALUE == 1
+
+    def test_uninstall_stops_recording(self, fake_modules: Path) -> None:
+        """Test that imports after uninstall are not measured."""
+        profiler = ImportProfiler()
+        profiler.install()
+        profiler.uninstall()
+        import profiled_inner  # noqa: F401
+
+        assert profiler.records == []
+        assert profiler not in sys.meta_path
+
+    def test_report_format(self, fake_modules: Path) -> None:
+        """Test that the report mirrors the -X importtime layout."""
+        profiler = ImportProfiler()
+        profiler.install()
+        try:
+            import profiled_outer  # noqa: F401
+        finally:
+            profiler.uninstall()
+
+        stream = io.StringIO()
+        profiler.report(stream)
+        lines = stream.getvalue().splitlines()
+        assert lines[0] == "import time: self [us] | cumulative | imported package"
+        assert lines[1].endswith("|   profiled_inner")
+        assert lines[2].endswith("| profiled_outer")
+        assert lines[-1].startswith("startup profile: 2 modules imported")
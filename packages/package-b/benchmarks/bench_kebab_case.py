@@ -0,0 +1,80 @@
+"""Benchmark kebab_case on 1M mixed, heavily repeating identifiers.
+
+Usage:
+    python benchmarks/bench_kebab_case.py [--count N] [--distinct N] [--cache-size N]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from package_b.strings import configure_kebab_cache, kebab_cache_info, kebab_case  # noqa: E402
+
+
+def kebab_case_baseline(text: str) -> str:
+    """The original implementation: import and string patterns on every call."""
+    import re
+
+    text = re.sub(r"[\s_]+", "-", text)
+    text = re.sub(r"([a-z])([A-Z])", r"\1-\2", text)
+    return text.lower()
+
+
+def make_inputs(count: int, distinct: int, seed: int = 42) -> List[str]:
+    """Build `count` identifiers drawn from `distinct` camel, snake and spaced forms."""
+    rng = random.Random(seed)
+    words = ["user", "account", "id", "created", "at", "http", "server", "total", "amount", "name"]
+    pool = []
+    for _ in range(distinct):
+        parts = rng.sample(words, rng.randint(2, 4))
+        style = rng.randrange(3)
+        if style == 0:
+            pool.append(parts[0] + "".join(p.title() for p in parts[1:]))
+        elif style == 1:
+            pool.append("_".join(parts))
+        else:
+            pool.append(" ".join(p.title() for p in parts))
+    return [rng.choice(pool) for _ in range(count)]
+
+
+def run(label: str, func: Callable[[str], str], inputs: List[str]) -> float:
+    start = time.perf_counter()
+    for text in inputs:
+        func(text)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed:8.3f} s  {len(inputs) / elapsed / 1e6:6.2f} M/s")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--distinct", type=int, default=5_000)
+    parser.add_argument("--cache-size", type=int, default=8_192)
+    args = parser.parse_args()
+
+    inputs = make_inputs(args.count, args.distinct)
+
+    baseline = run("baseline (re.sub strings)", kebab_case_baseline, inputs)
+    configure_kebab_cache(0)
+    compiled = run("compiled patterns", kebab_case, inputs)
+    configure_kebab_cache(args.cache_size)
+    cached = run(f"compiled + LRU({args.cache_size})", kebab_case, inputs)
+
+    print(f"\ncompiled speedup: {baseline / compiled:5.2f}x")
+    print(f"cached speedup:   {baseline / cached:5.2f}x")
+    print(f"cache stats:      {kebab_cache_info()}")
+
+    configure_kebab_cache(0)
+    assert [kebab_case(t) for t in inputs[:10_000]] == [
+        kebab_case_baseline(t) for t in inputs[:10_000]
+    ]
+
+
+if __name__ == "__main__":
+    main()
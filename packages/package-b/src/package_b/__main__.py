@@ -1,21 +1,122 @@
 """Main entry point for package-b executable."""
 
+import argparse
+import multiprocessing
 import sys
+from typing import Iterator, List, Optional, Tuple
 
-try:
-    from rich.console import Console
-    from rich.table import Table
-    from rich.panel import Panel
-except ImportError as e:
-    print(f"ERROR: Required dependency 'rich' not found: {e}", file=sys.stderr)
-    print("Please install with: pip install rich>=13.0.0", file=sys.stderr)
-    sys.exit(1)
+from package_b.render import FORMATS, render_rows, resolve_format
+from package_b.stream import CHUNK_SIZE, OPERATIONS, transform_stream
+from package_b.strings import configure_kebab_cache, kebab_case, truncate_display
 
-from package_b.strings import truncate, kebab_case
 
+def _parse_args(argv: List[str]) -> argparse.Namespace:
+    """Parse command line arguments; no subcommand runs the demo."""
+    parser = argparse.ArgumentParser(prog="package-b", description="Package B - String Utilities")
+    parser.add_argument(
+        "--format",
+        default="auto",
+        choices=FORMATS,
+        help="Demo table format; auto uses rich on a terminal and TSV otherwise (default: auto)",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    transform = subparsers.add_parser(
+        "transform", help="Transform stdin line by line and write the result to stdout"
+    )
+    transform.add_argument("--op", required=True, choices=OPERATIONS, help="Operation to apply")
+    transform.add_argument(
+        "--max-len", type=int, default=80, help="Maximum line length for --op truncate"
+    )
+    transform.add_argument("--suffix", default="...", help="Suffix for truncated lines")
+    transform.add_argument(
+        "--cache-size",
+        type=int,
+        default=65536,
+        help="kebab_case memo size for --op kebab; 0 disables it (default: 65536)",
+    )
+    transform.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for large inputs; 0 uses every CPU (default: 1)",
+    )
+    return parser.parse_args(argv)
 
-def main():
+
+def main(argv: Optional[List[str]] = None) -> None:
     """Main function for package-b CLI."""
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+    if args.command == "transform":
+        _run_transform(args)
+    else:
+        _run_demo(args.format)
+
+
+def _run_transform(args: argparse.Namespace) -> None:
+    """Stream stdin through a strings operation to stdout."""
+    if args.op == "kebab":
+        configure_kebab_cache(args.cache_size)
+
+    # Large buffers on both ends; surrogateescape round-trips undecodable bytes
+    source = open(
+        sys.stdin.fileno(),
+        "r",
+        buffering=CHUNK_SIZE,
+        encoding="utf-8",
+        errors="surrogateescape",
+        closefd=False,
+    )
+    destination = open(
+        sys.stdout.fileno(),
+        "w",
+        buffering=CHUNK_SIZE,
+        encoding="utf-8",
+        errors="surrogateescape",
+        newline="\n",
+        closefd=False,
+    )
+    try:
+        transform_stream(source, destination, args.op, args.max_len, args.suffix, jobs=args.jobs)
+        destination.flush()
+    except BrokenPipeError:
+        # Downstream closed early (e.g. `| head`); nothing left to report
+        sys.exit(0)
+    except Exception as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+DEMO_COLUMNS = ("Original", "Truncated", "Kebab Case")
+
+DEMO_CASES = [
+    ("Hello World From Package B", 15),
+    ("This is a very long string that needs truncation", 20),
+    ("Short", 50),
+]
+
+
+def _demo_rows() -> Iterator[Tuple[str, str, str]]:
+    for text, max_len in DEMO_CASES:
+        # Table cells are sized in terminal columns, not code points
+        yield text, truncate_display(text, max_len), kebab_case(text)
+
+
+def _run_demo(fmt: str = "auto") -> None:
+    """Render the demonstration table; plain formats skip rich entirely."""
+    fmt = resolve_format(fmt, sys.stdout)
+    if fmt != "rich":
+        render_rows(DEMO_COLUMNS, _demo_rows(), fmt)
+        return
+
+    try:
+        from rich.console import Console
+        from rich.panel import Panel
+    except ImportError as e:
+        print(f"ERROR: Required dependency 'rich' not found: {e}", file=sys.stderr)
+        print("Please install with: pip install rich>=13.0.0", file=sys.stderr)
+        sys.exit(1)
+
     console = Console()
 
     # Display header
@@ -24,28 +125,18 @@ def main():
     )
 
     try:
-        # Test string utilities
-        test_cases = [
-            ("Hello World From Package B", 15),
-            ("This is a very long string that needs truncation", 20),
-            ("Short", 50),
-        ]
-
         console.print("\n[green]✓ Rich dependency loaded successfully[/green]")
         console.print("[green]✓ String utilities initialized[/green]\n")
 
-        # Create results table
-        table = Table(title="String Utility Demonstrations", border_style="blue")
-        table.add_column("Original", style="yellow")
-        table.add_column("Truncated", style="cyan")
-        table.add_column("Kebab Case", style="magenta")
-
-        for text, max_len in test_cases:
-            truncated = truncate(text, max_len)
-            kebab = kebab_case(text)
-            table.add_row(text, truncated, kebab)
-
-        console.print(table)
+        # Rows are streamed to the console in batches rather than built into one Table
+        render_rows(
+            DEMO_COLUMNS,
+            _demo_rows(),
+            "rich",
+            out=sys.stdout,
+            title="String Utility Demonstrations",
+            styles=("yellow", "cyan", "magenta"),
+        )
 
         console.print("\n[bold green]" + "=" * 60 + "[/bold green]")
         console.print("[bold green]Package B executed successfully![/bold green]")
@@ -57,4 +148,8 @@ def main():
 
 
 if __name__ == "__main__":
+    # transform --jobs starts worker processes; in the frozen binary they are
+    # spawned by re-running this entry point (the default on macOS and
+    # Windows), and freeze_support() turns them into workers instead
+    multiprocessing.freeze_support()
     main()
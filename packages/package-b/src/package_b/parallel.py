@@ -0,0 +1,186 @@
+"""Process-pool execution of package_b.strings batch operations."""
+
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from itertools import chain, islice
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Optional, TypeVar
+
+from package_b.strings import kebab_case, truncate_many
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+CHUNK_SIZE = 10000
+SERIAL_THRESHOLD = 50000
+
+
+def iter_chunks(items: Iterable[T], chunk_size: int = CHUNK_SIZE) -> Iterator[List[T]]:
+    """
+    Split an iterable into lists of at most chunk_size items.
+
+    Args:
+        items: Items to split; consumed lazily
+        chunk_size: Items per chunk (default: 10000)
+
+    Yields:
+        Consecutive chunks in input order
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def map_batches(
+    func: Callable[[List[T]], List[R]],
+    batches: Iterable[List[T]],
+    workers: Optional[int] = None,
+    max_pending: Optional[int] = None,
+    mp_context: Optional[Any] = None,
+) -> Iterator[List[R]]:
+    """
+    Apply a batch function to each batch in a process pool, in order.
+
+    At most ``max_pending`` batches are in flight, so input is read and
+    results are yielded as the pool makes progress rather than all at once.
+    A single batch, or ``workers=1``, is processed in this process.
+
+    Args:
+        func: Picklable function mapping a batch to a batch of results,
+            e.g. a module-level function or a functools.partial of one
+        batches: Batches of items, e.g. from iter_chunks()
+        workers: Worker processes (default: os.cpu_count())
+        max_pending: Batches submitted ahead of the one being yielded
+            (default: 2 * workers)
+        mp_context: multiprocessing context for the pool (default: platform default)
+
+    Yields:
+        Result batches in input order
+    """
+    workers = workers or os.cpu_count() or 1
+    iterator = iter(batches)
+    head = list(islice(iterator, 2))
+    if workers == 1 or len(head) < 2:
+        for batch in chain(head, iterator):
+            yield func(batch)
+        return
+
+    max_pending = max_pending or 2 * workers
+    pending: Deque["Future[List[R]]"] = deque()
+    executor = ProcessPoolExecutor(max_workers=workers, mp_context=mp_context)
+    try:
+        for batch in chain(head, iterator):
+            pending.append(executor.submit(func, batch))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        # Also reached when the consumer stops early: drop unstarted work
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def parallel_map(
+    func: Callable[[List[T]], List[R]],
+    items: Iterable[T],
+    chunk_size: int = CHUNK_SIZE,
+    workers: Optional[int] = None,
+    serial_threshold: int = SERIAL_THRESHOLD,
+    mp_context: Optional[Any] = None,
+) -> Iterator[R]:
+    """
+    Apply a batch function to items in chunks across a process pool.
+
+    Up to ``serial_threshold`` items are read first; if the input ends
+    there, it is processed in this process, where pickling and worker
+    start-up would cost more than the work itself.
+
+    Args:
+        func: Picklable function mapping a list of items to a list of results
+        items: Items to process; consumed lazily
+        chunk_size: Items sent to a worker at a time (default: 10000)
+        workers: Worker processes (default: os.cpu_count())
+        serial_threshold: Inputs up to this size run serially (default: 50000)
+        mp_context: multiprocessing context for the pool (default: platform default)
+
+    Yields:
+        Results in input order
+    """
+    iterator = iter(items)
+    head = list(islice(iterator, serial_threshold + 1))
+    if len(head) <= serial_threshold:
+        if head:
+            yield from func(head)
+        return
+
+    chunks = iter_chunks(chain(head, iterator), chunk_size)
+    for results in map_batches(func, chunks, workers, mp_context=mp_context):
+        yield from results
+
+
+def map_each(func: Callable[[T], R], items: List[T]) -> List[R]:
+    """
+    Apply a per-item function to a batch; picklable via functools.partial.
+
+    Args:
+        func: Module-level function applied to each item
+        items: Batch of items
+
+    Returns:
+        Results in input order
+    """
+    return list(map(func, items))
+
+
+def parallel_truncate(
+    texts: Iterable[str],
+    max_length: int,
+    suffix: str = "...",
+    chunk_size: int = CHUNK_SIZE,
+    workers: Optional[int] = None,
+    serial_threshold: int = SERIAL_THRESHOLD,
+) -> Iterator[str]:
+    """
+    Truncate strings across a process pool, with the same rules as truncate().
+
+    Args:
+        texts: Strings to truncate; consumed lazily
+        max_length: Maximum length of each result
+        suffix: Suffix to add if truncated (default: "...")
+        chunk_size: Strings sent to a worker at a time (default: 10000)
+        workers: Worker processes (default: os.cpu_count())
+        serial_threshold: Inputs up to this size run serially (default: 50000)
+
+    Returns:
+        Iterator over the truncated strings in input order
+    """
+    func = partial(truncate_many, max_length=max_length, suffix=suffix)
+    return parallel_map(func, texts, chunk_size, workers, serial_threshold)
+
+
+def parallel_kebab_case(
+    texts: Iterable[str],
+    chunk_size: int = CHUNK_SIZE,
+    workers: Optional[int] = None,
+    serial_threshold: int = SERIAL_THRESHOLD,
+) -> Iterator[str]:
+    """
+    Convert strings to kebab-case across a process pool.
+
+    Args:
+        texts: Strings to convert; consumed lazily
+        chunk_size: Strings sent to a worker at a time (default: 10000)
+        workers: Worker processes (default: os.cpu_count())
+        serial_threshold: Inputs up to this size run serially (default: 50000)
+
+    Returns:
+        Iterator over the kebab-case strings in input order
+    """
+    func = partial(map_each, kebab_case)
+    return parallel_map(func, texts, chunk_size, workers, serial_threshold)
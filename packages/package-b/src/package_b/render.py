@@ -0,0 +1,210 @@
+"""Table output for package-b: rich on a terminal, plain text formats otherwise."""
+
+import sys
+from itertools import islice
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, TextIO
+
+FORMATS = ("auto", "rich", "tsv", "csv", "ndjson")
+
+BATCH_SIZE = 1000
+SAMPLE_SIZE = 1000
+
+_TSV_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def resolve_format(fmt: str, out: TextIO) -> str:
+    """
+    Resolve "auto" to "rich" for a terminal and "tsv" for anything else.
+
+    Args:
+        fmt: One of "auto", "rich", "tsv", "csv", "ndjson"
+        out: Stream the table will be written to
+
+    Returns:
+        Concrete output format
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format {fmt!r}, expected one of {FORMATS}")
+    if fmt != "auto":
+        return fmt
+    isatty = getattr(out, "isatty", None)
+    return "rich" if isatty is not None and isatty() else "tsv"
+
+
+def _batches(rows: Iterable[Sequence[Any]], batch_size: int) -> Iterator[List[Sequence[Any]]]:
+    iterator = iter(rows)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def render_rows(
+    columns: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+    fmt: str = "auto",
+    out: Optional[TextIO] = None,
+    title: Optional[str] = None,
+    styles: Optional[Sequence[str]] = None,
+    batch_size: int = BATCH_SIZE,
+) -> int:
+    """
+    Write rows as a table, streaming them in batches.
+
+    Rows are consumed lazily and never held in memory all at once, in any
+    format. The plain formats write a header line and then one line per
+    row; the title is only shown by "rich". "rich" sizes its columns from
+    the header and the first 1000 rows, which are held back until
+    measured; longer values after that are cut with an ellipsis.
+
+    Args:
+        columns: Column headers
+        rows: Row values, one per column; values are converted with str()
+        fmt: "auto", "rich", "tsv", "csv" or "ndjson" (default: "auto")
+        out: Output stream (default: sys.stdout)
+        title: Table title for "rich" (default: None)
+        styles: Per-column styles for "rich" (default: None)
+        batch_size: Rows rendered per write (default: 1000)
+
+    Returns:
+        Number of rows written
+    """
+    if out is None:
+        out = sys.stdout
+    fmt = resolve_format(fmt, out)
+    batches = _batches(rows, batch_size)
+    if fmt == "rich":
+        return _render_rich(columns, batches, out, title, styles)
+    if fmt == "csv":
+        return _render_csv(columns, batches, out)
+    if fmt == "ndjson":
+        return _render_ndjson(columns, batches, out)
+    return _render_tsv(columns, batches, out)
+
+
+def _render_tsv(columns: Sequence[str], batches: Iterable[List[Sequence[Any]]], out: TextIO) -> int:
+    escapes = _TSV_ESCAPES
+    out.write("\t".join([str(column).translate(escapes) for column in columns]) + "\n")
+    count = 0
+    for batch in batches:
+        lines = ["\t".join([str(value).translate(escapes) for value in row]) for row in batch]
+        out.write("\n".join(lines) + "\n")
+        count += len(batch)
+    return count
+
+
+def _render_csv(columns: Sequence[str], batches: Iterable[List[Sequence[Any]]], out: TextIO) -> int:
+    import csv
+
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(columns)
+    count = 0
+    for batch in batches:
+        writer.writerows(batch)
+        count += len(batch)
+    return count
+
+
+def _render_ndjson(
+    columns: Sequence[str], batches: Iterable[List[Sequence[Any]]], out: TextIO
+) -> int:
+    import json
+
+    encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    keys = [str(column) for column in columns]
+    count = 0
+    for batch in batches:
+        out.write("".join([encode(dict(zip(keys, map(str, row)))) + "\n" for row in batch]))
+        count += len(batch)
+    return count
+
+
+def _render_rich(
+    columns: Sequence[str],
+    batches: Iterable[List[Sequence[Any]]],
+    out: TextIO,
+    title: Optional[str],
+    styles: Optional[Sequence[str]],
+) -> int:
+    from rich import box
+    from rich.cells import cell_len
+    from rich.console import Console
+    from rich.table import Table
+    from rich.text import Text
+
+    console = Console(file=out)
+    # Fixed column widths let each batch print as its own borderless table
+    # and still line up with the header and the batches before it. They are
+    # sampled from the first rows, like package-c's fixed-width writer; a
+    # column capped to fit the console wraps rather than cutting sampled
+    # values, and only longer values in uncapped columns get an ellipsis.
+    iterator = iter(batches)
+    held: List[List[Sequence[Any]]] = []
+    sampled = 0
+    for batch in iterator:
+        held.append(batch)
+        sampled += len(batch)
+        if sampled >= SAMPLE_SIZE:
+            break
+    widths = [
+        max(
+            [cell_len(str(column))] + [cell_len(str(row[index])) for batch in held for row in batch]
+        )
+        for index, column in enumerate(columns)
+    ]
+    fitted = _fit_widths(widths, console.width - 3 * (len(columns) - 1))
+
+    def new_table(first: bool) -> Any:
+        table = Table(
+            title=title if first else None,
+            box=box.SIMPLE_HEAD,
+            show_header=first,
+            show_edge=False,
+            pad_edge=False,
+        )
+        for index, column in enumerate(columns):
+            capped = fitted[index] < widths[index]
+            table.add_column(
+                column,
+                style=styles[index] if styles else "",
+                width=fitted[index],
+                no_wrap=not capped,
+                overflow="fold" if capped else "ellipsis",
+            )
+        return table
+
+    count = 0
+    for batch in _chain(held, iterator):
+        table = new_table(first=count == 0)
+        for row in batch:
+            # Text skips markup parsing: values are data, not rich markup
+            table.add_row(*[Text(str(value)) for value in row])
+        console.print(table)
+        count += len(batch)
+    if count == 0:
+        console.print(new_table(first=True))
+    return count
+
+
+def _fit_widths(widths: List[int], available: int) -> List[int]:
+    """Cap the widest columns so the table fits, keeping narrow ones whole."""
+    if sum(widths) <= available:
+        return widths
+    remaining = available
+    ordered = sorted(widths)
+    for index, width in enumerate(ordered):
+        share = remaining // (len(ordered) - index)
+        if width > share:
+            return [min(width, max(4, share)) for width in widths]
+        remaining -= width
+    return widths
+
+
+def _chain(
+    held: List[List[Sequence[Any]]], rest: Iterator[List[Sequence[Any]]]
+) -> Iterator[List[Sequence[Any]]]:
+    # Release sampled batches as they are printed
+    while held:
+        yield held.pop(0)
+    yield from rest
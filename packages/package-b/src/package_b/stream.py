@@ -0,0 +1,134 @@
+"""Streaming line transforms for package-b."""
+
+from functools import partial
+from typing import Callable, Iterable, Iterator, List, TextIO
+
+from package_b.parallel import map_batches, map_each
+from package_b.strings import CASE_STYLES, convert_case, kebab_case, truncate_many
+
+CHUNK_SIZE = 1024 * 1024
+
+OPERATIONS = ("kebab", "truncate") + tuple(style for style in CASE_STYLES if style != "kebab")
+
+
+def iter_line_batches(stream: TextIO, chunk_size: int = CHUNK_SIZE) -> Iterator[List[str]]:
+    """
+    Read a text stream in large chunks and yield its lines in batches.
+
+    Only one chunk (plus a partial trailing line) is held in memory at a time.
+
+    Args:
+        stream: Text stream to read
+        chunk_size: Characters read per call (default: 1 MiB)
+
+    Yields:
+        Lists of complete lines without their line terminators
+    """
+    pending = ""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        lines = (pending + chunk).split("\n") if pending else chunk.split("\n")
+        pending = lines.pop()
+        if lines:
+            yield lines
+    if pending:
+        yield [pending]
+
+
+def line_transform(
+    op: str, max_length: int = 80, suffix: str = "..."
+) -> Callable[[List[str]], List[str]]:
+    """
+    Build a function that applies a package_b.strings operation to a batch of lines.
+
+    Args:
+        op: "kebab", "truncate", or a convert_case() style
+            ("snake", "camel", "pascal", "constant", "dotted")
+        max_length: Maximum line length for "truncate" (default: 80)
+        suffix: Truncation suffix for "truncate" (default: "...")
+
+    Returns:
+        Picklable function mapping a list of lines to a list of transformed lines
+    """
+    if op == "truncate":
+        return partial(truncate_many, max_length=max_length, suffix=suffix)
+    if op == "kebab":
+        return partial(map_each, kebab_case)
+    if op in CASE_STYLES:
+        return partial(_convert_lines, op)
+    raise ValueError(f"Unknown operation {op!r}, expected one of {OPERATIONS}")
+
+
+def _convert_lines(style: str, lines: List[str]) -> List[str]:
+    return [convert_case(line, style) for line in lines]
+
+
+def transform_batches(
+    batches: Iterable[List[str]], transform: Callable[[List[str]], List[str]]
+) -> Iterator[List[str]]:
+    """
+    Lazily apply a batch transform to each batch of lines.
+
+    Args:
+        batches: Batches of lines, e.g. from iter_line_batches()
+        transform: Function from line_transform()
+
+    Yields:
+        Transformed batches
+    """
+    for batch in batches:
+        yield transform(batch)
+
+
+def write_batches(batches: Iterable[List[str]], out: TextIO) -> int:
+    """
+    Write batches of lines, one write call per batch.
+
+    Args:
+        batches: Batches of lines without terminators
+        out: Text stream to write to
+
+    Returns:
+        Number of lines written
+    """
+    count = 0
+    for batch in batches:
+        if batch:
+            out.write("\n".join(batch))
+            out.write("\n")
+            count += len(batch)
+    return count
+
+
+def transform_stream(
+    source: TextIO,
+    destination: TextIO,
+    op: str,
+    max_length: int = 80,
+    suffix: str = "...",
+    chunk_size: int = CHUNK_SIZE,
+    jobs: int = 1,
+) -> int:
+    """
+    Stream lines from source to destination through a strings operation.
+
+    Args:
+        source: Text stream to read
+        destination: Text stream to write
+        op: Operation name, see line_transform()
+        max_length: Maximum line length for "truncate" (default: 80)
+        suffix: Truncation suffix for "truncate" (default: "...")
+        chunk_size: Characters read per call (default: 1 MiB)
+        jobs: Worker processes transforming chunks in parallel; 1 transforms
+            in this process, 0 uses every CPU (default: 1)
+
+    Returns:
+        Number of lines written
+    """
+    transform = line_transform(op, max_length, suffix)
+    batches = iter_line_batches(source, chunk_size)
+    if jobs == 1:
+        return write_batches(transform_batches(batches, transform), destination)
+    return write_batches(map_batches(transform, batches, workers=jobs or None), destination)
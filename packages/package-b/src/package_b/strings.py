@@ -1,5 +1,22 @@
 """String utilities for package-b."""
 
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+_SEPARATORS = re.compile(r"[\s_]+")
+_CAMEL_BOUNDARY = re.compile(r"([a-z])([A-Z])")
+
+
+class CacheInfo(NamedTuple):
+    """Memo statistics, as reported by kebab_cache_info()."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
 
 def truncate(text: str, max_length: int, suffix: str = "...") -> str:
     """
@@ -23,20 +40,380 @@ def truncate(text: str, max_length: int, suffix: str = "...") -> str:
     return text[:available] + suffix
 
 
+def truncate_many(texts: Any, max_length: int, suffix: str = "...") -> Any:
+    """
+    Truncate every string in a batch, with the same rules as truncate().
+
+    Lists and tuples are processed in a single comprehension and returned as
+    the same type; other iterables return a list. NumPy string or object
+    arrays and PyArrow (chunked) string arrays are processed with their own
+    vectorized operations and returned as the same kind of array. Neither
+    library is required unless such an array is passed in.
+
+    Args:
+        texts: Strings to truncate
+        max_length: Maximum length of each result
+        suffix: Suffix to add if truncated (default: "...")
+
+    Returns:
+        Truncated strings in the same container type
+    """
+    module = type(texts).__module__
+    if module.startswith("numpy"):
+        return _truncate_numpy(texts, max_length, suffix)
+    if module.startswith("pyarrow"):
+        return _truncate_arrow(texts, max_length, suffix)
+
+    result = _truncate_list(texts, max_length, suffix)
+    if isinstance(texts, tuple):
+        return tuple(result)
+    return result
+
+
+def _truncate_list(texts: Iterable[str], max_length: int, suffix: str) -> List[str]:
+    available = max_length - len(suffix)
+    if available <= 0:
+        short = suffix[:max_length]
+        return [text if len(text) <= max_length else short for text in texts]
+    return [text if len(text) <= max_length else text[:available] + suffix for text in texts]
+
+
+def _truncate_numpy(array: Any, max_length: int, suffix: str) -> Any:
+    import numpy as np
+
+    if array.dtype.kind != "U":
+        # Object arrays hold arbitrary Python strings: one pass over a flat view
+        result = np.empty(array.shape, dtype=object)
+        result.ravel()[:] = _truncate_list(array.ravel().tolist(), max_length, suffix)
+        return result
+
+    available = max_length - len(suffix)
+    replacement_width = max_length if available > 0 else len(suffix[:max_length])
+    width = max(1, min(array.dtype.itemsize // 4, max_length), replacement_width)
+    # numpy>=2 ships ufunc-based string functions; np.char is the legacy fallback
+    strings = getattr(np, "strings", np.char)
+    too_long = strings.str_len(array) > max_length
+    # Casting to a narrower unicode dtype truncates; long entries are replaced below
+    result = array.astype(f"<U{width}")
+    if too_long.any():
+        if available <= 0:
+            result[too_long] = suffix[:max_length]
+        else:
+            result[too_long] = strings.add(array.astype(f"<U{available}")[too_long], suffix)
+    return result
+
+
+def _truncate_arrow(array: Any, max_length: int, suffix: str) -> Any:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    # utf8_length and utf8_slice_codeunits count code points, like len() and slicing
+    too_long = pc.greater(pc.utf8_length(array), max_length)
+    available = max_length - len(suffix)
+    if available <= 0:
+        return pc.if_else(too_long, pa.scalar(suffix[:max_length], type=array.type), array)
+    truncated = pc.binary_join_element_wise(
+        pc.utf8_slice_codeunits(array, 0, available),
+        pa.scalar(suffix, type=array.type),
+        pa.scalar("", type=array.type),
+    )
+    return pc.if_else(too_long, truncated, array)
+
+
+# Terminal columns per BMP code point, built on first non-ASCII use; astral
+# code points are looked up individually and memoized.
+_BMP_WIDTHS: Optional[bytes] = None
+_ASTRAL_WIDTHS: Dict[int, int] = {}
+
+_ZERO_WIDTH_CATEGORIES = frozenset(("Mn", "Me", "Cf"))
+_ZWJ = 0x200D
+_EMOJI_PRESENTATION = 0xFE0F
+
+
+def _code_point_width(code_point: int) -> int:
+    if 0x1160 <= code_point <= 0x11FF:
+        # Hangul medial vowels and final consonants render inside the syllable
+        return 0
+    char = chr(code_point)
+    if unicodedata.category(char) in _ZERO_WIDTH_CATEGORIES:
+        return 0
+    return 2 if unicodedata.east_asian_width(char) in ("W", "F") else 1
+
+
+def _bmp_widths() -> bytes:
+    global _BMP_WIDTHS
+    if _BMP_WIDTHS is None:
+        _BMP_WIDTHS = bytes(map(_code_point_width, range(0x10000)))
+    return _BMP_WIDTHS
+
+
+def _graphemes(text: str) -> Iterator[Tuple[int, int]]:
+    """Yield (end index, display width) for each grapheme cluster in text."""
+    table = _bmp_widths()
+    astral = _ASTRAL_WIDTHS
+    length = len(text)
+    i = 0
+    while i < length:
+        code_point = ord(text[i])
+        if code_point < 0x10000:
+            width = table[code_point]
+        else:
+            width = astral.get(code_point, -1)
+            if width < 0:
+                width = astral[code_point] = _code_point_width(code_point)
+        i += 1
+        # A pair of regional indicators is one flag
+        if 0x1F1E6 <= code_point <= 0x1F1FF and i < length and 0x1F1E6 <= ord(text[i]) <= 0x1F1FF:
+            width = 2
+            i += 1
+        # Extend the cluster with marks, selectors, skin tones and ZWJ sequences
+        while i < length:
+            code_point = ord(text[i])
+            if code_point == _ZWJ:
+                i = min(i + 2, length)
+            elif code_point == _EMOJI_PRESENTATION:
+                width = 2
+                i += 1
+            elif 0x1F3FB <= code_point <= 0x1F3FF:
+                i += 1
+            elif code_point < 0x10000 and table[code_point] == 0:
+                i += 1
+            elif 0xE0020 <= code_point <= 0xE01EF:
+                # Tag characters and supplementary variation selectors
+                i += 1
+            else:
+                break
+        yield i, width
+
+
+def display_width(text: str) -> int:
+    """
+    Return the number of terminal columns text occupies.
+
+    Wide and fullwidth (e.g. CJK) characters and emoji take two columns;
+    combining marks, joiners and variation selectors take none.
+
+    Args:
+        text: String to measure
+
+    Returns:
+        Display width in columns
+    """
+    if text.isascii():
+        return len(text)
+    return sum([width for _, width in _graphemes(text)])
+
+
+def _clip_display(text: str, max_width: int) -> str:
+    if text.isascii():
+        return text[:max_width]
+    cut = used = 0
+    for end, width in _graphemes(text):
+        used += width
+        if used > max_width:
+            break
+        cut = end
+    return text[:cut]
+
+
+def truncate_display(text: str, max_width: int, suffix: str = "...") -> str:
+    """
+    Truncate string to max display width, adding suffix if truncated.
+
+    Like truncate(), but measured in terminal columns (see display_width())
+    and only cut between grapheme clusters, so emoji sequences and combining
+    characters are never split. Pure ASCII input takes the same fast path as
+    truncate().
+
+    Args:
+        text: String to truncate
+        max_width: Maximum display width of result
+        suffix: Suffix to add if truncated (default: "...")
+
+    Returns:
+        Truncated string
+    """
+    if text.isascii():
+        if len(text) <= max_width:
+            return text
+        available = max_width - (len(suffix) if suffix.isascii() else display_width(suffix))
+        if available <= 0:
+            return _clip_display(suffix, max_width)
+        return text[:available] + suffix
+
+    available = max_width - display_width(suffix)
+    cut = used = 0
+    for end, width in _graphemes(text):
+        used += width
+        if used > max_width:
+            break
+        if used <= available:
+            cut = end
+    else:
+        return text
+
+    if available <= 0:
+        return _clip_display(suffix, max_width)
+    return text[:cut] + suffix
+
+
 def kebab_case(text: str) -> str:
     """
     Convert string to kebab-case.
 
+    Results are memoized when the cache is enabled with configure_kebab_cache().
+
     Args:
         text: String to convert
 
     Returns:
         kebab-case string
     """
-    import re
+    return _kebab_case_impl(text)
+
 
+def _kebab_case(text: str) -> str:
     # Replace spaces and underscores with hyphens
-    text = re.sub(r"[\s_]+", "-", text)
+    text = _SEPARATORS.sub("-", text)
     # Insert hyphen before uppercase letters
-    text = re.sub(r"([a-z])([A-Z])", r"\1-\2", text)
+    text = _CAMEL_BOUNDARY.sub(r"\1-\2", text)
     return text.lower()
+
+
+_kebab_case_impl: Callable[[str], str] = _kebab_case
+
+
+def configure_kebab_cache(maxsize: int) -> None:
+    """
+    Enable, resize or disable the kebab_case memo.
+
+    Reconfiguring discards any cached results and statistics.
+
+    Args:
+        maxsize: Maximum number of cached inputs (LRU); 0 disables the cache
+    """
+    global _kebab_case_impl
+    if maxsize > 0:
+        _kebab_case_impl = lru_cache(maxsize=maxsize)(_kebab_case)
+    else:
+        _kebab_case_impl = _kebab_case
+
+
+def kebab_cache_info() -> Optional[CacheInfo]:
+    """
+    Return hit/miss statistics for the kebab_case memo.
+
+    Returns:
+        CacheInfo(hits, misses, maxsize, currsize), or None if the cache is disabled
+    """
+    cache_info = getattr(_kebab_case_impl, "cache_info", None)
+    if cache_info is None:
+        return None
+    return CacheInfo(*cache_info())
+
+
+CASE_STYLES = ("kebab", "snake", "camel", "pascal", "constant", "dotted")
+
+# One alternation, one scan: acronym before a capitalised word ("HTTP" in
+# "HTTPServer"), capitalised or lowercase word, all-caps run, digit run. Letters
+# outside A-Z count as lowercase, so non-ASCII words are kept intact.
+_LOWER = r"[^\W\dA-Z_]"
+_WORD = re.compile(rf"[A-Z]+(?=[A-Z]{_LOWER})|[A-Z]?{_LOWER}+\d*|[A-Z]+\d*|\d+{_LOWER}*")
+
+
+class CaseVariants(NamedTuple):
+    """One identifier rendered in every supported case style."""
+
+    kebab: str
+    snake: str
+    camel: str
+    pascal: str
+    constant: str
+    dotted: str
+
+
+def split_words(text: str) -> List[str]:
+    """
+    Split an identifier into words at case, digit and separator boundaries.
+
+    Acronyms stay together: "HTTPServer" splits into ["HTTP", "Server"].
+
+    Args:
+        text: Identifier in any case style
+
+    Returns:
+        Words in their original case
+    """
+    return _WORD.findall(text)
+
+
+def join_words(words: List[str], style: str) -> str:
+    """
+    Join words produced by split_words() in the given case style.
+
+    Args:
+        words: Words to join
+        style: One of "kebab", "snake", "camel", "pascal", "constant", "dotted"
+
+    Returns:
+        Identifier in the requested style
+    """
+    if style == "kebab":
+        return "-".join(words).lower()
+    if style == "snake":
+        return "_".join(words).lower()
+    if style == "constant":
+        return "_".join(words).upper()
+    if style == "dotted":
+        return ".".join(words).lower()
+    if style == "pascal":
+        return "".join([word.capitalize() for word in words])
+    if style == "camel":
+        if not words:
+            return ""
+        return words[0].lower() + "".join([word.capitalize() for word in words[1:]])
+    raise ValueError(f"Unknown case style {style!r}, expected one of {CASE_STYLES}")
+
+
+def convert_case(text: str, style: str) -> str:
+    """
+    Convert an identifier to the given case style.
+
+    Unlike kebab_case(), word boundaries come from split_words(), so acronyms
+    are handled ("HTTPServer" -> "http-server") and punctuation is dropped.
+
+    Args:
+        text: Identifier in any case style
+        style: One of "kebab", "snake", "camel", "pascal", "constant", "dotted"
+
+    Returns:
+        Identifier in the requested style
+    """
+    return join_words(_WORD.findall(text), style)
+
+
+def all_cases(text: str) -> CaseVariants:
+    """
+    Convert an identifier to every case style from a single word scan.
+
+    Args:
+        text: Identifier in any case style
+
+    Returns:
+        CaseVariants with kebab, snake, camel, pascal, constant and dotted forms
+    """
+    words = _WORD.findall(text)
+    kebab = "-".join(words).lower()
+    snake = kebab.replace("-", "_")
+    tail = "".join([word.capitalize() for word in words[1:]])
+    head = words[0] if words else ""
+    camel = head.lower() + tail
+    pascal = head.capitalize() + tail
+    return CaseVariants(
+        kebab=kebab,
+        snake=snake,
+        camel=camel,
+        pascal=pascal,
+        constant=snake.upper(),
+        dotted=kebab.replace("-", "."),
+    )
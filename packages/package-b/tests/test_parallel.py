@@ -0,0 +1,94 @@
+"""Tests for process-pool batch execution."""
+
+import io
+from functools import partial
+from typing import Iterator, List
+
+import pytest
+
+import package_b.parallel as parallel
+from package_b.parallel import (
+    iter_chunks,
+    map_batches,
+    map_each,
+    parallel_kebab_case,
+    parallel_map,
+    parallel_truncate,
+)
+from package_b.stream import transform_stream
+from package_b.strings import kebab_case, truncate
+
+
+def _fail_on_bad(items: List[str]) -> List[str]:
+    if "bad" in items:
+        raise ValueError("bad item")
+    return items
+
+
+class TestIterChunks:
+    """Test suite for iter_chunks function."""
+
+    def test_chunks_preserve_order(self) -> None:
+        """Test that chunks cover the input in order with a short last chunk."""
+        assert list(iter_chunks(range(7), chunk_size=3)) == [[0, 1, 2], [3, 4, 5], [6]]
+
+    def test_invalid_chunk_size(self) -> None:
+        """Test that a chunk size below one is rejected."""
+        with pytest.raises(ValueError):
+            list(iter_chunks([1], chunk_size=0))
+
+
+class TestParallelMap:
+    """Test suite for the process-pool executor."""
+
+    def test_small_input_runs_serially(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that inputs under the threshold never start a pool."""
+
+        def no_pool(*args: object, **kwargs: object) -> None:
+            raise AssertionError("process pool started")
+
+        monkeypatch.setattr(parallel, "ProcessPoolExecutor", no_pool)
+        texts = ["Hello World", "fooBar"]
+        assert list(parallel_kebab_case(texts, serial_threshold=10)) == ["hello-world", "foo-bar"]
+
+    def test_parallel_results_match_serial_in_order(self) -> None:
+        """Test that pooled results equal the serial ones, in input order."""
+        texts = [f"Item Number {i} " * (i % 5) for i in range(500)]
+        result = list(parallel_truncate(texts, 12, chunk_size=37, workers=2, serial_threshold=50))
+        assert result == [truncate(text, 12) for text in texts]
+
+    def test_parallel_kebab_case(self) -> None:
+        """Test parallel_kebab_case over a pool."""
+        texts = [f"camelCase{i} some_text" for i in range(300)]
+        result = list(parallel_kebab_case(texts, chunk_size=50, workers=2, serial_threshold=10))
+        assert result == [kebab_case(text) for text in texts]
+
+    def test_input_consumed_lazily(self) -> None:
+        """Test that results stream back before a generator input is exhausted."""
+        consumed = []
+
+        def numbers() -> Iterator[str]:
+            for i in range(100000):
+                consumed.append(i)
+                yield str(i)
+
+        results = parallel_map(
+            partial(map_each, str.upper), numbers(), chunk_size=100, workers=2, serial_threshold=100
+        )
+        assert next(results) == "0"
+        results.close()
+        assert len(consumed) < 100000
+
+    def test_worker_errors_propagate(self) -> None:
+        """Test that an exception in a worker is raised to the caller."""
+        batches = [["ok"], ["bad"], ["ok"]]
+        with pytest.raises(ValueError, match="bad item"):
+            list(map_batches(_fail_on_bad, batches, workers=2))
+
+    def test_stream_with_jobs(self) -> None:
+        """Test that transform_stream gives the same output with a pool."""
+        text = "".join(f"SomeValue_{i}\n" for i in range(2000))
+        serial, pooled = io.StringIO(), io.StringIO()
+        transform_stream(io.StringIO(text), serial, "snake", chunk_size=1000)
+        transform_stream(io.StringIO(text), pooled, "snake", chunk_size=1000, jobs=2)
+        assert pooled.getvalue() == serial.getvalue()
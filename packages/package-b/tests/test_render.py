@@ -0,0 +1,108 @@
+"""Tests for table rendering."""
+
+import csv
+import io
+import json
+from typing import Iterator, List
+
+import pytest
+
+from package_b.render import render_rows, resolve_format
+
+COLUMNS = ("name", "value")
+ROWS = [("alpha", "1"), ("tab\there", "line\nbreak"), ('comma, quote"', "")]
+
+
+class _Terminal(io.StringIO):
+    def isatty(self) -> bool:
+        return True
+
+
+class TestResolveFormat:
+    """Test suite for resolve_format function."""
+
+    def test_auto_is_plain_when_piped(self) -> None:
+        """Test that non-terminal output gets TSV."""
+        assert resolve_format("auto", io.StringIO()) == "tsv"
+
+    def test_auto_is_rich_on_terminal(self) -> None:
+        """Test that terminal output gets rich."""
+        assert resolve_format("auto", _Terminal()) == "rich"
+
+    def test_explicit_format_is_kept(self) -> None:
+        """Test that an explicit format overrides detection."""
+        assert resolve_format("csv", _Terminal()) == "csv"
+
+    def test_unknown_format(self) -> None:
+        """Test that an unknown format is rejected."""
+        with pytest.raises(ValueError):
+            resolve_format("xml", io.StringIO())
+
+
+class TestRenderRows:
+    """Test suite for render_rows function."""
+
+    def test_tsv_escapes_separators(self) -> None:
+        """Test TSV output with tabs and newlines escaped."""
+        out = io.StringIO()
+        assert render_rows(COLUMNS, ROWS, "tsv", out=out) == 3
+        assert out.getvalue().splitlines() == [
+            "name\tvalue",
+            "alpha\t1",
+            "tab\\there\tline\\nbreak",
+            'comma, quote"\t',
+        ]
+
+    def test_csv_round_trips(self) -> None:
+        """Test that CSV output parses back to the input rows."""
+        out = io.StringIO()
+        render_rows(COLUMNS, ROWS, "csv", out=out)
+        parsed = list(csv.reader(io.StringIO(out.getvalue())))
+        assert parsed == [list(COLUMNS)] + [list(row) for row in ROWS]
+
+    def test_ndjson(self) -> None:
+        """Test one JSON object per row keyed by column."""
+        out = io.StringIO()
+        render_rows(COLUMNS, ROWS, "ndjson", out=out)
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert records == [dict(zip(COLUMNS, row)) for row in ROWS]
+
+    def test_rows_are_streamed_in_batches(self) -> None:
+        """Test that rows are written before the input is exhausted."""
+        out = io.StringIO()
+        written: List[int] = []
+
+        def rows() -> Iterator[tuple]:
+            for i in range(10):
+                written.append(len(out.getvalue().splitlines()))
+                yield (str(i), str(i))
+
+        render_rows(COLUMNS, rows(), "tsv", out=out, batch_size=4)
+        # Header only while the first batch is read, then 4 and 8 rows later on
+        assert written[0] == 1
+        assert written[-1] == 9
+
+    def test_rich_streams_aligned_batches(self) -> None:
+        """Test that rich output prints every row with a single header."""
+        pytest.importorskip("rich")
+        out = io.StringIO()
+        rows = [(f"row{i}", "[bold]not markup[/bold]") for i in range(5)]
+        assert render_rows(COLUMNS, rows, "rich", out=out, batch_size=2) == 5
+        text = out.getvalue()
+        assert text.count("name") == 1
+        assert all(f"row{i}" in text for i in range(5))
+        assert "[bold]not markup" in text
+
+    def test_rich_sizes_columns_from_sampled_rows(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that sampled values print in full and only later, longer ones are cut."""
+        pytest.importorskip("rich")
+        from package_b import render
+
+        monkeypatch.setattr(render, "SAMPLE_SIZE", 2)
+        out = io.StringIO()
+        rows = [("a", "x" * 30), ("b", "y"), ("c", "z" * 40)]
+        render_rows(COLUMNS, rows, "rich", out=out, batch_size=2)
+        text = out.getvalue()
+        assert "x" * 30 in text
+        assert "z" * 29 + "…" in text
+        assert "z" * 31 not in text
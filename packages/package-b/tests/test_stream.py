@@ -0,0 +1,112 @@
+"""Tests for streaming line transforms."""
+
+import io
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from package_b.stream import (
+    iter_line_batches,
+    line_transform,
+    transform_batches,
+    transform_stream,
+    write_batches,
+)
+from package_b.strings import kebab_case, truncate
+
+SRC_PATH = Path(__file__).parent.parent / "src"
+
+
+class TestIterLineBatches:
+    """Test suite for iter_line_batches function."""
+
+    def test_lines_split_across_chunks(self) -> None:
+        """Test that lines spanning chunk boundaries are reassembled."""
+        stream = io.StringIO("alpha\nbeta\ngamma\n")
+        batches = list(iter_line_batches(stream, chunk_size=4))
+        assert [line for batch in batches for line in batch] == ["alpha", "beta", "gamma"]
+
+    def test_missing_trailing_newline(self) -> None:
+        """Test that a final line without a newline is still yielded."""
+        stream = io.StringIO("one\ntwo")
+        assert list(iter_line_batches(stream)) == [["one"], ["two"]]
+
+    def test_empty_lines_preserved(self) -> None:
+        """Test that blank lines are kept."""
+        stream = io.StringIO("a\n\nb\n")
+        assert list(iter_line_batches(stream)) == [["a", "", "b"]]
+
+    def test_empty_input(self) -> None:
+        """Test that empty input yields nothing."""
+        assert list(iter_line_batches(io.StringIO(""))) == []
+
+
+class TestTransform:
+    """Test suite for the transform pipeline."""
+
+    def test_truncate_matches_scalar(self) -> None:
+        """Test that truncate batches match truncate()."""
+        lines = ["short", "a much longer line of text"]
+        transform = line_transform("truncate", max_length=10)
+        assert transform(lines) == [truncate(line, 10) for line in lines]
+
+    def test_kebab_matches_scalar(self) -> None:
+        """Test that kebab batches match kebab_case()."""
+        lines = ["helloWorld", "Hello World", "hello_world"]
+        assert line_transform("kebab")(lines) == [kebab_case(line) for line in lines]
+
+    def test_case_styles(self) -> None:
+        """Test that convert_case styles are available."""
+        assert line_transform("snake")(["HTTPServer"]) == ["http_server"]
+
+    def test_unknown_operation(self) -> None:
+        """Test that unknown operations are rejected."""
+        with pytest.raises(ValueError, match="Unknown operation"):
+            line_transform("reverse")
+
+    def test_transform_batches_is_lazy(self) -> None:
+        """Test that batches are transformed only as they are consumed."""
+        seen = []
+
+        def batches():
+            for batch in (["a"], ["b"]):
+                seen.append(batch[0])
+                yield batch
+
+        pipeline = transform_batches(batches(), line_transform("kebab"))
+        assert seen == []
+        assert next(pipeline) == ["a"]
+        assert seen == ["a"]
+
+    def test_write_batches(self) -> None:
+        """Test that batches are written newline-terminated."""
+        out = io.StringIO()
+        assert write_batches([["a", "b"], [], ["c"]], out) == 3
+        assert out.getvalue() == "a\nb\nc\n"
+
+    def test_transform_stream(self) -> None:
+        """Test the full stream pipeline with small chunks."""
+        source = io.StringIO("helloWorld\nfoo_bar\nBazQux\n")
+        destination = io.StringIO()
+        count = transform_stream(source, destination, "kebab", chunk_size=5)
+        assert count == 3
+        assert destination.getvalue() == "hello-world\nfoo-bar\nbaz-qux\n"
+
+
+class TestTransformCommand:
+    """Test suite for the package-b transform command."""
+
+    def test_transform_command(self) -> None:
+        """Test piping data through the CLI without rich installed or imported."""
+        env = dict(os.environ, PYTHONPATH=str(SRC_PATH))
+        result = subprocess.run(
+            [sys.executable, "-m", "package_b", "transform", "--op", "truncate", "--max-len", "8"],
+            input=b"hello world\nshort\ncaf\xc3\xa9 au lait\n",
+            capture_output=True,
+            env=env,
+            check=True,
+        )
+        assert result.stdout == "hello...\nshort\ncafé ...\n".encode()
@@ -1,6 +1,22 @@
 """Tests for string utilities."""
 
-from package_b.strings import kebab_case, truncate
+import pytest
+
+from package_b.strings import (
+    CASE_STYLES,
+    CaseVariants,
+    all_cases,
+    configure_kebab_cache,
+    convert_case,
+    display_width,
+    join_words,
+    kebab_cache_info,
+    kebab_case,
+    split_words,
+    truncate,
+    truncate_display,
+    truncate_many,
+)
 
 
 class TestTruncate:
@@ -66,3 +82,188 @@ class TestKebabCase:
         """Test kebab_case with multiple spaces."""
         result = kebab_case("hello   world")
         assert result == "hello-world"
+
+
+class TestTruncateMany:
+    """Test suite for truncate_many function."""
+
+    CASES = ["hello", "hello world", "", "exactly-ten", "naïve café au lait", "x" * 100]
+
+    def test_truncate_many_matches_scalar(self) -> None:
+        """Test that every element matches truncate()."""
+        for max_length, suffix in [(8, "..."), (11, " [...]"), (2, "..."), (0, "..."), (5, "")]:
+            expected = [truncate(text, max_length, suffix) for text in self.CASES]
+            assert truncate_many(self.CASES, max_length, suffix) == expected
+
+    def test_truncate_many_preserves_tuple(self) -> None:
+        """Test that tuples come back as tuples."""
+        result = truncate_many(("hello world", "hi"), 8)
+        assert result == ("hello...", "hi")
+
+    def test_truncate_many_accepts_iterables(self) -> None:
+        """Test that generic iterables return a list."""
+        result = truncate_many((text for text in ["hello world"]), 8)
+        assert result == ["hello..."]
+
+    def test_truncate_many_numpy_unicode(self) -> None:
+        """Test NumPy unicode arrays against the scalar function."""
+        np = pytest.importorskip("numpy")
+        array = np.array(self.CASES)
+        for max_length, suffix in [(8, "..."), (2, "..."), (50, "...")]:
+            result = truncate_many(array, max_length, suffix)
+            assert isinstance(result, np.ndarray)
+            assert result.tolist() == [truncate(t, max_length, suffix) for t in self.CASES]
+
+    def test_truncate_many_numpy_object(self) -> None:
+        """Test NumPy object arrays keep their shape and dtype."""
+        np = pytest.importorskip("numpy")
+        array = np.array(self.CASES, dtype=object).reshape(2, 3)
+        result = truncate_many(array, 8)
+        assert result.dtype == object
+        assert result.shape == (2, 3)
+        assert result.ravel().tolist() == [truncate(t, 8) for t in self.CASES]
+
+    def test_truncate_many_arrow(self) -> None:
+        """Test PyArrow string arrays, including nulls."""
+        pa = pytest.importorskip("pyarrow")
+        array = pa.array(self.CASES + [None])
+        result = truncate_many(array, 8)
+        assert isinstance(result, pa.Array)
+        assert result.to_pylist() == [truncate(t, 8) for t in self.CASES] + [None]
+
+
+class TestKebabCache:
+    """Test suite for the kebab_case memo."""
+
+    def teardown_method(self) -> None:
+        """Disable the cache so other tests run uncached."""
+        configure_kebab_cache(0)
+
+    def test_cache_disabled_by_default(self) -> None:
+        """Test that no statistics are reported without a cache."""
+        assert kebab_cache_info() is None
+
+    def test_cache_hits_and_misses(self) -> None:
+        """Test that repeated inputs are served from the cache."""
+        configure_kebab_cache(16)
+        for text in ["helloWorld", "hello_world", "helloWorld", "helloWorld"]:
+            assert kebab_case(text) == "hello-world"
+
+        info = kebab_cache_info()
+        assert info is not None
+        assert (info.hits, info.misses, info.maxsize, info.currsize) == (2, 2, 16, 2)
+
+    def test_cache_is_bounded(self) -> None:
+        """Test that the cache never holds more than maxsize entries."""
+        configure_kebab_cache(4)
+        for i in range(20):
+            kebab_case(f"value{i}Name")
+
+        info = kebab_cache_info()
+        assert info is not None
+        assert info.currsize == 4
+
+    def test_cached_results_match_uncached(self) -> None:
+        """Test that enabling the cache does not change results."""
+        inputs = ["HelloWorld", "hello   world", "already-kebab", "mixed_Case input"]
+        expected = [kebab_case(text) for text in inputs]
+        configure_kebab_cache(8)
+        assert [kebab_case(text) for text in inputs] == expected
+
+
+class TestCaseConversion:
+    """Test suite for the case conversion engine."""
+
+    def test_split_words_acronyms(self) -> None:
+        """Test that acronyms stay together and split from the next word."""
+        assert split_words("HTTPServer") == ["HTTP", "Server"]
+        assert split_words("XMLHttpRequest") == ["XML", "Http", "Request"]
+        assert split_words("getHTTP2Response") == ["get", "HTTP2", "Response"]
+
+    def test_split_words_separators(self) -> None:
+        """Test that spaces, underscores, hyphens and dots separate words."""
+        assert split_words("hello_world-foo bar.baz") == ["hello", "world", "foo", "bar", "baz"]
+        assert split_words("__init__") == ["init"]
+        assert split_words("") == []
+
+    def test_all_cases(self) -> None:
+        """Test every style produced from one scan."""
+        assert all_cases("HTTPServer") == CaseVariants(
+            kebab="http-server",
+            snake="http_server",
+            camel="httpServer",
+            pascal="HttpServer",
+            constant="HTTP_SERVER",
+            dotted="http.server",
+        )
+
+    def test_convert_case_matches_all_cases(self) -> None:
+        """Test that single-style conversion agrees with all_cases()."""
+        for text in ["userID2Name", "hello world", "Über cool", "2faEnabled", "", "ß"]:
+            variants = all_cases(text)
+            for style in CASE_STYLES:
+                assert convert_case(text, style) == getattr(variants, style)
+
+    def test_join_words_reuses_tokens(self) -> None:
+        """Test that words can be tokenized once and joined in several styles."""
+        words = split_words("user_account_id")
+        assert join_words(words, "camel") == "userAccountId"
+        assert join_words(words, "constant") == "USER_ACCOUNT_ID"
+
+    def test_unknown_style(self) -> None:
+        """Test that an unknown style is rejected."""
+        with pytest.raises(ValueError, match="Unknown case style"):
+            convert_case("hello", "sarcasm")
+
+    def test_kebab_style_agrees_with_kebab_case_on_plain_input(self) -> None:
+        """Test that the engine and kebab_case agree where kebab_case is unambiguous."""
+        for text in ["hello world", "hello_world", "helloWorld", "HelloWorld", "hello-world"]:
+            assert convert_case(text, "kebab") == kebab_case(text)
+
+
+class TestTruncateDisplay:
+    """Test suite for display-width-aware truncation."""
+
+    def test_ascii_matches_truncate(self) -> None:
+        """Test that ASCII input gives exactly the same result as truncate."""
+        for text in ["hello", "hello world", "This is a very long string"]:
+            for max_width in range(0, 14):
+                assert truncate_display(text, max_width) == truncate(text, max_width)
+
+    def test_display_width(self) -> None:
+        """Test column counts for narrow, wide and zero-width characters."""
+        assert display_width("hello") == 5
+        assert display_width("日本語") == 6
+        assert display_width("e\u0301") == 1
+        assert display_width("\U0001f468\u200d\U0001f469\u200d\U0001f467") == 2
+        assert display_width("\U0001f1ef\U0001f1f5") == 2
+        assert display_width("\u2764\ufe0f") == 2
+
+    def test_wide_characters(self) -> None:
+        """Test that CJK text is truncated by columns, not code points."""
+        result = truncate_display("日本語のテキスト", max_width=7)
+        assert result == "日本..."
+        assert display_width(result) <= 7
+
+    def test_no_truncation_needed(self) -> None:
+        """Test that text within the width is returned unchanged."""
+        assert truncate_display("日本語", max_width=6) == "日本語"
+
+    def test_combining_marks_not_split(self) -> None:
+        """Test that a base character keeps its combining marks."""
+        text = "e\u0301" * 6
+        assert truncate_display(text, max_width=5) == "e\u0301e\u0301..."
+
+    def test_emoji_sequences_not_split(self) -> None:
+        """Test that ZWJ sequences, skin tones and flags stay whole."""
+        family = "\U0001f468\u200d\U0001f469\u200d\U0001f467"
+        assert truncate_display(family * 3, max_width=5, suffix="\u2026") == family * 2 + "\u2026"
+        thumbs = "\U0001f44d\U0001f3fd"
+        assert truncate_display(thumbs * 3, max_width=4, suffix="\u2026") == thumbs + "\u2026"
+        flags = "\U0001f1ef\U0001f1f5\U0001f1fa\U0001f1f8"
+        assert truncate_display(flags, max_width=3, suffix="\u2026") == "\U0001f1ef\U0001f1f5\u2026"
+
+    def test_suffix_wider_than_max_width(self) -> None:
+        """Test that the suffix is clipped to the available width."""
+        assert truncate_display("日本語", max_width=2) == ".."
+        assert truncate_display("hello world", max_width=1, suffix="\u2026\u2026") == "\u2026"
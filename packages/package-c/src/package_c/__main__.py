@@ -1,20 +1,141 @@
 """Main entry point for package-c executable."""
 
+import argparse
 import sys
-from decimal import Decimal
+from typing import List, Optional
+
+from package_c.batch import (
+    BATCH_SIZE,
+    CHUNK_SIZE,
+    INPUT_FORMATS,
+    OPERATIONS,
+    OUTPUT_FORMATS,
+    ZERO_POLICIES,
+    compute_stream,
+)
+from package_c.math_helpers import divide_precise, percentage
 
-try:
-    from tabulate import tabulate
-except ImportError as e:
-    print(f"ERROR: Required dependency 'tabulate' not found: {e}", file=sys.stderr)
-    print("Please install with: pip install tabulate>=0.9.0", file=sys.stderr)
-    sys.exit(1)
 
-from package_c.math_helpers import divide_precise, percentage
+def _parse_args(argv: List[str]) -> argparse.Namespace:
+    """Parse command line arguments; no subcommand runs the demo."""
+    parser = argparse.ArgumentParser(prog="package-c", description="Package C - Math Helpers")
+    subparsers = parser.add_subparsers(dest="command")
+
+    compute = subparsers.add_parser(
+        "compute", help="Compute operand pairs from a CSV/NDJSON file or stdin in batches"
+    )
+    compute.add_argument(
+        "input", nargs="?", default="-", help="Input file, or - for stdin (default: -)"
+    )
+    compute.add_argument("--op", default="divide", choices=OPERATIONS, help="Operation to apply")
+    compute.add_argument(
+        "--input-format",
+        choices=("auto",) + INPUT_FORMATS,
+        default="auto",
+        help="Input format; auto uses ndjson for .ndjson/.jsonl files and csv otherwise",
+    )
+    compute.add_argument(
+        "--header",
+        action="store_true",
+        help="Skip the first CSV row even if it does not name numerator and denominator",
+    )
+    compute.add_argument(
+        "--format", default="fixed", choices=OUTPUT_FORMATS, help="Output format (default: fixed)"
+    )
+    compute.add_argument(
+        "--places", type=int, default=2, help="Number of decimal places (default: 2)"
+    )
+    compute.add_argument(
+        "--widths",
+        type=_parse_widths,
+        help="Column widths for fixed output, e.g. 12,12,20 (default: sampled from the input)",
+    )
+    compute.add_argument(
+        "--on-zero",
+        default="raise",
+        choices=ZERO_POLICIES,
+        help="Fail on a zero denominator, or write NaN for that row (default: raise)",
+    )
+    compute.add_argument(
+        "--batch-size", type=int, default=BATCH_SIZE, help="Pairs computed per batch"
+    )
+    return parser.parse_args(argv)
+
+
+def _parse_widths(text: str) -> List[int]:
+    try:
+        return [int(width) for width in text.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid widths {text!r}") from None
 
 
-def main():
+def main(argv: Optional[List[str]] = None) -> None:
     """Main function for package-c CLI."""
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+    if args.command == "compute":
+        _run_compute(args)
+    else:
+        _run_demo()
+
+
+def _run_compute(args: argparse.Namespace) -> None:
+    """Stream operand pairs from a file or stdin through an operation to stdout."""
+    input_format = args.input_format
+    if input_format == "auto":
+        is_ndjson = args.input.endswith((".ndjson", ".jsonl"))
+        input_format = "ndjson" if is_ndjson else "csv"
+
+    destination = open(
+        sys.stdout.fileno(),
+        "w",
+        buffering=CHUNK_SIZE,
+        encoding="utf-8",
+        newline="\n",
+        closefd=False,
+    )
+    try:
+        if args.input == "-":
+            source = open(
+                sys.stdin.fileno(),
+                "r",
+                buffering=CHUNK_SIZE,
+                encoding="utf-8",
+                newline="",
+                closefd=False,
+            )
+        else:
+            source = open(args.input, "r", buffering=CHUNK_SIZE, encoding="utf-8", newline="")
+        with source:
+            compute_stream(
+                source,
+                destination,
+                args.op,
+                input_format,
+                args.format,
+                args.places,
+                widths=args.widths,
+                on_zero=args.on_zero,
+                batch_size=args.batch_size,
+                header=args.header,
+            )
+        destination.flush()
+    except BrokenPipeError:
+        # Downstream closed early (e.g. `| head`); nothing left to report
+        sys.exit(0)
+    except Exception as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+def _run_demo() -> None:
+    """Print the demonstration tables; only this mode needs tabulate."""
+    try:
+        from tabulate import tabulate
+    except ImportError as e:
+        print(f"ERROR: Required dependency 'tabulate' not found: {e}", file=sys.stderr)
+        print("Please install with: pip install tabulate>=0.9.0", file=sys.stderr)
+        sys.exit(1)
+
     print("=" * 60)
     print("Package C - Math Helpers v1.0.0")
     print("=" * 60)
@@ -0,0 +1,305 @@
+"""Streaming batch computation for package-c."""
+
+import csv
+import json
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple, Union
+
+from package_c.math_helpers import divide_precise, percentage
+
+CHUNK_SIZE = 1024 * 1024
+BATCH_SIZE = 10000
+SAMPLE_SIZE = 1000
+
+OPERATIONS = ("divide", "percentage")
+INPUT_FORMATS = ("csv", "ndjson")
+OUTPUT_FORMATS = ("fixed", "csv", "ndjson")
+ZERO_POLICIES = ("raise", "nan")
+
+COLUMNS = ("numerator", "denominator", "result")
+
+Pair = Tuple[str, str]
+Row = Tuple[str, str, str]
+
+
+def read_pairs(
+    stream: TextIO, fmt: str = "csv", batch_size: int = BATCH_SIZE, header: bool = False
+) -> Iterator[List[Pair]]:
+    """
+    Read operand pairs from a text stream in batches.
+
+    CSV rows take the "numerator" and "denominator" columns if the first
+    row is a header naming them, otherwise the first two fields. Any other
+    first row is read as data unless ``header`` is set, so a mistyped
+    operand is reported rather than skipped as a header. NDJSON lines are
+    objects with "numerator" and "denominator" keys or two-element arrays.
+    Operands are kept as the text they were written as, so no precision is
+    lost before computing. Blank lines are skipped.
+
+    Args:
+        stream: Text stream to read (open CSV input with newline="")
+        fmt: "csv" or "ndjson" (default: "csv")
+        batch_size: Pairs per batch (default: 10000)
+        header: Whether the first CSV row is a header even if it does not
+            name the operand columns (default: False)
+
+    Yields:
+        Lists of (numerator, denominator) strings
+
+    Raises:
+        ValueError: If a row does not hold two operands, or the first CSV
+            row is neither a header nor numeric
+    """
+    if fmt == "csv":
+        pairs = _csv_pairs(stream, header)
+    elif fmt == "ndjson":
+        pairs = _ndjson_pairs(stream)
+    else:
+        raise ValueError(f"Unknown input format {fmt!r}, expected one of {INPUT_FORMATS}")
+    while True:
+        batch = list(islice(pairs, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def _csv_pairs(stream: TextIO, header: bool) -> Iterator[Pair]:
+    rows = csv.reader(stream)
+    first, second = 0, 1
+    for line, row in enumerate(rows, 1):
+        if not row:
+            continue
+        if line == 1:
+            names = [name.strip() for name in row]
+            if "numerator" in names and "denominator" in names:
+                first, second = names.index("numerator"), names.index("denominator")
+                continue
+            if header:
+                continue
+            if not all(_is_number(field) for field in row[:2]):
+                raise ValueError(
+                    "Line 1: expected a header naming numerator and denominator "
+                    f"or two operands, got {row!r}"
+                )
+        try:
+            yield row[first], row[second]
+        except IndexError:
+            raise ValueError(f"Line {line}: expected two operands, got {row!r}") from None
+
+
+def _ndjson_pairs(stream: TextIO) -> Iterator[Pair]:
+    for line, text in enumerate(stream, 1):
+        if not text.strip():
+            continue
+        # Numbers come back as their source text, exactly as written
+        record = json.loads(text, parse_int=str, parse_float=str)
+        try:
+            if isinstance(record, dict):
+                yield str(record["numerator"]), str(record["denominator"])
+            elif isinstance(record, list) and len(record) == 2:
+                yield str(record[0]), str(record[1])
+            else:
+                raise KeyError
+        except KeyError:
+            raise ValueError(f"Line {line}: expected two operands, got {text.strip()}") from None
+
+
+def _is_number(text: str) -> bool:
+    try:
+        Decimal(text)
+    except InvalidOperation:
+        return False
+    return True
+
+
+def _parse_exact(text: str) -> Union[int, Decimal]:
+    try:
+        return int(text)
+    except ValueError:
+        try:
+            return Decimal(text)
+        except InvalidOperation:
+            raise ValueError(f"Invalid operand {text!r}") from None
+
+
+def _parse_float(text: str) -> float:
+    try:
+        return float(text)
+    except ValueError:
+        raise ValueError(f"Invalid operand {text!r}") from None
+
+
+def batch_compute(
+    op: str = "divide", decimal_places: int = 2, on_zero: str = "raise"
+) -> Callable[[List[Pair]], List[Row]]:
+    """
+    Build a function that computes a batch of operand pairs.
+
+    "divide" parses operands exactly (ints, otherwise Decimal) and uses
+    divide_precise(); "percentage" parses them as floats and uses
+    percentage().
+
+    Args:
+        op: "divide" or "percentage" (default: "divide")
+        decimal_places: Number of decimal places (default: 2)
+        on_zero: "raise" to raise ValueError on a zero denominator, or
+            "nan" to give NaN for that row (default: "raise")
+
+    Returns:
+        Function mapping (numerator, denominator) pairs to
+        (numerator, denominator, result) rows
+    """
+    if op == "divide":
+        parse, compute = _parse_exact, divide_precise
+    elif op == "percentage":
+        parse, compute = _parse_float, percentage  # type: ignore[assignment]
+    else:
+        raise ValueError(f"Unknown operation {op!r}, expected one of {OPERATIONS}")
+    if on_zero not in ZERO_POLICIES:
+        raise ValueError(f"Unknown zero policy {on_zero!r}, expected one of {ZERO_POLICIES}")
+
+    def compute_batch(pairs: List[Pair]) -> List[Row]:
+        rows = []
+        for numerator, denominator in pairs:
+            divisor = parse(denominator)
+            if divisor == 0:
+                if on_zero == "raise":
+                    raise ValueError(f"Cannot divide {numerator} by zero")
+                rows.append((numerator, denominator, "NaN"))
+                continue
+            result = compute(parse(numerator), divisor, decimal_places)
+            rows.append((numerator, denominator, str(result)))
+        return rows
+
+    return compute_batch
+
+
+def write_rows(
+    batches: Iterable[List[Row]],
+    out: TextIO,
+    fmt: str = "fixed",
+    widths: Optional[Sequence[int]] = None,
+    sample_size: int = SAMPLE_SIZE,
+) -> int:
+    """
+    Write result rows as they arrive, one write call per batch.
+
+    "fixed" right-aligns each column to a fixed width. Widths are taken
+    from ``widths`` if given, otherwise from the header and the first
+    ``sample_size`` rows, which are held back until measured. Values wider
+    than their column are written in full, never cut.
+
+    Args:
+        batches: Batches of (numerator, denominator, result) rows
+        out: Text stream to write to
+        fmt: "fixed", "csv" or "ndjson" (default: "fixed")
+        widths: Column widths for "fixed" (default: None, sampled)
+        sample_size: Rows measured for "fixed" without widths (default: 1000)
+
+    Returns:
+        Number of rows written
+    """
+    if fmt == "fixed":
+        return _write_fixed(batches, out, widths, sample_size)
+    if fmt == "csv":
+        return _write_csv(batches, out)
+    if fmt == "ndjson":
+        return _write_ndjson(batches, out)
+    raise ValueError(f"Unknown output format {fmt!r}, expected one of {OUTPUT_FORMATS}")
+
+
+def _write_fixed(
+    batches: Iterable[List[Row]], out: TextIO, widths: Optional[Sequence[int]], sample_size: int
+) -> int:
+    iterator = iter(batches)
+    held: List[List[Row]] = []
+    if widths is None:
+        sampled = 0
+        for batch in iterator:
+            held.append(batch)
+            sampled += len(batch)
+            if sampled >= sample_size:
+                break
+        widths = [
+            max([len(column)] + [len(row[index]) for batch in held for row in batch])
+            for index, column in enumerate(COLUMNS)
+        ]
+    elif len(widths) != len(COLUMNS):
+        raise ValueError(f"Expected {len(COLUMNS)} column widths, got {len(widths)}")
+
+    out.write("  ".join(column.rjust(width) for column, width in zip(COLUMNS, widths)) + "\n")
+    first, second, third = widths
+    count = 0
+    for batch in _chain(held, iterator):
+        lines = [f"{a.rjust(first)}  {b.rjust(second)}  {c.rjust(third)}\n" for a, b, c in batch]
+        out.write("".join(lines))
+        count += len(batch)
+    return count
+
+
+def _chain(held: List[List[Row]], rest: Iterator[List[Row]]) -> Iterator[List[Row]]:
+    # Release sampled batches as they are written
+    while held:
+        yield held.pop(0)
+    yield from rest
+
+
+def _write_csv(batches: Iterable[List[Row]], out: TextIO) -> int:
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(COLUMNS)
+    count = 0
+    for batch in batches:
+        writer.writerows(batch)
+        count += len(batch)
+    return count
+
+
+def _write_ndjson(batches: Iterable[List[Row]], out: TextIO) -> int:
+    encode = json.JSONEncoder(separators=(",", ":")).encode
+    count = 0
+    for batch in batches:
+        # Values stay strings so Decimal results keep every digit
+        out.write("".join([encode(dict(zip(COLUMNS, row))) + "\n" for row in batch]))
+        count += len(batch)
+    return count
+
+
+def compute_stream(
+    source: TextIO,
+    destination: TextIO,
+    op: str = "divide",
+    input_format: str = "csv",
+    output_format: str = "fixed",
+    decimal_places: int = 2,
+    widths: Optional[Sequence[int]] = None,
+    on_zero: str = "raise",
+    batch_size: int = BATCH_SIZE,
+    header: bool = False,
+) -> int:
+    """
+    Stream operand pairs from source to result rows on destination.
+
+    Memory use is bounded by one batch (or the width sample for "fixed"
+    output without widths), whatever the input size.
+
+    Args:
+        source: Text stream of CSV or NDJSON operand pairs, see read_pairs()
+        destination: Text stream to write results to
+        op: "divide" or "percentage" (default: "divide")
+        input_format: "csv" or "ndjson" (default: "csv")
+        output_format: "fixed", "csv" or "ndjson" (default: "fixed")
+        decimal_places: Number of decimal places (default: 2)
+        widths: Column widths for "fixed" output (default: None, sampled)
+        on_zero: "raise" or "nan" for zero denominators (default: "raise")
+        batch_size: Pairs computed per batch (default: 10000)
+        header: Whether the first CSV row is a header, see read_pairs()
+            (default: False)
+
+    Returns:
+        Number of rows written
+    """
+    compute_batch = batch_compute(op, decimal_places, on_zero)
+    pairs = read_pairs(source, input_format, batch_size, header)
+    batches = (compute_batch(batch) for batch in pairs)
+    return write_rows(batches, destination, output_format, widths)
@@ -0,0 +1,247 @@
+"""Grouped percentage breakdowns for package-c."""
+
+from decimal import MAX_PREC, Context, Decimal, localcontext
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+# Sums and rescaling in this context never round
+_EXACT = Context(prec=MAX_PREC)
+
+Number = Union[int, float, Decimal]
+
+
+def percentage_breakdown(
+    data: Union[Iterable[Tuple[Hashable, Number]], Mapping[str, Any]],
+    by: Optional[Union[str, Callable[[Hashable], Hashable]]] = None,
+    decimal_places: int = 2,
+    category: str = "category",
+    value: str = "value",
+) -> Dict[Hashable, Any]:
+    """
+    Sum values per category and give each category's share of its group.
+
+    Values are summed per (group, category) in a single pass over the
+    input; group totals come from those sums. Shares are rounded with the
+    largest-remainder method, so within every group they add up to exactly
+    100 at the requested precision.
+
+    Rows are (category, value) pairs; ``by`` is then an optional function
+    mapping a category to its group. Columnar input is a mapping of column
+    name to sequence; ``category`` and ``value`` name the columns and
+    ``by`` names the group column. NumPy columns are aggregated with
+    vectorized operations and no per-row Python objects.
+
+    Ints are summed exactly; floats are converted through their shortest
+    repr, like divide_precise(), and summed exactly. Rows and columns
+    holding the same data give the same shares, ties included. A float64
+    column is summed as scaled integers when its values have at most 15
+    significant digits; other float columns (float32, or values with more
+    digits) are converted value by value.
+
+    Args:
+        data: (category, value) rows or a mapping of columns
+        by: Group function for rows, or group column name for columns
+            (default: None, one group)
+        decimal_places: Number of decimal places of each share (default: 2)
+        category: Category column name for columnar input (default: "category")
+        value: Value column name for columnar input (default: "value")
+
+    Returns:
+        {category: Decimal share} without ``by``, otherwise
+        {group: {category: Decimal share}}; keys in order of first appearance
+
+    Raises:
+        ValueError: If a value is not finite or negative, or a group's
+            total is zero
+    """
+    places = decimal_places if decimal_places > 0 else 0
+    if isinstance(data, Mapping):
+        if by is not None and not isinstance(by, str):
+            raise TypeError("by must be a column name for columnar input")
+        sums = _column_sums(data, category, value, by)
+    else:
+        if isinstance(by, str):
+            raise TypeError("by must be a function for row input")
+        if by is None:
+            sums = _row_sums((None, key, amount) for key, amount in data)
+        else:
+            sums = _row_sums((by(key), key, amount) for key, amount in data)
+
+    shares = {group: _largest_remainder(totals, places) for group, totals in sums.items()}
+    if by is None:
+        return shares.get(None, {})
+    return shares
+
+
+def _add(total: Number, amount: Number) -> Number:
+    if type(total) is int and type(amount) is int:
+        return total + amount
+    return _EXACT.add(_to_decimal(total), _to_decimal(amount))
+
+
+def _to_decimal(amount: Number) -> Decimal:
+    if type(amount) is int:
+        return Decimal(amount)
+    result = amount if isinstance(amount, Decimal) else Decimal(str(amount))
+    if not result.is_finite():
+        raise ValueError(f"Values must be finite, got {amount}")
+    return result
+
+
+def _row_sums(
+    rows: Iterable[Tuple[Hashable, Hashable, Number]],
+) -> Dict[Hashable, Dict[Hashable, Number]]:
+    groups: Dict[Hashable, Dict[Hashable, Number]] = {}
+    for group, key, amount in rows:
+        totals = groups.get(group)
+        if totals is None:
+            totals = groups[group] = {}
+        if key in totals:
+            totals[key] = _add(totals[key], amount)
+        elif type(amount) is int:
+            totals[key] = amount
+        else:
+            totals[key] = _to_decimal(amount)
+    return groups
+
+
+def _column_sums(
+    columns: Mapping[str, Any], category: str, value: str, by: Optional[str]
+) -> Dict[Hashable, Dict[Hashable, Number]]:
+    keys = columns[category]
+    amounts = columns[value]
+    group_keys = columns[by] if by is not None else None
+    if type(amounts).__module__.startswith("numpy"):
+        return _numpy_sums(keys, amounts, group_keys)
+    if group_keys is None:
+        return _row_sums((None, key, amount) for key, amount in zip(keys, amounts))
+    return _row_sums(zip(group_keys, keys, amounts))
+
+
+def _numpy_sums(
+    keys: Any, amounts: Any, group_keys: Optional[Any]
+) -> Dict[Hashable, Dict[Hashable, Number]]:
+    import numpy as np
+
+    amounts = np.asarray(amounts)
+    unique_keys, key_codes = np.unique(np.asarray(keys), return_inverse=True)
+    codes = key_codes.ravel()
+    unique_groups = None
+    if group_keys is not None:
+        unique_groups, group_codes = np.unique(np.asarray(group_keys), return_inverse=True)
+        codes = group_codes.ravel() * len(unique_keys) + codes
+    cells, first, inverse = np.unique(codes, return_index=True, return_inverse=True)
+    inverse = inverse.ravel()
+
+    sums: Sequence[Number]
+    if amounts.dtype.kind in "iu":
+        sums = _integer_sums(np, amounts, inverse, len(cells))
+    else:
+        if amounts.dtype.kind == "f" and not np.isfinite(amounts).all():
+            raise ValueError("Values must be finite")
+        scaled = _scaled_float64(np, amounts)
+        if scaled is not None:
+            ints, scale = scaled
+            sums = [
+                Decimal(total).scaleb(-scale, _EXACT)
+                for total in _integer_sums(np, ints, inverse, len(cells))
+            ]
+        else:
+            # Group the values, then convert and sum them as the row path does
+            order = np.argsort(inverse, kind="stable")
+            bounds = np.searchsorted(inverse[order], np.arange(1, len(cells)))
+            with localcontext(_EXACT):
+                sums = [
+                    sum(map(_to_decimal, segment), Decimal(0))
+                    for segment in np.split(amounts[order], bounds)
+                ]
+
+    groups: Dict[Hashable, Dict[Hashable, Number]] = {}
+    width = len(unique_keys)
+    for cell in np.argsort(first, kind="stable").tolist():
+        code = int(cells[cell])
+        group = unique_groups[code // width].item() if unique_groups is not None else None
+        key = unique_keys[code % width].item()
+        totals = groups.get(group)
+        if totals is None:
+            totals = groups[group] = {}
+        totals[key] = sums[cell]
+    return groups
+
+
+def _integer_sums(np: Any, amounts: Any, inverse: Any, cells: int) -> List[int]:
+    bound = int(np.abs(amounts).max()) if amounts.size else 0
+    if bound * amounts.size < 2**53:
+        # Float64 bincount is exact while every partial sum fits in 53 bits
+        weighted = np.bincount(inverse, weights=amounts, minlength=cells)
+        return weighted.astype(np.int64).tolist()  # type: ignore[no-any-return]
+    exact = np.zeros(cells, dtype=object)
+    np.add.at(exact, inverse, amounts.astype(object))
+    return exact.tolist()  # type: ignore[no-any-return]
+
+
+def _scaled_float64(np: Any, amounts: Any) -> Optional[Tuple[Any, int]]:
+    """Float64 values as int64 n with n / 10**scale == value, or None."""
+    if amounts.dtype != np.float64:
+        return None
+    # While |n| < 2**51 the decimals with `scale` places are more than an ulp
+    # apart, so at most one rounds to each value: if n / 10**scale does, it
+    # is the value's shortest repr, and the n sum to the row path's total
+    for scale in range(23):
+        factor = 10.0**scale
+        scaled = np.rint(amounts * factor)
+        if not (np.abs(scaled) < 2.0**51).all():
+            return None
+        if (scaled / factor == amounts).all():
+            return scaled.astype(np.int64), scale
+    return None
+
+
+def _largest_remainder(totals: Mapping[Hashable, Number], places: int) -> Dict[Hashable, Decimal]:
+    # Bring every sum to a common integer scale; sums are finite, so every
+    # exponent is an int
+    exponents = [
+        int(amount.as_tuple().exponent) for amount in totals.values() if isinstance(amount, Decimal)
+    ]
+    exponent = min([0, *exponents])
+    scaled: List[int] = []
+    for amount in totals.values():
+        if isinstance(amount, Decimal):
+            scaled.append(int(amount.scaleb(-exponent, _EXACT)))
+        else:
+            scaled.append(int(amount) * 10**-exponent)
+    if any(amount < 0 for amount in scaled):
+        raise ValueError("Values cannot be negative")
+    total = sum(scaled)
+    if total == 0:
+        raise ValueError("Total cannot be zero")
+
+    units = 100 * 10**places
+    quotients: List[int] = []
+    remainders: List[int] = []
+    for amount in scaled:
+        quotient, remainder = divmod(amount * units, total)
+        quotients.append(quotient)
+        remainders.append(remainder)
+    # Hand the units lost to flooring to the largest remainders; ties go to
+    # the key that appeared first, which both the row and column paths keep
+    # as the order of totals (sorted() is stable)
+    leftover = units - sum(quotients)
+    for index in sorted(range(len(scaled)), key=remainders.__getitem__, reverse=True)[:leftover]:
+        quotients[index] += 1
+
+    return {
+        key: Decimal(quotient).scaleb(-places, _EXACT)
+        for key, quotient in zip(totals.keys(), quotients)
+    }
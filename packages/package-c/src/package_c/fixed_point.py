@@ -0,0 +1,514 @@
+"""Fixed-point decimal arithmetic on scaled integers for package-c."""
+
+from decimal import (
+    MAX_PREC,
+    ROUND_05UP,
+    ROUND_CEILING,
+    ROUND_DOWN,
+    ROUND_FLOOR,
+    ROUND_HALF_DOWN,
+    ROUND_HALF_EVEN,
+    ROUND_HALF_UP,
+    ROUND_UP,
+    Context,
+    Decimal,
+)
+from typing import Any, Iterable, List, Optional, Sequence, Tuple, Union
+
+ROUNDING_MODES = (
+    ROUND_HALF_EVEN,
+    ROUND_HALF_UP,
+    ROUND_HALF_DOWN,
+    ROUND_UP,
+    ROUND_DOWN,
+    ROUND_CEILING,
+    ROUND_FLOOR,
+    ROUND_05UP,
+)
+
+# Scaling a coefficient is always exact in this context
+_EXACT = Context(prec=MAX_PREC)
+_POWERS_OF_TEN: Tuple[int, ...] = tuple(10**i for i in range(19))
+
+
+def _power_of_ten(exponent: int) -> int:
+    if exponent < 19:
+        return _POWERS_OF_TEN[exponent]
+    return 10**exponent  # type: ignore[no-any-return]
+
+
+def _check_rounding(rounding: str) -> None:
+    if rounding not in ROUNDING_MODES:
+        raise ValueError(f"Unknown rounding mode {rounding!r}, expected one of {ROUNDING_MODES}")
+
+
+def round_division(numerator: int, denominator: int, rounding: str = ROUND_HALF_EVEN) -> int:
+    """
+    Divide two integers and round the exact quotient to an integer.
+
+    Rounding modes are the decimal module's, with the same meaning as in
+    Decimal.quantize().
+
+    Args:
+        numerator: Integer to divide
+        denominator: Non-zero integer to divide by
+        rounding: One of ROUNDING_MODES (default: ROUND_HALF_EVEN)
+
+    Returns:
+        Rounded quotient
+
+    Raises:
+        ZeroDivisionError: If denominator is zero
+        ValueError: If rounding is not a known mode
+    """
+    negative = (numerator < 0) != (denominator < 0)
+    divisor = -denominator if denominator < 0 else denominator
+    quotient, remainder = divmod(-numerator if numerator < 0 else numerator, divisor)
+    if remainder:
+        if rounding == ROUND_HALF_EVEN:
+            twice = remainder * 2
+            if twice > divisor or (twice == divisor and quotient & 1):
+                quotient += 1
+        elif rounding == ROUND_HALF_UP:
+            if remainder * 2 >= divisor:
+                quotient += 1
+        elif rounding == ROUND_HALF_DOWN:
+            if remainder * 2 > divisor:
+                quotient += 1
+        elif rounding == ROUND_UP:
+            quotient += 1
+        elif rounding == ROUND_CEILING:
+            if not negative:
+                quotient += 1
+        elif rounding == ROUND_FLOOR:
+            if negative:
+                quotient += 1
+        elif rounding == ROUND_05UP:
+            if quotient % 5 == 0:
+                quotient += 1
+        elif rounding != ROUND_DOWN:
+            _check_rounding(rounding)
+    else:
+        _check_rounding(rounding)
+    return -quotient if negative else quotient
+
+
+class FixedPoint:
+    """
+    Decimal number stored as an integer count of 10**-scale units.
+
+    FixedPoint(12345, 2) is 123.45. Arithmetic is exact integer arithmetic;
+    only division rounds, with an explicit rounding mode. Converting a
+    result to Decimal gives the same value and exponent as the equivalent
+    Decimal computation quantized to ``scale`` places; fixed-point has no
+    negative zero, so -0.00 comes back as 0.00.
+    """
+
+    __slots__ = ("value", "scale")
+
+    def __init__(self, value: int, scale: int = 2) -> None:
+        if scale < 0:
+            raise ValueError("scale must not be negative")
+        self.value = value
+        self.scale = scale
+
+    @classmethod
+    def from_value(
+        cls,
+        number: Union[int, float, Decimal, "FixedPoint"],
+        scale: int = 2,
+        rounding: str = ROUND_HALF_EVEN,
+    ) -> "FixedPoint":
+        """
+        Convert a number to fixed-point at the given scale.
+
+        Floats are converted through their shortest repr, like divide_precise().
+
+        Args:
+            number: Number to convert
+            scale: Decimal places to keep (default: 2)
+            rounding: Rounding mode if the number has more places (default: ROUND_HALF_EVEN)
+
+        Returns:
+            FixedPoint closest to number under the rounding mode
+        """
+        if type(number) is int:
+            return cls(number * _power_of_ten(scale), scale)
+        if isinstance(number, FixedPoint):
+            return number.rescale(scale, rounding)
+        if not isinstance(number, Decimal):
+            number = Decimal(str(number))
+        return cls.from_decimal(number, scale, rounding)
+
+    @classmethod
+    def from_decimal(
+        cls, number: Decimal, scale: int = 2, rounding: str = ROUND_HALF_EVEN
+    ) -> "FixedPoint":
+        """
+        Convert a finite Decimal to fixed-point at the given scale.
+
+        Args:
+            number: Decimal to convert
+            scale: Decimal places to keep (default: 2)
+            rounding: Rounding mode if the number has more places (default: ROUND_HALF_EVEN)
+
+        Returns:
+            FixedPoint equal to number.quantize() at that scale
+        """
+        numerator, denominator = number.as_integer_ratio()
+        return cls(round_division(numerator * _power_of_ten(scale), denominator, rounding), scale)
+
+    def to_decimal(self) -> Decimal:
+        """
+        Convert to a Decimal with exponent -scale.
+
+        Returns:
+            Exact Decimal value
+        """
+        return Decimal(self.value).scaleb(-self.scale, _EXACT)
+
+    def rescale(self, scale: int, rounding: str = ROUND_HALF_EVEN) -> "FixedPoint":
+        """
+        Change the number of decimal places, rounding if places are dropped.
+
+        Args:
+            scale: New number of decimal places
+            rounding: Rounding mode when reducing the scale (default: ROUND_HALF_EVEN)
+
+        Returns:
+            FixedPoint at the new scale
+        """
+        if scale >= self.scale:
+            return FixedPoint(self.value * _power_of_ten(scale - self.scale), scale)
+        return FixedPoint(
+            round_division(self.value, _power_of_ten(self.scale - scale), rounding), scale
+        )
+
+    def divide(
+        self,
+        other: Union[int, "FixedPoint"],
+        scale: Optional[int] = None,
+        rounding: str = ROUND_HALF_EVEN,
+    ) -> "FixedPoint":
+        """
+        Divide by an integer or another FixedPoint, rounding once.
+
+        Args:
+            other: Non-zero divisor
+            scale: Decimal places of the result (default: this number's scale)
+            rounding: Rounding mode (default: ROUND_HALF_EVEN)
+
+        Returns:
+            Rounded quotient
+
+        Raises:
+            ValueError: If other is zero
+        """
+        if scale is None:
+            scale = self.scale
+        numerator, denominator = _as_ratio(other)
+        if numerator == 0:
+            raise ValueError("Cannot divide by zero")
+        # (value / 10**s) / (num / den) * 10**scale, as one integer division
+        return FixedPoint(
+            round_division(
+                self.value * denominator * _power_of_ten(scale),
+                numerator * _power_of_ten(self.scale),
+                rounding,
+            ),
+            scale,
+        )
+
+    def _aligned(self, other: Any) -> Optional[Tuple[int, int, int]]:
+        if type(other) is int:
+            return self.value, other * _power_of_ten(self.scale), self.scale
+        if not isinstance(other, FixedPoint):
+            return None
+        if self.scale == other.scale:
+            return self.value, other.value, self.scale
+        if self.scale > other.scale:
+            return (
+                self.value,
+                other.value * _power_of_ten(self.scale - other.scale),
+                self.scale,
+            )
+        return self.value * _power_of_ten(other.scale - self.scale), other.value, other.scale
+
+    def __add__(self, other: Any) -> "FixedPoint":
+        aligned = self._aligned(other)
+        if aligned is None:
+            return NotImplemented
+        return FixedPoint(aligned[0] + aligned[1], aligned[2])
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Any) -> "FixedPoint":
+        aligned = self._aligned(other)
+        if aligned is None:
+            return NotImplemented
+        return FixedPoint(aligned[0] - aligned[1], aligned[2])
+
+    def __rsub__(self, other: Any) -> "FixedPoint":
+        aligned = self._aligned(other)
+        if aligned is None:
+            return NotImplemented
+        return FixedPoint(aligned[1] - aligned[0], aligned[2])
+
+    def __mul__(self, other: Any) -> "FixedPoint":
+        if type(other) is not int:
+            return NotImplemented
+        return FixedPoint(self.value * other, self.scale)
+
+    __rmul__ = __mul__
+
+    def __neg__(self) -> "FixedPoint":
+        return FixedPoint(-self.value, self.scale)
+
+    def __abs__(self) -> "FixedPoint":
+        return FixedPoint(abs(self.value), self.scale)
+
+    def __eq__(self, other: Any) -> bool:
+        aligned = self._aligned(other)
+        if aligned is None:
+            return NotImplemented
+        return aligned[0] == aligned[1]
+
+    def __lt__(self, other: Any) -> bool:
+        aligned = self._aligned(other)
+        if aligned is None:
+            return NotImplemented
+        return aligned[0] < aligned[1]
+
+    def __le__(self, other: Any) -> bool:
+        aligned = self._aligned(other)
+        if aligned is None:
+            return NotImplemented
+        return aligned[0] <= aligned[1]
+
+    def __gt__(self, other: Any) -> bool:
+        aligned = self._aligned(other)
+        if aligned is None:
+            return NotImplemented
+        return aligned[0] > aligned[1]
+
+    def __ge__(self, other: Any) -> bool:
+        aligned = self._aligned(other)
+        if aligned is None:
+            return NotImplemented
+        return aligned[0] >= aligned[1]
+
+    def __hash__(self) -> int:
+        # Equal values at different scales must hash alike
+        return hash(self.to_decimal())
+
+    def __float__(self) -> float:
+        return self.value / _power_of_ten(self.scale)
+
+    def __repr__(self) -> str:
+        return f"FixedPoint({self.value}, {self.scale})"
+
+    def __str__(self) -> str:
+        if self.scale == 0:
+            return str(self.value)
+        digits = str(abs(self.value)).rjust(self.scale + 1, "0")
+        sign = "-" if self.value < 0 else ""
+        return f"{sign}{digits[: -self.scale]}.{digits[-self.scale :]}"
+
+
+def _as_ratio(number: Union[int, FixedPoint]) -> Tuple[int, int]:
+    if type(number) is int:
+        return number, 1
+    if isinstance(number, FixedPoint):
+        return number.value, _power_of_ten(number.scale)
+    raise TypeError(f"Expected int or FixedPoint, got {type(number).__name__}")
+
+
+def divide(
+    numerator: Union[int, FixedPoint],
+    denominator: Union[int, FixedPoint],
+    scale: int = 2,
+    rounding: str = ROUND_HALF_EVEN,
+) -> FixedPoint:
+    """
+    Divide two numbers into a fixed-point result, rounding once.
+
+    With the default rounding, ``divide(a, b, n).to_decimal()`` equals
+    ``divide_precise(a, b, n)`` for integers a and b.
+
+    Args:
+        numerator: Integer or FixedPoint to divide
+        denominator: Integer or FixedPoint to divide by
+        scale: Decimal places of the result (default: 2)
+        rounding: Rounding mode (default: ROUND_HALF_EVEN)
+
+    Returns:
+        Rounded quotient
+
+    Raises:
+        ValueError: If denominator is zero
+    """
+    if type(numerator) is int and type(denominator) is int:
+        if denominator == 0:
+            raise ValueError("Cannot divide by zero")
+        value = round_division(numerator * _power_of_ten(scale), denominator, rounding)
+        return FixedPoint(value, scale)
+
+    num_a, den_a = _as_ratio(numerator)
+    num_b, den_b = _as_ratio(denominator)
+    if num_b == 0:
+        raise ValueError("Cannot divide by zero")
+    return FixedPoint(
+        round_division(num_a * den_b * _power_of_ten(scale), den_a * num_b, rounding), scale
+    )
+
+
+def percentage(
+    value: Union[int, FixedPoint],
+    total: Union[int, FixedPoint],
+    scale: int = 2,
+    rounding: str = ROUND_HALF_EVEN,
+) -> FixedPoint:
+    """
+    Calculate value / total * 100 as fixed-point, rounding once.
+
+    Args:
+        value: The value
+        total: The total
+        scale: Decimal places of the result (default: 2)
+        rounding: Rounding mode (default: ROUND_HALF_EVEN)
+
+    Returns:
+        Rounded percentage
+
+    Raises:
+        ValueError: If total is zero
+    """
+    num_a, den_a = _as_ratio(value)
+    num_b, den_b = _as_ratio(total)
+    if num_b == 0:
+        raise ValueError("Total cannot be zero")
+    return FixedPoint(
+        round_division(num_a * den_b * 100 * _power_of_ten(scale), den_a * num_b, rounding),
+        scale,
+    )
+
+
+def fixed_sum(values: Iterable[FixedPoint], scale: Optional[int] = None) -> FixedPoint:
+    """
+    Sum FixedPoint values exactly in one pass.
+
+    Args:
+        values: Values to add; their scales may differ
+        scale: Scale of the result, rounded half to even if smaller than the
+            largest input scale (default: the largest input scale)
+
+    Returns:
+        Exact sum, or FixedPoint(0, scale or 0) for no values
+    """
+    total = 0
+    total_scale = 0
+    for item in values:
+        if item.scale == total_scale:
+            total += item.value
+        elif item.scale < total_scale:
+            total += item.value * _power_of_ten(total_scale - item.scale)
+        else:
+            total = total * _power_of_ten(item.scale - total_scale) + item.value
+            total_scale = item.scale
+    result = FixedPoint(total, total_scale)
+    if scale is not None and scale != total_scale:
+        return result.rescale(scale)
+    return result
+
+
+def divide_many(
+    numerators: Any,
+    denominators: Any,
+    scale: int = 2,
+    rounding: str = ROUND_HALF_EVEN,
+) -> Any:
+    """
+    Divide integers pairwise into scaled integers (units of 10**-scale).
+
+    NumPy integer arrays are divided with vectorized integer arithmetic in
+    int64, or as Python ints when int64 could overflow; sequences are
+    divided in one comprehension. Results equal ``divide(a, b, scale,
+    rounding).value`` element by element.
+
+    Args:
+        numerators: NumPy integer array or sequence of ints
+        denominators: NumPy integer array or sequence of ints, broadcast
+            against numerators for arrays
+        scale: Decimal places of the results (default: 2)
+        rounding: Rounding mode (default: ROUND_HALF_EVEN)
+
+    Returns:
+        int64 or object ndarray for array input, otherwise a list of ints
+
+    Raises:
+        TypeError: If an operand is not an integer (floats are never truncated)
+        ValueError: If any denominator is zero
+    """
+    if _is_numpy(numerators) or _is_numpy(denominators):
+        import numpy as np
+
+        n, d = np.broadcast_arrays(np.asarray(numerators), np.asarray(denominators))
+        if n.dtype.kind not in "iu" or d.dtype.kind not in "iu":
+            raise TypeError(f"Expected integer arrays, got {n.dtype} and {d.dtype}")
+        if (d == 0).any():
+            raise ValueError("Cannot divide by zero")
+        return _divide_arrays(np, n, d, _power_of_ten(scale), rounding)
+
+    return _divide_sequences(numerators, denominators, _power_of_ten(scale), rounding)
+
+
+def _is_numpy(value: Any) -> bool:
+    return type(value).__module__.startswith("numpy")
+
+
+def _divide_sequences(
+    numerators: Sequence[int], denominators: Sequence[int], multiplier: int, rounding: str
+) -> List[int]:
+    for number in (*numerators, *denominators):
+        if type(number) is not int:
+            raise TypeError(f"Expected int, got {type(number).__name__}")
+    if 0 in denominators:
+        raise ValueError("Cannot divide by zero")
+    return [round_division(a * multiplier, b, rounding) for a, b in zip(numerators, denominators)]
+
+
+def _divide_arrays(np: Any, n: Any, d: Any, multiplier: int, rounding: str) -> Any:
+    # Vectorized round_division(n * multiplier, d, rounding) for integer arrays
+    _check_rounding(rounding)
+    if n.size == 0:
+        return np.zeros(n.shape, dtype=np.int64)
+    bound = max(abs(int(n.min())), abs(int(n.max())), abs(int(d.min())), abs(int(d.max())))
+    if bound * multiplier * 2 >= 2**63 or n.dtype == np.uint64 or d.dtype == np.uint64:
+        # Python ints cannot overflow
+        n = n.astype(object)
+        d = d.astype(object)
+    else:
+        n = n.astype(np.int64)
+        d = d.astype(np.int64)
+
+    negative = (n < 0) != (d < 0)
+    divisor = np.abs(d)
+    dividend = np.abs(n) * multiplier
+    quotient = dividend // divisor
+    remainder = dividend % divisor
+    if rounding == ROUND_HALF_EVEN:
+        twice = remainder * 2
+        quotient += (twice > divisor) | ((twice == divisor) & (quotient % 2 == 1))
+    elif rounding == ROUND_HALF_UP:
+        quotient += (remainder != 0) & (remainder * 2 >= divisor)
+    elif rounding == ROUND_HALF_DOWN:
+        quotient += remainder * 2 > divisor
+    elif rounding == ROUND_UP:
+        quotient += remainder != 0
+    elif rounding == ROUND_CEILING:
+        quotient += (remainder != 0) & ~negative
+    elif rounding == ROUND_FLOOR:
+        quotient += (remainder != 0) & negative
+    elif rounding == ROUND_05UP:
+        quotient += (remainder != 0) & (quotient % 5 == 0)
+    return np.where(negative, -quotient, quotient)
@@ -1,17 +1,33 @@
 """Math helper functions for package-c."""
 
-from decimal import Decimal
-from typing import Union
+from decimal import ROUND_HALF_EVEN, Context, Decimal
+from functools import lru_cache
+from typing import Any, Optional, Union
+
+from package_c.fixed_point import divide_many
+
+# Shared by every divide_precise() call, so results do not depend on the
+# caller's thread-local decimal context
+_CONTEXT = Context(prec=50, rounding=ROUND_HALF_EVEN)
+_MAX_COEFFICIENT = 10**_CONTEXT.prec
+_divide = _CONTEXT.divide
+
+ARRAY_MODES = ("exact", "float")
+ZERO_POLICIES = ("raise", "nan", "mask")
 
 
 def divide_precise(
-    numerator: Union[int, float],
-    denominator: Union[int, float],
+    numerator: Union[int, float, Decimal],
+    denominator: Union[int, float, Decimal],
     decimal_places: int = 2,
 ) -> Decimal:
     """
     Divide two numbers with precise decimal handling.
 
+    Floats are converted through their shortest repr, so 0.1 is treated as
+    Decimal("0.1"). Results are rounded half to even; negative
+    decimal_places behave like 0.
+
     Args:
         numerator: Number to divide
         denominator: Number to divide by
@@ -26,9 +42,43 @@ def divide_precise(
     if denominator == 0:
         raise ValueError("Cannot divide by zero")
 
-    result = Decimal(str(numerator)) / Decimal(str(denominator))
-    quantize_str = "0." + "0" * decimal_places
-    return result.quantize(Decimal(quantize_str))
+    places = decimal_places if decimal_places > 0 else 0
+    if type(numerator) is int and type(denominator) is int:
+        result = _divide_int(numerator, denominator, places)
+        if result is not None:
+            return result
+
+    quotient = _divide(_to_decimal(numerator), _to_decimal(denominator))
+    return quotient.quantize(_quantizer(places), None, _CONTEXT)
+
+
+@lru_cache(maxsize=64)
+def _quantizer(decimal_places: int) -> Decimal:
+    return Decimal(1).scaleb(-decimal_places)
+
+
+def _to_decimal(value: Union[int, float, Decimal]) -> Decimal:
+    kind = type(value)
+    if kind is Decimal:
+        return value  # type: ignore[return-value]
+    if kind is int:
+        return Decimal(value)
+    return Decimal(str(value))
+
+
+def _divide_int(numerator: int, denominator: int, places: int) -> Optional[Decimal]:
+    # Exact scaled-integer division; None if the result needs more digits
+    # than the context holds, so the Decimal path can report it
+    divisor = abs(denominator)
+    scaled, remainder = divmod(abs(numerator) * 10**places, divisor)
+    twice = remainder * 2
+    if twice > divisor or (twice == divisor and scaled & 1):
+        scaled += 1
+    if scaled >= _MAX_COEFFICIENT:
+        return None
+    result = Decimal(scaled).scaleb(-places, _CONTEXT)
+    # Keep Decimal's sign rules, including -0.00 for a negative zero quotient
+    return result.copy_negate() if (numerator < 0) != (denominator < 0) else result
 
 
 def percentage(
@@ -55,3 +105,182 @@ def percentage(
 
     result = (value / total) * 100
     return round(result, decimal_places)
+
+
+def divide_precise_array(
+    numerators: Any,
+    denominators: Any,
+    decimal_places: int = 2,
+    mode: str = "exact",
+    on_zero: str = "raise",
+) -> Any:
+    """
+    Divide arrays of numbers element-wise in bulk.
+
+    In "exact" mode every element equals divide_precise() for the same
+    pair. Integer arrays are divided with vectorized scaled-integer
+    arithmetic (int64, or Python ints when int64 could overflow); other
+    inputs fall back to divide_precise() per element. In "float" mode the
+    result is a float64 array equal to round(n / d, decimal_places).
+
+    Zero denominators are all found before anything is computed and
+    handled by on_zero: "raise" raises ValueError naming how many there
+    are and where the first one is, "nan" fills those elements with NaN
+    (Decimal("NaN") in exact mode), and "mask" returns a
+    numpy.ma.MaskedArray with them masked.
+
+    Requires numpy.
+
+    Args:
+        numerators: Array or sequence of numbers to divide
+        denominators: Array or sequence of numbers to divide by, or a
+            scalar; broadcast against numerators
+        decimal_places: Number of decimal places (default: 2)
+        mode: "exact" for Decimal results or "float" (default: "exact")
+        on_zero: "raise", "nan" or "mask" (default: "raise")
+
+    Returns:
+        Object array of Decimal ("exact") or float64 array ("float")
+
+    Raises:
+        ValueError: If on_zero is "raise" and any denominator is zero
+    """
+    return _divide_array(
+        numerators, denominators, decimal_places, mode, on_zero, 0, "Cannot divide by zero"
+    )
+
+
+def percentage_array(
+    values: Any,
+    totals: Any,
+    decimal_places: int = 2,
+    mode: str = "float",
+    on_zero: str = "raise",
+) -> Any:
+    """
+    Calculate percentages of arrays of values relative to totals in bulk.
+
+    In "float" mode every element equals percentage() for the same pair.
+    In "exact" mode elements are Decimal, equal to divide_precise() of
+    value * 100 by total. Vectorization and zero-total handling are as in
+    divide_precise_array().
+
+    Requires numpy.
+
+    Args:
+        values: Array or sequence of values
+        totals: Array or sequence of totals, or a scalar; broadcast against values
+        decimal_places: Number of decimal places (default: 2)
+        mode: "float" or "exact" for Decimal results (default: "float")
+        on_zero: "raise", "nan" or "mask" (default: "raise")
+
+    Returns:
+        float64 array ("float") or object array of Decimal ("exact")
+
+    Raises:
+        ValueError: If on_zero is "raise" and any total is zero
+    """
+    return _divide_array(values, totals, decimal_places, mode, on_zero, 2, "Total cannot be zero")
+
+
+def _import_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "Array math requires 'numpy'. Please install with: pip install 'package-c[numpy]'"
+        ) from e
+    return numpy
+
+
+def _divide_array(
+    numerators: Any,
+    denominators: Any,
+    decimal_places: int,
+    mode: str,
+    on_zero: str,
+    shift: int,
+    zero_message: str,
+) -> Any:
+    # shift: the quotient is multiplied by 10**shift (2 for percentages)
+    if mode not in ARRAY_MODES:
+        raise ValueError(f"Unknown mode {mode!r}, expected one of {ARRAY_MODES}")
+    if on_zero not in ZERO_POLICIES:
+        raise ValueError(f"Unknown zero policy {on_zero!r}, expected one of {ZERO_POLICIES}")
+
+    np = _import_numpy()
+    n, d = np.broadcast_arrays(np.asarray(numerators), np.asarray(denominators))
+    zero = d == 0
+    has_zero = bool(zero.any())
+    if has_zero:
+        if on_zero == "raise":
+            count = int(np.count_nonzero(zero))
+            first = int(np.flatnonzero(zero)[0])
+            raise ValueError(f"{zero_message}: {count} zero value(s), first at index {first}")
+        d = np.where(zero, 1, d)
+
+    if mode == "float":
+        quotient = np.divide(n, d, dtype=np.float64)
+        if shift:
+            quotient *= 10**shift
+        result = _round_half_even(np, quotient, decimal_places)
+        fill: Any = np.nan
+    else:
+        places = decimal_places if decimal_places > 0 else 0
+        result = None
+        if n.dtype.kind in "iu" and d.dtype.kind in "iu":
+            result = _divide_scaled_int(np, n, d, places, shift)
+        if result is None:
+            divide = divide_precise if shift == 0 else _percentage_exact
+            result = np.empty(n.shape, dtype=object)
+            result.reshape(-1)[:] = [
+                divide(a, b, places) for a, b in zip(n.ravel().tolist(), d.ravel().tolist())
+            ]
+        fill = Decimal("NaN")
+
+    if has_zero:
+        if on_zero == "mask":
+            return np.ma.masked_array(result, mask=zero)
+        result[zero] = fill
+    return result
+
+
+def _percentage_exact(value: Any, total: Any, decimal_places: int) -> Decimal:
+    return divide_precise(_CONTEXT.multiply(_to_decimal(value), 100), total, decimal_places)
+
+
+def _divide_scaled_int(np: Any, n: Any, d: Any, places: int, shift: int) -> Any:
+    # Vectorized _divide_int(); None if a result needs the Decimal path
+    scaled = divide_many(n, d, places + shift)
+    if scaled.dtype == object and scaled.size and int(abs(scaled).max()) >= _MAX_COEFFICIENT:
+        return None
+
+    exponent = -places
+    values = [Decimal(k).scaleb(exponent, _CONTEXT) for k in scaled.ravel().tolist()]
+    # A negative quotient that rounds to zero keeps its sign, as in divide_precise()
+    negative_zero = ((n < 0) != (d < 0)) & (scaled == 0)
+    for i in np.flatnonzero(negative_zero).tolist():
+        values[i] = values[i].copy_negate()
+    result = np.empty(n.shape, dtype=object)
+    result.reshape(-1)[:] = values
+    return result
+
+
+def _round_half_even(np: Any, values: Any, decimal_places: int) -> Any:
+    # np.round scales, rounds and unscales, which can pick the other side of a
+    # near-tie than round(); redo those few elements with round() itself
+    result = np.round(values, decimal_places)
+    half_unit = 0.5 * 10.0**-decimal_places
+    # |value - rounded| within float error of half a unit; in place to limit temporaries
+    with np.errstate(invalid="ignore"):
+        distance = np.subtract(values, result)
+    np.abs(distance, out=distance)
+    slack = np.abs(values)
+    slack *= 1e-15
+    slack += half_unit * 1e-9
+    distance += slack
+    indices = np.flatnonzero(distance >= half_unit)
+    if indices.size:
+        flat = result.reshape(-1)
+        flat[indices] = [round(v, decimal_places) for v in values.ravel()[indices].tolist()]
+    return result
@@ -0,0 +1,187 @@
+"""Memoized division for package-c."""
+
+import math
+import threading
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Any, Hashable, NamedTuple, Union
+
+from package_c.math_helpers import divide_precise, percentage
+
+# Stands in for a negative zero, which compares equal to 0 but keeps its
+# sign in the result
+_NEGATIVE_ZERO = ("-0",)
+
+_MISSING = object()
+
+_DIVIDE = 0
+_PERCENTAGE = 1
+
+
+class CacheInfo(NamedTuple):
+    """Memo statistics, as reported by DivisionCache.cache_info()."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class DivisionCache:
+    """
+    Bounded LRU memo in front of divide_precise() and percentage().
+
+    Arguments are keyed by numeric value, so 10, 10.0 and Decimal("10")
+    share a divide_precise() entry. percentage() returns a Decimal for
+    Decimal input and a float otherwise, so there Decimals are keyed apart
+    from equal ints and floats. Values that compare equal but divide differently, such
+    as Decimal(0.1) and 0.1 (which divide_precise() reads as "0.1"), or a
+    negative and a positive zero, get separate entries. Errors are raised
+    on every call and never cached.
+
+    One instance can be shared between threads. Use the plain functions
+    where inputs rarely repeat, or for Decimal operands, which divide
+    faster than a cache lookup.
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def divide_precise(
+        self,
+        numerator: Union[int, float, Decimal],
+        denominator: Union[int, float, Decimal],
+        decimal_places: int = 2,
+    ) -> Decimal:
+        """
+        Memoized divide_precise().
+
+        Args:
+            numerator: Number to divide
+            denominator: Number to divide by
+            decimal_places: Number of decimal places (default: 2)
+
+        Returns:
+            Result as Decimal with specified precision
+
+        Raises:
+            ValueError: If denominator is zero
+        """
+        places = decimal_places if decimal_places > 0 else 0
+        key = (
+            _DIVIDE,
+            numerator if type(numerator) is int else _decimal_key(numerator),
+            denominator if type(denominator) is int else _decimal_key(denominator),
+            places,
+        )
+        with self._lock:
+            result = self._entries.get(key, _MISSING)
+            if result is not _MISSING:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return result  # type: ignore[no-any-return]
+            self._misses += 1
+        quotient = divide_precise(numerator, denominator, places)
+        self._store(key, quotient)
+        return quotient
+
+    def percentage(
+        self,
+        value: Union[int, float],
+        total: Union[int, float],
+        decimal_places: int = 2,
+    ) -> float:
+        """
+        Memoized percentage().
+
+        Args:
+            value: The value
+            total: The total
+            decimal_places: Number of decimal places (default: 2)
+
+        Returns:
+            Percentage as float
+
+        Raises:
+            ValueError: If total is zero
+        """
+        key = (_PERCENTAGE, _float_key(value), _float_key(total), decimal_places)
+        with self._lock:
+            result = self._entries.get(key, _MISSING)
+            if result is not _MISSING:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return result  # type: ignore[no-any-return]
+            self._misses += 1
+        share = percentage(value, total, decimal_places)
+        self._store(key, share)
+        return share
+
+    def _store(self, key: Hashable, result: Any) -> None:
+        # Computed outside the lock; a racing thread may store the same result
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Return hit/miss statistics.
+
+        Returns:
+            CacheInfo(hits, misses, maxsize, currsize)
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._entries))
+
+    def cache_clear(self) -> None:
+        """Discard all cached results and statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def __repr__(self) -> str:
+        return f"DivisionCache(maxsize={self.maxsize}, currsize={len(self._entries)})"
+
+
+def _decimal_key(value: Union[int, float, Decimal]) -> Hashable:
+    # Ints, floats and Decimals hash by numeric value, so a key only needs
+    # rewriting where equal values divide differently. A float stands for
+    # its repr, which is exact below 1e16; a Decimal can only equal a float
+    # if its denominator is a power of two.
+    kind = type(value)
+    if kind is float:
+        if value == 0:
+            return _NEGATIVE_ZERO if math.copysign(1.0, value) < 0 else 0
+        if -1e16 < value < 1e16:
+            return value
+        value = Decimal(str(value))
+    elif kind is not Decimal:
+        return value
+    if not value.is_finite():  # type: ignore[union-attr]
+        return (value,)
+    if not value:
+        return _NEGATIVE_ZERO if value.is_signed() else 0  # type: ignore[union-attr]
+    denominator = value.as_integer_ratio()[1]
+    if denominator == 1 or denominator & (denominator - 1):
+        return value
+    if Decimal(repr(float(value))) == value:
+        return float(value)
+    return (value,)
+
+
+def _float_key(value: Union[int, float]) -> Hashable:
+    if isinstance(value, Decimal):
+        # Same value, but the result is a Decimal rather than a float
+        return (value,)
+    if type(value) is float and value == 0 and math.copysign(1.0, value) < 0:
+        return _NEGATIVE_ZERO
+    return value
@@ -0,0 +1,315 @@
+"""Mergeable quantile sketch for package-c."""
+
+import math
+import struct
+import sys
+from typing import Any, Dict, Iterable, List, Tuple, Union
+
+_MAGIC = b"DDS1"
+# magic, relative accuracy, max bins, count, zero count, sum, min, max,
+# positive bin count, negative bin count, positive floor, negative floor
+_HEADER = struct.Struct("<4sdIQQdddIIqq")
+_BIN = struct.Struct("<qQ")
+_NO_FLOOR = -(2**63)
+
+# Magnitudes below this are counted as zero
+_MIN_INDEXABLE = sys.float_info.min
+
+
+class DDSketch:
+    """
+    Quantile sketch with relative-error guarantees (DDSketch).
+
+    Values are counted in logarithmic bins so that every quantile of
+    positive or negative values is returned within ``relative_accuracy``
+    of the true value (e.g. 1% for 0.01). Memory is bounded by
+    ``max_bins`` bins per sign, whatever the number of values; if more
+    are needed, the bins closest to zero are merged, so only the very
+    lowest quantiles lose accuracy.
+
+    Sketches with the same parameters can be merged, and serialized with
+    to_bytes() to ship between processes.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_bins: int = 2048) -> None:
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        if max_bins < 1:
+            raise ValueError("max_bins must be at least 1")
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self.count = 0
+        self.zero_count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._gamma = gamma
+        self._multiplier = 1 / math.log(gamma)
+        # bin key -> count, for magnitudes of positive and negative values
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}
+        # Keys below the floor have been folded into it
+        self._floors = [_NO_FLOOR, _NO_FLOOR]
+
+    def _key(self, magnitude: float) -> int:
+        return math.ceil(math.log(magnitude) * self._multiplier)
+
+    def _value(self, key: int) -> float:
+        # Midpoint of the bin (gamma**(key-1), gamma**key] in relative terms
+        return 2 * self._gamma**key / (self._gamma + 1)
+
+    def add(self, value: float) -> None:
+        """
+        Add one value to the sketch.
+
+        Args:
+            value: Finite number to add
+
+        Raises:
+            ValueError: If value is NaN or infinite
+        """
+        if not math.isfinite(value):
+            raise ValueError(f"Cannot add non-finite value {value!r}")
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+        if value > _MIN_INDEXABLE:
+            self._insert(0, self._key(value), 1)
+        elif value < -_MIN_INDEXABLE:
+            self._insert(1, self._key(-value), 1)
+        else:
+            self.zero_count += 1
+
+    def _insert(self, sign: int, key: int, count: int) -> None:
+        store = self._negative if sign else self._positive
+        floor = self._floors[sign]
+        if key < floor:
+            key = floor
+        if key in store:
+            store[key] += count
+        else:
+            store[key] = count
+            if len(store) > self.max_bins:
+                self._collapse(sign)
+
+    def _collapse(self, sign: int) -> None:
+        store = self._negative if sign else self._positive
+        keys = sorted(store)
+        floor = keys[len(keys) - self.max_bins]
+        folded = 0
+        for key in keys[: len(keys) - self.max_bins]:
+            folded += store.pop(key)
+        store[floor] += folded
+        self._floors[sign] = floor
+
+    def add_many(self, values: Union[Iterable[float], Any]) -> None:
+        """
+        Add many values; NumPy arrays are binned with vectorized operations.
+
+        Args:
+            values: Finite numbers to add
+
+        Raises:
+            ValueError: If any value is NaN or infinite
+        """
+        if not type(values).__module__.startswith("numpy"):
+            for value in values:
+                self.add(value)
+            return
+
+        import numpy as np
+
+        array = np.asarray(values, dtype=np.float64).ravel()
+        if array.size == 0:
+            return
+        if not np.isfinite(array).all():
+            raise ValueError("Cannot add non-finite values")
+
+        self.count += int(array.size)
+        self.sum += math.fsum(array)
+        self.min = min(self.min, float(array.min()))
+        self.max = max(self.max, float(array.max()))
+
+        positive = array[array > _MIN_INDEXABLE]
+        negative = -array[array < -_MIN_INDEXABLE]
+        self.zero_count += int(array.size - positive.size - negative.size)
+        for sign, magnitudes in ((0, positive), (1, negative)):
+            if magnitudes.size:
+                keys = np.ceil(np.log(magnitudes) * self._multiplier).astype(np.int64)
+                unique, counts = np.unique(keys, return_counts=True)
+                for key, count in zip(unique.tolist(), counts.tolist()):
+                    self._insert(sign, key, count)
+
+    def merge(self, other: "DDSketch") -> "DDSketch":
+        """
+        Add another sketch's values to this one.
+
+        Args:
+            other: Sketch with the same relative_accuracy
+
+        Returns:
+            This sketch
+
+        Raises:
+            ValueError: If the sketches have different relative accuracy
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        if other.count == 0:
+            return self
+        self.count += other.count
+        self.zero_count += other.zero_count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        for sign, store in ((0, other._positive), (1, other._negative)):
+            for key, count in store.items():
+                self._insert(sign, key, count)
+        return self
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the q-quantile of the values added so far.
+
+        Args:
+            q: Quantile between 0 and 1 (e.g. 0.99 for p99)
+
+        Returns:
+            Estimated value, within the relative accuracy of the true quantile
+
+        Raises:
+            ValueError: If q is out of range or the sketch is empty
+        """
+        return self.quantiles([q])[0]
+
+    def quantiles(self, qs: Iterable[float]) -> List[float]:
+        """
+        Estimate several quantiles with one pass over the bins.
+
+        Args:
+            qs: Quantiles between 0 and 1
+
+        Returns:
+            Estimated values in the order of qs
+
+        Raises:
+            ValueError: If a quantile is out of range or the sketch is empty
+        """
+        qs = list(qs)
+        if self.count == 0:
+            raise ValueError("Sketch is empty")
+        for q in qs:
+            if not 0 <= q <= 1:
+                raise ValueError(f"Quantile {q} must be between 0 and 1")
+
+        # Bins in ascending value order: negatives (largest magnitude first), zero, positives
+        bins: List[Tuple[float, int]] = [
+            (-self._value(key), self._negative[key]) for key in sorted(self._negative, reverse=True)
+        ]
+        if self.zero_count:
+            bins.append((0.0, self.zero_count))
+        bins.extend((self._value(key), self._positive[key]) for key in sorted(self._positive))
+
+        order = sorted(range(len(qs)), key=qs.__getitem__)
+        results = [0.0] * len(qs)
+        seen = 0
+        index = 0
+        for i in order:
+            rank = qs[i] * (self.count - 1)
+            while seen + bins[index][1] <= rank:
+                seen += bins[index][1]
+                index += 1
+            if qs[i] == 0:
+                results[i] = self.min
+            elif qs[i] == 1:
+                results[i] = self.max
+            else:
+                # Bin estimates are clamped to the exact extremes
+                results[i] = min(max(bins[index][0], self.min), self.max)
+        return results
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the sketch.
+
+        Returns:
+            Compact binary representation, readable by from_bytes()
+        """
+        parts = [
+            _HEADER.pack(
+                _MAGIC,
+                self.relative_accuracy,
+                self.max_bins,
+                self.count,
+                self.zero_count,
+                self.sum,
+                self.min,
+                self.max,
+                len(self._positive),
+                len(self._negative),
+                self._floors[0],
+                self._floors[1],
+            )
+        ]
+        for store in (self._positive, self._negative):
+            parts.extend(_BIN.pack(key, count) for key, count in store.items())
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "DDSketch":
+        """
+        Rebuild a sketch serialized with to_bytes().
+
+        Args:
+            data: Serialized sketch
+
+        Returns:
+            Equivalent sketch
+
+        Raises:
+            ValueError: If data is not a serialized sketch
+        """
+        if len(data) < _HEADER.size or data[:4] != _MAGIC:
+            raise ValueError("Not a serialized DDSketch")
+        (
+            _,
+            relative_accuracy,
+            max_bins,
+            count,
+            zero_count,
+            total,
+            minimum,
+            maximum,
+            positive_bins,
+            negative_bins,
+            positive_floor,
+            negative_floor,
+        ) = _HEADER.unpack_from(data)
+        if len(data) != _HEADER.size + _BIN.size * (positive_bins + negative_bins):
+            raise ValueError("Serialized DDSketch has the wrong length")
+
+        sketch = cls(relative_accuracy, max_bins)
+        sketch.count = count
+        sketch.zero_count = zero_count
+        sketch.sum = total
+        sketch.min = minimum
+        sketch.max = maximum
+        sketch._floors = [positive_floor, negative_floor]
+        bins = _BIN.iter_unpack(data[_HEADER.size :])
+        for _ in range(positive_bins):
+            key, bin_count = next(bins)
+            sketch._positive[key] = bin_count
+        for key, bin_count in bins:
+            sketch._negative[key] = bin_count
+        return sketch
+
+    def __repr__(self) -> str:
+        return (
+            f"DDSketch(relative_accuracy={self.relative_accuracy}, count={self.count}, "
+            f"bins={len(self._positive) + len(self._negative)})"
+        )
@@ -0,0 +1,206 @@
+"""Streaming aggregate statistics for package-c."""
+
+import math
+from decimal import MAX_PREC, Context, Decimal
+from typing import Any, Iterable, Optional, Union
+
+from package_c.math_helpers import percentage
+
+# Adding Decimals in this context never rounds
+_EXACT = Context(prec=MAX_PREC)
+
+
+class RunningStats:
+    """
+    Count, sum, mean, variance, min and max of a stream in O(1) memory.
+
+    The float sum is kept with Neumaier compensation, and the mean is that
+    sum over the count; variance uses Welford's algorithm. With
+    ``exact=True`` an exact Decimal sum is kept as well (floats converted
+    through their shortest repr, like divide_precise()).
+
+    Partial results from separate workers can be combined with merge();
+    instances pickle as plain objects.
+    """
+
+    def __init__(self, exact: bool = True) -> None:
+        self.count = 0
+        self.min: Optional[Union[int, float]] = None
+        self.max: Optional[Union[int, float]] = None
+        self.exact = exact
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._sum = 0.0
+        self._compensation = 0.0
+        self._int_sum = 0
+        self._decimal_sum = Decimal(0)
+
+    def add(self, value: Union[int, float]) -> None:
+        """
+        Add one value to the statistics.
+
+        Args:
+            value: Number to add
+        """
+        self.count += 1
+        delta = value - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (value - self._mean)
+
+        total = self._sum + value
+        if abs(self._sum) >= abs(value):
+            self._compensation += (self._sum - total) + value
+        else:
+            self._compensation += (value - total) + self._sum
+        self._sum = total
+
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+        if self.exact:
+            if type(value) is int:
+                self._int_sum += value
+            else:
+                self._decimal_sum = _EXACT.add(self._decimal_sum, Decimal(str(value)))
+
+    def update(self, values: Iterable[Union[int, float]]) -> None:
+        """
+        Add many values; NumPy arrays are aggregated with vectorized operations.
+
+        Args:
+            values: Numbers to add
+        """
+        if type(values).__module__.startswith("numpy"):
+            self._update_array(values)
+            return
+        for value in values:
+            self.add(value)
+
+    def _update_array(self, array: Any) -> None:
+        array = array.ravel()
+        if array.size == 0:
+            return
+        chunk = RunningStats(exact=False)
+        floats = array.astype(float)
+        chunk.count = int(array.size)
+        chunk._mean = float(floats.mean())
+        chunk._m2 = float(((floats - chunk._mean) ** 2).sum())
+        chunk._sum = math.fsum(floats)
+        chunk.min = array.min().item()
+        chunk.max = array.max().item()
+        if self.exact:
+            chunk.exact = True
+            if array.dtype.kind in "iu":
+                chunk._int_sum = sum(array.tolist())
+            else:
+                total = Decimal(0)
+                for text in map(str, array.tolist()):
+                    total = _EXACT.add(total, Decimal(text))
+                chunk._decimal_sum = total
+        self.merge(chunk)
+
+    def merge(self, other: "RunningStats") -> "RunningStats":
+        """
+        Combine another instance's statistics into this one.
+
+        The result is the same as if every value had been added here. The
+        exact sum is only kept if both instances track it.
+
+        Args:
+            other: Statistics of a disjoint part of the stream
+
+        Returns:
+            This instance
+        """
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            exact = self.exact and other.exact
+            self.__dict__.update(other.__dict__)
+            self.exact = exact
+            return self
+
+        count = self.count + other.count
+        delta = other._mean - self._mean
+        self._mean += delta * other.count / count
+        self._m2 += other._m2 + delta * delta * self.count * other.count / count
+        self.count = count
+
+        total = self._sum + other._sum
+        if abs(self._sum) >= abs(other._sum):
+            self._compensation += (self._sum - total) + other._sum
+        else:
+            self._compensation += (other._sum - total) + self._sum
+        self._sum = total
+        self._compensation += other._compensation
+
+        self.min = other.min if other.min < self.min else self.min  # type: ignore[operator]
+        self.max = other.max if other.max > self.max else self.max  # type: ignore[operator]
+
+        self.exact = self.exact and other.exact
+        if self.exact:
+            self._int_sum += other._int_sum
+            self._decimal_sum = _EXACT.add(self._decimal_sum, other._decimal_sum)
+        return self
+
+    @property
+    def sum(self) -> float:
+        """Compensated float sum of the values."""
+        return self._sum + self._compensation
+
+    @property
+    def exact_sum(self) -> Optional[Decimal]:
+        """Exact Decimal sum of the values, or None if exact tracking is off."""
+        if not self.exact:
+            return None
+        return _EXACT.add(Decimal(self._int_sum), self._decimal_sum)
+
+    @property
+    def mean(self) -> float:
+        """Arithmetic mean of the values."""
+        if self.count == 0:
+            raise ValueError("No values added")
+        return self.sum / self.count
+
+    @property
+    def variance(self) -> float:
+        """Population variance of the values."""
+        if self.count == 0:
+            raise ValueError("No values added")
+        return self._m2 / self.count
+
+    @property
+    def sample_variance(self) -> float:
+        """Sample variance of the values (n - 1 denominator)."""
+        if self.count < 2:
+            raise ValueError("Sample variance needs at least two values")
+        return self._m2 / (self.count - 1)
+
+    @property
+    def stdev(self) -> float:
+        """Population standard deviation of the values."""
+        return math.sqrt(self.variance)
+
+    def percentage(self, value: Union[int, float], decimal_places: int = 2) -> float:
+        """
+        Calculate value as a percentage of the running sum.
+
+        Args:
+            value: The value
+            decimal_places: Number of decimal places (default: 2)
+
+        Returns:
+            Percentage as float
+
+        Raises:
+            ValueError: If the sum is zero
+        """
+        return percentage(value, self.sum, decimal_places)
+
+    def __repr__(self) -> str:
+        return (
+            f"RunningStats(count={self.count}, sum={self.sum!r}, min={self.min!r}, "
+            f"max={self.max!r})"
+        )
@@ -0,0 +1,182 @@
+"""Tests for streaming batch computation."""
+
+import io
+import json
+import os
+import subprocess
+import sys
+from decimal import Decimal
+from pathlib import Path
+from typing import Iterator, List
+
+import pytest
+
+from package_c.batch import batch_compute, compute_stream, read_pairs, write_rows
+from package_c.math_helpers import divide_precise
+
+SRC_PATH = Path(__file__).parent.parent / "src"
+
+
+class TestReadPairs:
+    """Test suite for read_pairs function."""
+
+    def test_csv_without_header(self) -> None:
+        """Test that the first two fields are used and batches are bounded."""
+        stream = io.StringIO("1,3\n2,7,extra\n\n5,9\n")
+        batches = list(read_pairs(stream, batch_size=2))
+        assert batches == [[("1", "3"), ("2", "7")], [("5", "9")]]
+
+    def test_csv_header_selects_columns(self) -> None:
+        """Test that a header naming the operands picks their columns."""
+        stream = io.StringIO("id,denominator,numerator\na,4,1\nb,8,3\n")
+        assert list(read_pairs(stream)) == [[("1", "4"), ("3", "8")]]
+
+    def test_csv_unnamed_first_row_is_data(self) -> None:
+        """Test that a non-numeric first row is an error unless header is set."""
+        with pytest.raises(ValueError, match="Line 1"):
+            list(read_pairs(io.StringIO("1O,3\n2,7\n")))
+        with pytest.raises(ValueError, match="Line 1"):
+            list(read_pairs(io.StringIO("a,b\n2,7\n")))
+        assert list(read_pairs(io.StringIO("a,b\n2,7\n"), header=True)) == [[("2", "7")]]
+
+    def test_ndjson_keeps_operand_text(self) -> None:
+        """Test objects and arrays, with numbers kept exactly as written."""
+        stream = io.StringIO('{"numerator": 0.10000000000000000001, "denominator": 3}\n[1, 2]\n')
+        assert list(read_pairs(stream, "ndjson")) == [[("0.10000000000000000001", "3"), ("1", "2")]]
+
+    def test_missing_operand(self) -> None:
+        """Test that short rows report their line."""
+        with pytest.raises(ValueError, match="Line 2"):
+            list(read_pairs(io.StringIO("1,2\n3\n")))
+        with pytest.raises(ValueError, match="Line 1"):
+            list(read_pairs(io.StringIO('{"numerator": 1}\n'), "ndjson"))
+
+    def test_unknown_format(self) -> None:
+        """Test that an unknown input format raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown input format"):
+            list(read_pairs(io.StringIO(""), "xml"))
+
+
+class TestBatchCompute:
+    """Test suite for batch_compute function."""
+
+    def test_divide_matches_scalar(self) -> None:
+        """Test that exact division matches divide_precise()."""
+        pairs = [("100", "3"), ("0.1", "0.3"), ("-7", "2")]
+        rows = batch_compute("divide", decimal_places=4)(pairs)
+        expected = [str(divide_precise(Decimal(n), Decimal(d), 4)) for n, d in pairs]
+        assert [row[2] for row in rows] == expected
+        assert [row[:2] for row in rows] == pairs
+
+    def test_percentage(self) -> None:
+        """Test the percentage operation."""
+        assert batch_compute("percentage")([("1", "3")]) == [("1", "3", "33.33")]
+
+    def test_zero_policies(self) -> None:
+        """Test that zero denominators raise or give NaN."""
+        with pytest.raises(ValueError, match="by zero"):
+            batch_compute()([("1", "0")])
+        assert batch_compute(on_zero="nan")([("1", "0.0")]) == [("1", "0.0", "NaN")]
+
+    def test_invalid_operand(self) -> None:
+        """Test that operands that are not numbers raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid operand 'abc'"):
+            batch_compute()([("abc", "2")])
+
+
+class TestWriteRows:
+    """Test suite for write_rows function."""
+
+    ROWS = [("1", "3", "0.33"), ("100", "7", "14.29")]
+
+    def test_fixed_sampled_widths(self) -> None:
+        """Test that sampled widths right-align every column."""
+        out = io.StringIO()
+        assert write_rows([self.ROWS], out) == 2
+        assert out.getvalue().splitlines() == [
+            "numerator  denominator  result",
+            "        1            3    0.33",
+            "      100            7   14.29",
+        ]
+
+    def test_fixed_declared_widths_stream(self) -> None:
+        """Test that declared widths write each batch before the next is computed."""
+        out = io.StringIO()
+        written: List[int] = []
+
+        def batches() -> Iterator[List[tuple]]:
+            for row in self.ROWS:
+                written.append(len(out.getvalue()))
+                yield [row]
+
+        write_rows(batches(), out, widths=[4, 4, 6])
+        assert written[1] > written[0]
+        assert out.getvalue().splitlines()[1:] == ["   1     3    0.33", " 100     7   14.29"]
+
+    def test_fixed_wide_values_not_cut(self) -> None:
+        """Test that values wider than their column are written in full."""
+        out = io.StringIO()
+        write_rows([[("123456", "1", "123456.00")]], out, widths=[3, 3, 3])
+        assert "123456.00" in out.getvalue()
+
+    def test_csv_and_ndjson(self) -> None:
+        """Test the CSV and NDJSON formats."""
+        out = io.StringIO()
+        write_rows([self.ROWS], out, "csv")
+        assert out.getvalue() == "numerator,denominator,result\n1,3,0.33\n100,7,14.29\n"
+        out = io.StringIO()
+        write_rows([self.ROWS], out, "ndjson")
+        first = json.loads(out.getvalue().splitlines()[0])
+        assert first == {"numerator": "1", "denominator": "3", "result": "0.33"}
+
+    def test_wrong_width_count(self) -> None:
+        """Test that widths must cover every column."""
+        with pytest.raises(ValueError, match="column widths"):
+            write_rows([self.ROWS], io.StringIO(), widths=[4, 4])
+
+
+class TestComputeStream:
+    """Test suite for compute_stream and the CLI."""
+
+    def test_end_to_end(self) -> None:
+        """Test NDJSON in, CSV out."""
+        source = io.StringIO('{"numerator": 22, "denominator": 7}\n')
+        out = io.StringIO()
+        assert compute_stream(source, out, "divide", "ndjson", "csv", decimal_places=6) == 1
+        assert out.getvalue().splitlines()[1] == "22,7,3.142857"
+
+    def test_cli_reads_stdin(self) -> None:
+        """Test the compute subcommand without tabulate installed."""
+        env = dict(os.environ, PYTHONPATH=str(SRC_PATH))
+        result = subprocess.run(
+            [sys.executable, "-m", "package_c", "compute", "--format", "csv", "--places", "3"],
+            input=b"numerator,denominator\n1,3\n2,3\n",
+            capture_output=True,
+            env=env,
+            check=True,
+        )
+        assert result.stdout == b"numerator,denominator,result\n1,3,0.333\n2,3,0.667\n"
+
+    def test_cli_header_flag(self) -> None:
+        """Test that --header skips a first row that does not name the operands."""
+        env = dict(os.environ, PYTHONPATH=str(SRC_PATH))
+        result = subprocess.run(
+            [sys.executable, "-m", "package_c", "compute", "--format", "csv", "--header"],
+            input=b"top,bottom\n1,4\n",
+            capture_output=True,
+            env=env,
+            check=True,
+        )
+        assert result.stdout == b"numerator,denominator,result\n1,4,0.25\n"
+
+    def test_cli_reports_errors(self) -> None:
+        """Test that errors exit with status 1 and a message."""
+        env = dict(os.environ, PYTHONPATH=str(SRC_PATH))
+        result = subprocess.run(
+            [sys.executable, "-m", "package_c", "compute"],
+            input=b"1,0\n",
+            capture_output=True,
+            env=env,
+        )
+        assert result.returncode == 1
+        assert b"ERROR: Cannot divide 1 by zero" in result.stderr
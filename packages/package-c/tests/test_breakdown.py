@@ -0,0 +1,160 @@
+"""Tests for grouped percentage breakdowns."""
+
+import random
+from decimal import Decimal
+
+import pytest
+
+from package_c.breakdown import percentage_breakdown
+
+
+class TestPercentageBreakdown:
+    """Test suite for percentage_breakdown function."""
+
+    def test_pairs(self) -> None:
+        """Test shares of (category, value) pairs, summed per category."""
+        rows = [("a", 1), ("b", 2), ("a", 1)]
+        assert percentage_breakdown(rows) == {"a": Decimal("50.00"), "b": Decimal("50.00")}
+
+    def test_shares_sum_to_exactly_100(self) -> None:
+        """Test largest-remainder rounding of thirds."""
+        shares = percentage_breakdown([("a", 1), ("b", 1), ("c", 1)])
+        assert shares == {"a": Decimal("33.34"), "b": Decimal("33.33"), "c": Decimal("33.33")}
+        assert sum(shares.values()) == Decimal("100.00")
+
+    def test_largest_remainder_wins(self) -> None:
+        """Test the leftover unit goes to the largest remainder, not the first key."""
+        shares = percentage_breakdown([("a", 1), ("b", 2)], decimal_places=0)
+        assert shares == {"a": Decimal("33"), "b": Decimal("67")}
+
+    def test_random_groups_sum_to_100(self) -> None:
+        """Test every group sums to 100 for random float data."""
+        rng = random.Random(7)
+        rows = [((rng.randrange(5), rng.randrange(7)), rng.uniform(0, 50)) for _ in range(500)]
+        result = percentage_breakdown(rows, by=lambda key: key[0], decimal_places=3)
+        assert len(result) == 5
+        for shares in result.values():
+            assert sum(shares.values()) == Decimal("100.000")
+
+    def test_decimal_and_float_values(self) -> None:
+        """Test floats are summed exactly through their repr."""
+        shares = percentage_breakdown([("a", 0.1), ("a", 0.2), ("b", Decimal("0.7"))])
+        assert shares == {"a": Decimal("30.00"), "b": Decimal("70.00")}
+
+    def test_grouped_columns(self) -> None:
+        """Test columnar input grouped by a column, keys in order of appearance."""
+        columns = {
+            "region": ["eu", "us", "eu", "us"],
+            "category": ["x", "x", "y", "y"],
+            "value": [1, 3, 3, 1],
+        }
+        assert percentage_breakdown(columns, by="region") == {
+            "eu": {"x": Decimal("25.00"), "y": Decimal("75.00")},
+            "us": {"x": Decimal("75.00"), "y": Decimal("25.00")},
+        }
+
+    def test_numpy_columns_match_rows(self) -> None:
+        """Test vectorized columns give the same result as the row path."""
+        np = pytest.importorskip("numpy")
+        rng = np.random.default_rng(3)
+        groups = rng.choice(["n", "s", "e"], 1000)
+        keys = rng.integers(0, 9, 1000)
+        for values in (rng.integers(0, 10**6, 1000), rng.integers(0, 2**62, 1000)):
+            columns = {"g": groups, "k": keys, "v": values}
+            rows = percentage_breakdown(
+                zip(zip(groups.tolist(), keys.tolist()), values.tolist()), by=lambda key: key[0]
+            )
+            expected = {
+                group: {key: share for (_, key), share in shares.items()}
+                for group, shares in rows.items()
+            }
+            result = percentage_breakdown(columns, by="g", category="k", value="v")
+            assert result == expected
+            assert list(result) == list(expected)
+
+    def test_numpy_float_columns(self) -> None:
+        """Test float columns sum to 100 per group."""
+        np = pytest.importorskip("numpy")
+        values = np.array([0.1, 0.2, 0.3, 1e-3])
+        shares = percentage_breakdown({"category": np.array(["a", "b", "a", "b"]), "value": values})
+        assert shares == {"a": Decimal("66.56"), "b": Decimal("33.44")}
+
+    def test_numpy_float_columns_match_rows_on_ties(self) -> None:
+        """Test float columns sum and break ties exactly like rows."""
+        np = pytest.importorskip("numpy")
+        keys = ["c", "a", "b", "a", "b", "a"]
+        values = [0.6, 0.5, 0.2, 0.9, 0.4, 0.9]
+        rows = percentage_breakdown(zip(keys, values), decimal_places=4)
+        columns = {"category": np.array(keys), "value": np.array(values)}
+        result = percentage_breakdown(columns, decimal_places=4)
+        assert rows == {"c": Decimal("17.1429"), "a": Decimal("65.7143"), "b": Decimal("17.1428")}
+        assert result == rows
+        assert list(result) == list(rows)
+
+        rng = np.random.default_rng(5)
+        keys = rng.choice(["x", "y", "z", "w"], 300).tolist()
+        values = rng.choice([0.1, 0.2, 0.3, 0.7], 300).tolist()
+        for places in (0, 2, 5):
+            rows = percentage_breakdown(zip(keys, values), decimal_places=places)
+            columns = {"category": np.array(keys), "value": np.array(values)}
+            assert percentage_breakdown(columns, decimal_places=places) == rows
+
+    def test_numpy_float_columns_match_rows_for_any_dtype(self) -> None:
+        """Test float32 and many-digit float64 columns give the row path's shares."""
+        np = pytest.importorskip("numpy")
+        rng = np.random.default_rng(11)
+        keys = rng.choice(["x", "y", "z"], 200)
+        cases = [
+            rng.uniform(0, 10, 200),
+            rng.uniform(0, 10, 200).round(3),
+            rng.uniform(0, 10, 200).astype(np.float32),
+            np.array([1e300, 2.5e299, 1e-300, 7.0] * 50),
+        ]
+        for values in cases:
+            rows = percentage_breakdown(zip(keys.tolist(), list(values)), decimal_places=6)
+            columns = {"category": keys, "value": values}
+            assert percentage_breakdown(columns, decimal_places=6) == rows
+
+    def test_numpy_float64_columns_stay_vectorized(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test float64 columns with short reprs are summed without converting each value."""
+        np = pytest.importorskip("numpy")
+        from package_c import breakdown
+
+        monkeypatch.setattr(breakdown, "_to_decimal", None)
+        values = np.array([0.6, 0.5, 0.2, 0.9, 0.4, 0.9] * 1000)
+        keys = np.array(["c", "a", "b", "a", "b", "a"] * 1000)
+        shares = percentage_breakdown({"category": keys, "value": values}, decimal_places=4)
+        assert shares == {"c": Decimal("17.1429"), "a": Decimal("65.7143"), "b": Decimal("17.1428")}
+
+    def test_non_finite_values(self) -> None:
+        """Test NaN and infinite values raise ValueError on both paths."""
+        for bad in (float("nan"), float("inf"), Decimal("-Infinity"), Decimal("NaN")):
+            with pytest.raises(ValueError, match="finite"):
+                percentage_breakdown([("a", 1), ("b", bad)])
+        np = pytest.importorskip("numpy")
+        for bad in (np.nan, np.inf):
+            with pytest.raises(ValueError, match="finite"):
+                percentage_breakdown(
+                    {"category": np.array(["a", "b"]), "value": np.array([1, bad])}
+                )
+
+    def test_empty(self) -> None:
+        """Test empty input gives an empty breakdown."""
+        assert percentage_breakdown([]) == {}
+
+    def test_zero_total(self) -> None:
+        """Test a group with a zero total raises ValueError."""
+        with pytest.raises(ValueError, match="Total cannot be zero"):
+            percentage_breakdown([("a", 0), ("b", 0.0)])
+
+    def test_negative_value(self) -> None:
+        """Test negative sums raise ValueError."""
+        with pytest.raises(ValueError, match="negative"):
+            percentage_breakdown([("a", 5), ("b", -1)])
+
+    def test_by_type_mismatch(self) -> None:
+        """Test a column name for rows and a function for columns raise TypeError."""
+        with pytest.raises(TypeError):
+            percentage_breakdown([("a", 1)], by="region")
+        with pytest.raises(TypeError):
+            percentage_breakdown({"category": ["a"], "value": [1]}, by=len)
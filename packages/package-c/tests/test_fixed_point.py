@@ -0,0 +1,153 @@
+"""Tests for fixed-point arithmetic."""
+
+from decimal import ROUND_HALF_EVEN, Context, Decimal
+
+import pytest
+
+from package_c.fixed_point import (
+    ROUNDING_MODES,
+    FixedPoint,
+    divide,
+    divide_many,
+    fixed_sum,
+    percentage,
+    round_division,
+)
+from package_c.math_helpers import divide_precise
+
+PAIRS = [(10, 3), (-10, 3), (10, -3), (1, 8), (3, 8), (-5, 8), (22, 7), (123456789, 1000)]
+
+
+def _quantized(numerator: int, denominator: int, places: int, rounding: str) -> Decimal:
+    context = Context(prec=60)
+    quotient = context.divide(Decimal(numerator), Decimal(denominator))
+    return quotient.quantize(Decimal(1).scaleb(-places), rounding=rounding, context=context)
+
+
+class TestRoundDivision:
+    """Test suite for round_division and divide."""
+
+    def test_every_mode_matches_quantize(self) -> None:
+        """Test each rounding mode against Decimal.quantize."""
+        for rounding in ROUNDING_MODES:
+            for numerator, denominator in PAIRS:
+                for places in [0, 2, 4]:
+                    expected = _quantized(numerator, denominator, places, rounding)
+                    result = divide(numerator, denominator, places, rounding).to_decimal()
+                    assert result == expected
+                    assert result.as_tuple().exponent == expected.as_tuple().exponent
+
+    def test_default_matches_divide_precise(self) -> None:
+        """Test that the default rounding gives divide_precise() results."""
+        for numerator, denominator in PAIRS:
+            for places in range(7):
+                result = divide(numerator, denominator, places).to_decimal()
+                assert str(result) == str(divide_precise(numerator, denominator, places))
+
+    def test_unknown_rounding(self) -> None:
+        """Test that unknown rounding modes are rejected."""
+        with pytest.raises(ValueError):
+            round_division(7, 2, "ROUND_SIDEWAYS")
+        with pytest.raises(ValueError):
+            round_division(8, 2, "ROUND_SIDEWAYS")
+
+    def test_zero_denominator(self) -> None:
+        """Test that dividing by zero raises ValueError."""
+        with pytest.raises(ValueError, match="Cannot divide by zero"):
+            divide(1, 0)
+        with pytest.raises(ValueError, match="Total cannot be zero"):
+            percentage(1, FixedPoint(0, 2))
+
+
+class TestFixedPoint:
+    """Test suite for the FixedPoint type."""
+
+    def test_str_and_decimal(self) -> None:
+        """Test formatting and Decimal conversion."""
+        assert str(FixedPoint(12345, 2)) == "123.45"
+        assert str(FixedPoint(-5, 3)) == "-0.005"
+        assert str(FixedPoint(7, 0)) == "7"
+        assert FixedPoint(12345, 2).to_decimal() == Decimal("123.45")
+
+    def test_from_value(self) -> None:
+        """Test conversion from int, float and Decimal."""
+        assert FixedPoint.from_value(3, 2) == FixedPoint(300, 2)
+        assert FixedPoint.from_value(0.125, 2) == FixedPoint(12, 2)
+        assert FixedPoint.from_value(Decimal("-1.005"), 2, "ROUND_HALF_UP") == FixedPoint(-101, 2)
+
+    def test_arithmetic_aligns_scales(self) -> None:
+        """Test exact addition, subtraction and comparison across scales."""
+        a = FixedPoint(150, 2)
+        b = FixedPoint(2505, 3)
+        assert a + b == FixedPoint(4005, 3)
+        assert b - a == FixedPoint(1005, 3)
+        assert 1 - a == FixedPoint(-50, 2)
+        assert a * 3 == FixedPoint(450, 2)
+        assert a < b and b >= a and a == FixedPoint(15, 1)
+        assert hash(a) == hash(FixedPoint(15, 1))
+
+    def test_divide_fixed_point(self) -> None:
+        """Test dividing by another FixedPoint rounds once."""
+        result = FixedPoint(1000, 2).divide(FixedPoint(300, 2), scale=4)
+        assert result == FixedPoint(33333, 4)
+
+    def test_percentage(self) -> None:
+        """Test fixed-point percentages."""
+        assert str(percentage(1, 3)) == "33.33"
+        assert str(percentage(FixedPoint(5, 1), 2, scale=1)) == "25.0"
+
+    def test_fixed_sum(self) -> None:
+        """Test exact sums of mixed scales."""
+        values = [FixedPoint(1, 2), FixedPoint(5, 3), FixedPoint(7, 0)]
+        assert fixed_sum(values) == FixedPoint(7015, 3)
+        assert fixed_sum(values, scale=2) == FixedPoint(702, 2)
+        assert fixed_sum([]) == FixedPoint(0, 0)
+
+    def test_negative_scale(self) -> None:
+        """Test that a negative scale is rejected."""
+        with pytest.raises(ValueError):
+            FixedPoint(1, -1)
+
+
+class TestDivideMany:
+    """Test suite for divide_many function."""
+
+    def test_sequences_match_scalar(self) -> None:
+        """Test that list results equal divide() element by element."""
+        numerators = [a for a, _ in PAIRS]
+        denominators = [b for _, b in PAIRS]
+        for rounding in ROUNDING_MODES:
+            expected = [divide(a, b, 3, rounding).value for a, b in PAIRS]
+            assert divide_many(numerators, denominators, 3, rounding) == expected
+
+    def test_numpy_matches_sequences(self) -> None:
+        """Test that the vectorized path equals the sequence path in every mode."""
+        np = pytest.importorskip("numpy")
+        rng = np.random.default_rng(0)
+        numerators = rng.integers(-(10**9), 10**9, 5000)
+        denominators = rng.integers(1, 10**5, 5000) * rng.choice([-1, 1], 5000)
+        for rounding in ROUNDING_MODES:
+            result = divide_many(numerators, denominators, 2, rounding)
+            expected = divide_many(numerators.tolist(), denominators.tolist(), 2, rounding)
+            assert result.tolist() == expected
+
+    def test_numpy_overflow_uses_python_ints(self) -> None:
+        """Test that results beyond int64 are still exact."""
+        np = pytest.importorskip("numpy")
+        result = divide_many(np.array([10**18]), np.array([3]), 4, ROUND_HALF_EVEN)
+        assert result.tolist() == [3333333333333333333333]
+
+    def test_zero_denominator(self) -> None:
+        """Test that any zero denominator raises ValueError."""
+        with pytest.raises(ValueError):
+            divide_many([1, 2], [1, 0])
+
+    def test_non_integer_operands(self) -> None:
+        """Test that float operands raise TypeError instead of being truncated."""
+        np = pytest.importorskip("numpy")
+        with pytest.raises(TypeError):
+            divide_many(np.array([1.5, 2.5]), np.array([1, 1]), 0)
+        with pytest.raises(TypeError):
+            divide_many(np.array([1, 2]), np.array([0.5, 1.0]), 0)
+        with pytest.raises(TypeError):
+            divide_many([1.5], [1], 0)
@@ -1,8 +1,15 @@
 """Tests for math helpers."""
 
+from decimal import Decimal, localcontext
+
 import pytest
 
-from package_c.math_helpers import divide_precise, percentage
+from package_c.math_helpers import (
+    divide_precise,
+    divide_precise_array,
+    percentage,
+    percentage_array,
+)
 
 
 class TestDividePrecise:
@@ -33,6 +40,36 @@ class TestDividePrecise:
         with pytest.raises(ValueError, match="Cannot divide by zero"):
             divide_precise(10, 0)
 
+    def test_divide_precise_rounds_half_even(self) -> None:
+        """Test that exact halves round to the even neighbour."""
+        assert str(divide_precise(1, 8)) == "0.12"
+        assert str(divide_precise(3, 8)) == "0.38"
+        assert str(divide_precise(-1, 8)) == "-0.12"
+
+    def test_divide_precise_int_path_matches_decimal(self) -> None:
+        """Test that integer inputs give the same result as Decimal inputs."""
+        for numerator, denominator in [(10, 3), (-10, 3), (10, -3), (0, -5), (22, 7), (1, 1000)]:
+            for places in range(0, 8):
+                expected = divide_precise(Decimal(numerator), Decimal(denominator), places)
+                result = divide_precise(numerator, denominator, places)
+                assert str(result) == str(expected)
+
+    def test_divide_precise_negative_precision(self) -> None:
+        """Test that negative decimal places behave like zero."""
+        assert str(divide_precise(10, 3, decimal_places=-2)) == "3"
+        assert str(divide_precise(10.0, 3, decimal_places=-2)) == "3"
+
+    def test_divide_precise_float_uses_repr(self) -> None:
+        """Test that floats are converted through their shortest repr."""
+        assert str(divide_precise(0.1, 1, decimal_places=20)) == "0.10000000000000000000"
+
+    def test_divide_precise_ignores_thread_context(self) -> None:
+        """Test that a low-precision caller context does not affect results."""
+        with localcontext() as ctx:
+            ctx.prec = 3
+            assert str(divide_precise(100000, 3)) == "33333.33"
+            assert str(divide_precise(100000.0, 3)) == "33333.33"
+
 
 class TestPercentage:
     """Test suite for percentage function."""
@@ -66,3 +103,78 @@ class TestPercentage:
         """Test percentage when value is zero."""
         result = percentage(0, 100)
         assert result == 0.0
+
+
+class TestArrayMath:
+    """Test suite for divide_precise_array and percentage_array."""
+
+    NUMERATORS = [10, -10, 1, 3, 0, 22, 123456789, -7]
+    DENOMINATORS = [3, 3, 8, 8, -5, 7, 1000, 16]
+
+    def test_exact_matches_scalar(self) -> None:
+        """Test that exact results equal divide_precise() element by element."""
+        np = pytest.importorskip("numpy")
+        for places in [-1, 0, 2, 6]:
+            result = divide_precise_array(
+                np.array(self.NUMERATORS), np.array(self.DENOMINATORS), places
+            )
+            expected = [
+                divide_precise(a, b, places) for a, b in zip(self.NUMERATORS, self.DENOMINATORS)
+            ]
+            assert [str(value) for value in result] == [str(value) for value in expected]
+
+    def test_exact_float_and_big_int_inputs(self) -> None:
+        """Test the per-element and Python-int paths against the scalar function."""
+        pytest.importorskip("numpy")
+        floats = [0.1, 2.5, -1.75, 1e-3]
+        assert [str(v) for v in divide_precise_array(floats, 3, 4)] == [
+            str(divide_precise(f, 3, 4)) for f in floats
+        ]
+        big = [10**25, -(10**20) + 1]
+        assert [str(v) for v in divide_precise_array(big, [3, 7], 10)] == [
+            str(divide_precise(b, d, 10)) for b, d in zip(big, [3, 7])
+        ]
+
+    def test_float_mode_matches_percentage(self) -> None:
+        """Test that float percentages equal percentage() element by element."""
+        np = pytest.importorskip("numpy")
+        rng = np.random.default_rng(0)
+        values = rng.integers(0, 10**6, 20000)
+        totals = rng.integers(1, 10**6, 20000)
+        for places in [0, 2, 4]:
+            result = percentage_array(values, totals, places)
+            expected = [percentage(v, t, places) for v, t in zip(values.tolist(), totals.tolist())]
+            assert result.tolist() == expected
+
+    def test_exact_percentage(self) -> None:
+        """Test exact percentages as Decimal."""
+        pytest.importorskip("numpy")
+        result = percentage_array([1, 2], [3, 8], mode="exact")
+        assert [str(value) for value in result] == ["33.33", "25.00"]
+
+    def test_zero_raise_reports_all(self) -> None:
+        """Test that the error names the count and the first zero."""
+        pytest.importorskip("numpy")
+        message = r"Cannot divide by zero: 2 zero value\(s\), first at index 1"
+        with pytest.raises(ValueError, match=message):
+            divide_precise_array([1, 2, 3], [1, 0, 0])
+        with pytest.raises(ValueError, match="Total cannot be zero"):
+            percentage_array([1], [0])
+
+    def test_zero_nan_and_mask(self) -> None:
+        """Test the nan and mask zero policies."""
+        np = pytest.importorskip("numpy")
+        exact = divide_precise_array([1, 2, 3], [1, 0, 2], on_zero="nan")
+        assert str(exact[0]) == "1.00" and exact[1].is_nan() and str(exact[2]) == "1.50"
+        floats = percentage_array([1, 2, 3], [4, 0, 4], on_zero="nan")
+        assert floats[0] == 25.0 and np.isnan(floats[1])
+        masked = percentage_array([1, 2, 3], [4, 0, 4], on_zero="mask")
+        assert masked.mask.tolist() == [False, True, False]
+        assert masked.compressed().tolist() == [25.0, 75.0]
+
+    def test_unknown_mode(self) -> None:
+        """Test that unknown modes and policies are rejected."""
+        with pytest.raises(ValueError):
+            divide_precise_array([1], [1], mode="approximate")
+        with pytest.raises(ValueError):
+            divide_precise_array([1], [1], on_zero="ignore")
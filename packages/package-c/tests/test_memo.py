@@ -0,0 +1,113 @@
+"""Tests for memoized division."""
+
+import threading
+from decimal import Decimal
+
+import pytest
+
+from package_c.math_helpers import divide_precise, percentage
+from package_c.memo import CacheInfo, DivisionCache
+
+
+class TestDivisionCache:
+    """Test suite for DivisionCache."""
+
+    def test_matches_uncached(self) -> None:
+        """Test cached results equal the plain functions."""
+        cache = DivisionCache()
+        for args in [(10, 3, 2), (1.5, 0.7, 4), (Decimal("-7"), 2, 0)]:
+            for _ in range(2):
+                assert cache.divide_precise(*args) == divide_precise(*args)
+                assert cache.percentage(*args) == percentage(*args)  # type: ignore[arg-type]
+
+    def test_equal_values_share_an_entry(self) -> None:
+        """Test 10, 10.0 and Decimal("10") hit the same entry."""
+        cache = DivisionCache()
+        results = {cache.divide_precise(n, 3) for n in (10, 10.0, Decimal("10"), Decimal("10.00"))}
+        assert results == {Decimal("3.33")}
+        assert cache.divide_precise(0.5, 3) == cache.divide_precise(Decimal("0.5"), 3)
+        assert cache.cache_info() == CacheInfo(hits=4, misses=2, maxsize=4096, currsize=2)
+
+    def test_percentage_keeps_result_type(self) -> None:
+        """Test Decimal and int percentages of equal values do not share an entry."""
+        cache = DivisionCache()
+        for _ in range(2):
+            decimal_share = cache.percentage(Decimal("10"), 3)  # type: ignore[arg-type]
+            assert decimal_share == Decimal("333.33")
+            assert isinstance(decimal_share, Decimal)
+            share = cache.percentage(10, 3)
+            assert share == percentage(10, 3)
+            assert type(share) is float
+        assert cache.cache_info().misses == 2
+
+    def test_negative_zero_keeps_its_sign(self) -> None:
+        """Test -0.0 is not served the cached result for 0."""
+        cache = DivisionCache()
+        assert str(cache.divide_precise(0, 5)) == "0.00"
+        assert str(cache.divide_precise(-0.0, 5)) == "-0.00"
+        assert cache.percentage(0, 5) == 0.0
+        assert str(cache.percentage(-0.0, 5)) == "-0.0"
+
+    def test_lru_eviction(self) -> None:
+        """Test the least recently used entry is evicted first."""
+        cache = DivisionCache(maxsize=2)
+        cache.divide_precise(1, 2)
+        cache.divide_precise(1, 3)
+        cache.divide_precise(1, 2)
+        cache.divide_precise(1, 4)
+        cache.divide_precise(1, 2)
+        assert cache.cache_info() == CacheInfo(hits=2, misses=3, maxsize=2, currsize=2)
+        cache.divide_precise(1, 3)
+        assert cache.cache_info().misses == 4
+
+    def test_errors_are_not_cached(self) -> None:
+        """Test division by zero raises every time."""
+        cache = DivisionCache()
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Cannot divide by zero"):
+                cache.divide_precise(1, 0)
+        assert cache.cache_info().currsize == 0
+
+    def test_cache_clear(self) -> None:
+        """Test clearing drops entries and statistics."""
+        cache = DivisionCache()
+        cache.percentage(1, 3)
+        cache.percentage(1, 3)
+        cache.cache_clear()
+        assert cache.cache_info() == CacheInfo(hits=0, misses=0, maxsize=4096, currsize=0)
+
+    def test_invalid_maxsize(self) -> None:
+        """Test maxsize below 1 raises ValueError."""
+        with pytest.raises(ValueError):
+            DivisionCache(maxsize=0)
+
+    def test_shared_between_threads(self) -> None:
+        """Test concurrent callers get correct results and consistent counters."""
+        cache = DivisionCache(maxsize=50)
+        errors = []
+
+        def work(offset: int) -> None:
+            for i in range(2000):
+                numerator = (i + offset) % 120
+                if cache.divide_precise(numerator, 7, 3) != divide_precise(numerator, 7, 3):
+                    errors.append(numerator)
+
+        threads = [threading.Thread(target=work, args=(offset,)) for offset in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        info = cache.cache_info()
+        assert not errors
+        assert info.hits + info.misses == 8000
+        assert info.currsize <= 50
+
+    def test_keys_follow_divide_precise_semantics(self) -> None:
+        """Test values equal as numbers but divided differently get separate entries."""
+        cache = DivisionCache()
+        exact_tenth = Decimal(0.1)
+        assert cache.divide_precise(0.1, 1, 20) == Decimal("0.10000000000000000000")
+        assert cache.divide_precise(exact_tenth, 1, 20) == divide_precise(exact_tenth, 1, 20)
+        assert cache.divide_precise(2.0**60, 1, 0) == divide_precise(2.0**60, 1, 0)
+        assert cache.divide_precise(2**60, 1, 0) == Decimal(2**60)
+        assert cache.cache_info().hits == 0
@@ -0,0 +1,108 @@
+"""Tests for the quantile sketch."""
+
+import random
+from typing import List
+
+import pytest
+
+from package_c.sketch import DDSketch
+
+
+def _latencies(size: int = 20000) -> List[float]:
+    rng = random.Random(7)
+    return [rng.lognormvariate(3, 1.5) for _ in range(size)]
+
+
+def _true_quantile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+class TestDDSketch:
+    """Test suite for DDSketch."""
+
+    QUANTILES = [0.01, 0.25, 0.5, 0.9, 0.99, 0.999]
+
+    def test_relative_accuracy(self) -> None:
+        """Test that quantiles are within the relative accuracy."""
+        values = _latencies()
+        sketch = DDSketch(relative_accuracy=0.01)
+        sketch.add_many(values)
+        for q, estimate in zip(self.QUANTILES, sketch.quantiles(self.QUANTILES)):
+            expected = _true_quantile(values, q)
+            assert abs(estimate - expected) <= 0.01 * expected
+
+    def test_extremes_are_exact(self) -> None:
+        """Test that the 0 and 1 quantiles are the exact min and max."""
+        values = _latencies(1000)
+        sketch = DDSketch()
+        sketch.add_many(values)
+        assert sketch.quantile(0) == min(values)
+        assert sketch.quantile(1) == max(values)
+        assert sketch.count == 1000
+
+    def test_negative_and_zero_values(self) -> None:
+        """Test values on both sides of zero."""
+        sketch = DDSketch()
+        sketch.add_many([-100.0, -10.0, 0.0, 0.0, 10.0, 100.0, 1000.0])
+        assert sketch.quantile(0.5) == 0.0
+        assert sketch.quantile(1 / 6) == pytest.approx(-10.0, rel=0.01)
+        assert sketch.quantile(5 / 6) == pytest.approx(100.0, rel=0.01)
+
+    def test_merge_equals_single_sketch(self) -> None:
+        """Test that merging partial sketches gives the same quantiles."""
+        values = _latencies()
+        whole = DDSketch()
+        whole.add_many(values)
+        left, right = DDSketch(), DDSketch()
+        left.add_many(values[:7000])
+        right.add_many(values[7000:])
+        merged = left.merge(right)
+        assert merged.count == whole.count
+        assert merged.quantiles(self.QUANTILES) == whole.quantiles(self.QUANTILES)
+
+    def test_merge_rejects_different_accuracy(self) -> None:
+        """Test that sketches with different parameters cannot be merged."""
+        with pytest.raises(ValueError):
+            DDSketch(0.01).merge(DDSketch(0.02))
+
+    def test_serialization_round_trip(self) -> None:
+        """Test to_bytes and from_bytes."""
+        sketch = DDSketch()
+        sketch.add_many(_latencies(5000) + [-3.0, 0.0])
+        restored = DDSketch.from_bytes(sketch.to_bytes())
+        assert restored.count == sketch.count
+        assert restored.quantiles(self.QUANTILES) == sketch.quantiles(self.QUANTILES)
+        with pytest.raises(ValueError):
+            DDSketch.from_bytes(b"not a sketch")
+
+    def test_memory_is_bounded(self) -> None:
+        """Test that the bin count never exceeds max_bins per sign."""
+        sketch = DDSketch(relative_accuracy=0.01, max_bins=64)
+        values = [1.01**i for i in range(2000)]
+        sketch.add_many(values)
+        assert len(sketch._positive) <= 64
+        # Collapsing merges the lowest bins; high quantiles keep their accuracy
+        assert sketch.quantile(0.99) == pytest.approx(_true_quantile(values, 0.99), rel=0.01)
+
+    def test_numpy_matches_scalar_ingest(self) -> None:
+        """Test that the vectorized path bins values like add()."""
+        np = pytest.importorskip("numpy")
+        values = _latencies()
+        by_value = DDSketch()
+        for value in values:
+            by_value.add(value)
+        by_array = DDSketch()
+        by_array.add_many(np.array(values))
+        assert by_array.quantiles(self.QUANTILES) == by_value.quantiles(self.QUANTILES)
+
+    def test_invalid_input(self) -> None:
+        """Test errors for non-finite values, empty sketches and bad quantiles."""
+        sketch = DDSketch()
+        with pytest.raises(ValueError):
+            sketch.quantile(0.5)
+        with pytest.raises(ValueError):
+            sketch.add(float("nan"))
+        sketch.add(1.0)
+        with pytest.raises(ValueError):
+            sketch.quantile(1.5)
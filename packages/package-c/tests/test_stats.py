@@ -0,0 +1,107 @@
+"""Tests for streaming statistics."""
+
+import math
+import pickle
+import random
+import statistics
+from decimal import Decimal
+from typing import List
+
+import pytest
+
+from package_c.stats import RunningStats
+
+
+def _sample(size: int = 2000) -> List[float]:
+    rng = random.Random(42)
+    return [rng.uniform(-1000, 1000) for _ in range(size)]
+
+
+class TestRunningStats:
+    """Test suite for RunningStats."""
+
+    def test_matches_statistics_module(self) -> None:
+        """Test count, mean, variance, min and max against the statistics module."""
+        data = _sample()
+        stats = RunningStats()
+        stats.update(data)
+        assert stats.count == len(data)
+        assert stats.mean == pytest.approx(statistics.fmean(data))
+        assert stats.variance == pytest.approx(statistics.pvariance(data))
+        assert stats.sample_variance == pytest.approx(statistics.variance(data))
+        assert stats.stdev == pytest.approx(statistics.pstdev(data))
+        assert stats.min == min(data) and stats.max == max(data)
+
+    def test_compensated_sum(self) -> None:
+        """Test that the float sum survives cancellation like math.fsum."""
+        data = [1e16, 1.0, -1e16] * 100 + [0.1] * 10
+        stats = RunningStats()
+        stats.update(data)
+        assert stats.sum == math.fsum(data)
+        assert sum(data) != math.fsum(data)
+
+    def test_exact_sum(self) -> None:
+        """Test the exact Decimal sum of ints and floats."""
+        stats = RunningStats()
+        stats.update([0.1] * 10 + [10**30, -(10**30), 2])
+        assert stats.exact_sum == Decimal("3.0")
+
+    def test_exact_tracking_disabled(self) -> None:
+        """Test that exact=False skips the Decimal sum."""
+        stats = RunningStats(exact=False)
+        stats.add(1.5)
+        assert stats.exact_sum is None
+
+    def test_merge_equals_single_pass(self) -> None:
+        """Test that merged partial results equal one pass over all values."""
+        data = _sample()
+        whole = RunningStats()
+        whole.update(data)
+        parts = [RunningStats() for _ in range(3)]
+        for i, value in enumerate(data):
+            parts[i % 3].add(value)
+        merged = RunningStats()
+        for part in parts:
+            merged.merge(pickle.loads(pickle.dumps(part)))
+        assert merged.count == whole.count
+        assert merged.exact_sum == whole.exact_sum
+        assert merged.sum == pytest.approx(whole.sum, abs=1e-9)
+        assert merged.variance == pytest.approx(whole.variance)
+        assert (merged.min, merged.max) == (whole.min, whole.max)
+
+    def test_merge_drops_exact_if_either_lacks_it(self) -> None:
+        """Test that exact tracking survives a merge only if both sides had it."""
+        exact = RunningStats()
+        exact.add(1)
+        approximate = RunningStats(exact=False)
+        approximate.add(2)
+        assert exact.merge(approximate).exact_sum is None
+
+    def test_numpy_update(self) -> None:
+        """Test that array updates match element-by-element updates."""
+        np = pytest.importorskip("numpy")
+        data = _sample()
+        by_element = RunningStats()
+        by_element.update(data)
+        by_array = RunningStats()
+        by_array.update(np.array(data))
+        assert by_array.exact_sum == by_element.exact_sum
+        assert by_array.mean == pytest.approx(by_element.mean)
+        assert by_array.variance == pytest.approx(by_element.variance)
+        ints = RunningStats()
+        ints.update(np.arange(10))
+        assert ints.exact_sum == 45 and ints.max == 9
+
+    def test_empty(self) -> None:
+        """Test that statistics of no values raise ValueError."""
+        stats = RunningStats()
+        with pytest.raises(ValueError):
+            stats.mean
+        with pytest.raises(ValueError):
+            stats.sample_variance
+
+    def test_percentage_of_running_sum(self) -> None:
+        """Test percentages against the running total."""
+        stats = RunningStats()
+        stats.update([10, 20, 70])
+        assert stats.percentage(20) == 20.0